@@ -3,6 +3,33 @@ class OnnuriMapApp {
     constructor() {
         this.currentLocation = null;
         this.storeData = null;
+        this.manifest = null;
+        this.dataBaseUrl = CONFIG.MANIFEST_URL.substring(0, CONFIG.MANIFEST_URL.lastIndexOf('/') + 1);
+
+        // 데이터 파일 경로 (manifest.json이 있으면 해시 파일명으로 교체)
+        this.dataUrls = {
+            stores: CONFIG.DATA_URL,
+            binary: CONFIG.BINARY_DATA_URL,
+            clusters: CONFIG.CLUSTER_URL,
+            facets: CONFIG.FACET_URL,
+            places: CONFIG.PLACE_URL
+        };
+
+        // 격자 셀별 업종/유형 개수 (가맹점 데이터보다 먼저 로드)
+        this.facetGrid = null;
+
+        // 주소 검색용 장소 자동완성 인덱스 (없으면 카카오 API만 사용)
+        this.placeIndex = null;
+
+        // 상세 Dialog에 표시 중인 가맹점 ID (주변 가맹점 응답 확인용)
+        this.dialogStoreId = null;
+
+        // 필터 조건 (필터링은 Worker에서 처리)
+        this.filters = {
+            radius: CONFIG.RADIUS.SMALL,
+            category: 'all',
+            types: ['card', 'paper', 'mobile']
+        };
     }
 
     /**
@@ -24,17 +51,17 @@ class OnnuriMapApp {
     }
 
     /**
-     * 가맹점 데이터 로드
+     * 가맹점 데이터 로드 (다운로드/파싱은 Worker에서 처리)
      */
     async loadStoreData() {
-        try {
-            const response = await fetch(CONFIG.DATA_URL);
-            if (!response.ok) {
-                throw new Error('데이터 로드 실패');
-            }
+        await this.loadManifest();
+
+        // 개수 표시는 가맹점 데이터를 기다리지 않음
+        const facetsLoaded = this.loadFacetGrid();
+        const placesLoaded = this.loadPlaceIndex();
 
-            this.storeData = await response.json();
-            filterManager.setStores(this.storeData.stores);
+        try {
+            this.storeData = await storeClient.load(this.manifest, this.dataBaseUrl, this.dataUrls);
 
             // UI 업데이트
             this.updateInfoBar();
@@ -44,12 +71,96 @@ class OnnuriMapApp {
             console.error('데이터 로드 에러:', error);
             this.showError('가맹점 데이터를 불러올 수 없습니다. 페이지를 새로고침해주세요.');
         }
+
+        await Promise.all([facetsLoaded, placesLoaded, this.loadClusterPyramid()]);
+    }
+
+    /**
+     * 데이터 manifest 로드
+     * 해시 파일명은 내용이 바뀌면 이름도 바뀌므로 manifest만 재검증하면 됨
+     */
+    async loadManifest() {
+        try {
+            const response = await fetch(CONFIG.MANIFEST_URL, { cache: 'no-cache' });
+            if (!response.ok) {
+                return;
+            }
+
+            this.manifest = await response.json();
+            Object.entries(this.manifest.files || {}).forEach(([key, filename]) => {
+                this.dataUrls[key] = this.dataBaseUrl + filename;
+            });
+        } catch (error) {
+            // manifest가 없으면 CONFIG 경로 사용
+            console.warn('manifest 로드 실패:', error);
+        }
+    }
+
+    /**
+     * 줌 레벨별 사전 집계 클러스터 로드 (선택사항)
+     */
+    async loadClusterPyramid() {
+        try {
+            const response = await fetch(this.dataUrls.clusters);
+            if (!response.ok) {
+                return;
+            }
+
+            mapManager.setClusterPyramid(await response.json());
+        } catch (error) {
+            // 클러스터 파일이 없으면 개별 마커만 사용
+            console.warn('클러스터 데이터 없음:', error);
+        }
+    }
+
+    /**
+     * 격자 셀별 업종/유형 개수 로드 (선택사항)
+     */
+    async loadFacetGrid() {
+        try {
+            const response = await fetch(this.dataUrls.facets);
+            if (!response.ok) {
+                return;
+            }
+
+            this.facetGrid = new FacetGrid(await response.json());
+            this.updateFacetCounts();
+        } catch (error) {
+            // 패싯 파일이 없으면 개수 표시 생략
+            console.warn('패싯 데이터 없음:', error);
+        }
+    }
+
+    /**
+     * 장소 자동완성 인덱스 로드 (선택사항)
+     */
+    async loadPlaceIndex() {
+        try {
+            const response = await fetch(this.dataUrls.places);
+            if (!response.ok) {
+                return;
+            }
+
+            this.placeIndex = new PlaceIndex(await response.json());
+        } catch (error) {
+            // 인덱스가 없으면 주소 검색은 카카오 API만 사용
+            console.warn('장소 인덱스 없음:', error);
+        }
     }
 
     /**
      * 이벤트 리스너 설정
      */
     setupEventListeners() {
+        // 가맹점 리스트 (클릭은 리스트에서 위임 처리)
+        this.storeList = new VirtualStoreList(
+            document.getElementById('storeListContainer'),
+            (store) => {
+                this.showStoreDetail(store);
+                mapManager.panTo(store.lat, store.lng);
+            }
+        );
+
         // 현재 위치 버튼
         document.getElementById('currentLocationBtn').addEventListener('click', () => {
             this.getCurrentLocation();
@@ -61,6 +172,13 @@ class OnnuriMapApp {
             this.searchAddress(e.target.value);
         }, 500));
 
+        // Enter로 검색하면 로컬 인덱스에 정확히 일치하는 장소가 없을 때 카카오 API로 검색
+        addressInput.addEventListener('keydown', (e) => {
+            if (e.key === 'Enter' && !e.isComposing) {
+                this.searchAddress(e.target.value, { submit: true });
+            }
+        });
+
         // 반경 선택
         document.querySelectorAll('input[name="radius"]').forEach(radio => {
             radio.addEventListener('change', (e) => {
@@ -84,6 +202,22 @@ class OnnuriMapApp {
         document.getElementById('dialogCloseBtn').addEventListener('click', () => {
             this.closeDialog();
         });
+
+        // 주변 가맹점 클릭 → 해당 가맹점 상세
+        document.getElementById('dialogNearbyList').addEventListener('click', (e) => {
+            const item = e.target.closest('li');
+            if (!item || !item.store) {
+                return;
+            }
+            // 목록의 거리는 이전 가맹점 기준이므로 현재 위치 기준으로 다시 계산
+            const { lat, lng } = this.currentLocation || {};
+            this.showStoreDetail({
+                ...item.store,
+                distance: this.currentLocation
+                    ? calculateDistance(lat, lng, item.store.lat, item.store.lng)
+                    : undefined
+            });
+        });
     }
 
     /**
@@ -120,13 +254,37 @@ class OnnuriMapApp {
 
     /**
      * 주소 검색
+     *
+     * 로컬 장소 인덱스를 먼저 찾고, 카카오 API는 인덱스에 후보가 하나도 없을 때나
+     * Enter로 검색했는데 정확히 일치하는 장소가 없을 때만 호출합니다.
+     * 입력 중인 앞부분은 자동완성 목록만 갱신하므로 네트워크 요청이 없습니다.
+     *
      * @param {string} address - 검색할 주소
+     * @param {Object} options
+     * @param {boolean} options.submit - Enter로 검색했는지
      */
-    async searchAddress(address) {
+    async searchAddress(address, { submit = false } = {}) {
         if (!address || address.trim().length < 2) {
             return;
         }
 
+        // 시장명/동네/도로명은 로컬 인덱스에서 먼저 찾음 (네트워크 요청 없음)
+        // 이름과 정확히 같거나 목록에서 고른 경우에만 이동
+        if (this.placeIndex) {
+            const places = this.placeIndex.search(address, 5);
+            this.updatePlaceSuggestions(places);
+            const place = places.find(candidate => PlaceIndex.matches(candidate, address));
+            if (place) {
+                this.setLocation(place.lat, place.lng);
+                return;
+            }
+
+            // 후보가 있으면 입력 중으로 보고 자동완성 목록에 맡김
+            if (places.length > 0 && !submit) {
+                return;
+            }
+        }
+
         try {
             const coords = await mapManager.geocodeAddress(address);
             this.setLocation(coords.lat, coords.lng);
@@ -136,6 +294,23 @@ class OnnuriMapApp {
         }
     }
 
+    /**
+     * 주소 입력란 자동완성 목록 갱신
+     * @param {Array<Object>} places - PlaceIndex.search 결과
+     */
+    updatePlaceSuggestions(places) {
+        const datalist = document.getElementById('placeSuggestions');
+        if (!datalist) {
+            return;
+        }
+
+        datalist.replaceChildren(...places.map(place => {
+            const option = document.createElement('option');
+            option.value = PlaceIndex.label(place);
+            return option;
+        }));
+    }
+
     /**
      * 위치 설정 및 필터링
      * @param {number} lat - 위도
@@ -152,8 +327,7 @@ class OnnuriMapApp {
         mapManager.drawRadiusCircle(lat, lng, radius);
 
         // 필터 적용
-        filterManager.setUserLocation(lat, lng);
-        this.updateDisplay();
+        this.applyFilters();
     }
 
     /**
@@ -161,7 +335,7 @@ class OnnuriMapApp {
      * @param {number} radius - 반경 (미터)
      */
     onRadiusChange(radius) {
-        filterManager.setRadius(radius);
+        this.filters.radius = radius;
 
         if (this.currentLocation) {
             mapManager.drawRadiusCircle(
@@ -171,7 +345,7 @@ class OnnuriMapApp {
             );
         }
 
-        this.updateDisplay();
+        this.applyFilters();
     }
 
     /**
@@ -179,8 +353,9 @@ class OnnuriMapApp {
      * @param {string} category - 카테고리
      */
     onCategoryChange(category) {
-        filterManager.setCategory(category);
-        this.updateDisplay();
+        this.filters.category = category;
+        this.updateClusterFilter();
+        this.applyFilters();
     }
 
     /**
@@ -189,15 +364,84 @@ class OnnuriMapApp {
     onTypesChange() {
         const types = Array.from(document.querySelectorAll('input[name="type"]:checked'))
             .map(cb => cb.value);
-        filterManager.setTypes(types);
-        this.updateDisplay();
+        this.filters.types = types;
+        this.updateClusterFilter();
+        this.applyFilters();
+    }
+
+    /**
+     * 사전 집계 클러스터에 업종/유형 필터 반영
+     */
+    updateClusterFilter() {
+        const allTypes = document.querySelectorAll('input[name="type"]:not(:checked)').length === 0;
+        mapManager.setClusterFilter(this.filters.category, allTypes);
+    }
+
+    /**
+     * Worker에 필터 요청 후 화면 업데이트
+     */
+    async applyFilters() {
+        if (!this.currentLocation) {
+            return;
+        }
+
+        this.updateFacetCounts();
+
+        try {
+            const stores = await storeClient.filter({ location: this.currentLocation, ...this.filters });
+            // 더 새로운 요청이 있으면 그 결과로 그림
+            if (stores) {
+                this.updateDisplay(stores);
+            }
+        } catch (error) {
+            console.error('필터링 에러:', error);
+        }
+    }
+
+    /**
+     * 반경 안 업종/유형별 개수 표시 (격자 셀 합계)
+     * 가맹점 데이터를 아직 받지 못했으면 전체 개수도 근사값으로 표시
+     */
+    updateFacetCounts() {
+        if (!this.facetGrid || !this.currentLocation) {
+            return;
+        }
+
+        const { lat, lng } = this.currentLocation;
+        const summary = this.facetGrid.summarize(
+            lat, lng, this.filters.radius, this.filters.category, this.filters.types
+        );
+
+        // 업종 선택 옵션
+        document.querySelectorAll('#categorySelect option').forEach(option => {
+            option.dataset.label = option.dataset.label || option.textContent.trim();
+            const count = option.value === 'all'
+                ? Object.values(summary.categories).reduce((sum, n) => sum + n, 0)
+                : summary.categories[option.value] || 0;
+            option.textContent = `${option.dataset.label} (${count.toLocaleString()})`;
+        });
+
+        // 상품권 유형 체크박스
+        document.querySelectorAll('input[name="type"]').forEach(checkbox => {
+            let counter = checkbox.parentElement.querySelector('.facet-count');
+            if (!counter) {
+                counter = document.createElement('span');
+                counter.className = 'facet-count';
+                checkbox.parentElement.appendChild(counter);
+            }
+            counter.textContent = `(${(summary.types[checkbox.value] || 0).toLocaleString()})`;
+        });
+
+        if (!this.storeData) {
+            document.getElementById('filteredCount').textContent = `약 ${summary.total.toLocaleString()}개`;
+        }
     }
 
     /**
      * 화면 업데이트
+     * @param {Array} stores - 거리순 가맹점 배열
      */
-    updateDisplay() {
-        const stores = filterManager.getFilteredStores();
+    updateDisplay(stores) {
 
         // 지도 마커 표시
         mapManager.displayStoreMarkers(stores, (store) => {
@@ -212,40 +456,11 @@ class OnnuriMapApp {
     }
 
     /**
-     * 가맹점 리스트 업데이트
+     * 가맹점 리스트 업데이트 (보이는 행만 그림)
      * @param {Array} stores - 가맹점 배열
      */
     updateStoreList(stores) {
-        const container = document.getElementById('storeListContainer');
-
-        if (stores.length === 0) {
-            container.innerHTML = '<div class="loading">해당 조건의 가맹점이 없습니다</div>';
-            return;
-        }
-
-        container.innerHTML = stores.map(store => `
-            <div class="store-item" data-id="${store.id}">
-                <h3>${store.name}</h3>
-                <div class="store-item-distance">${formatDistance(store.distance)}</div>
-                <div class="store-item-category">${store.category || '기타'}</div>
-            </div>
-        `).join('');
-
-        // 리스트 아이템 클릭 이벤트
-        container.querySelectorAll('.store-item').forEach(item => {
-            item.addEventListener('click', () => {
-                const id = parseInt(item.dataset.id);
-                const store = filterManager.findStoreById(id);
-                if (store) {
-                    // 거리 정보 추가 (필터링된 것에서 찾기)
-                    const filteredStore = stores.find(s => s.id === id);
-                    if (filteredStore) {
-                        this.showStoreDetail(filteredStore);
-                        mapManager.panTo(store.lat, store.lng);
-                    }
-                }
-            });
-        });
+        this.storeList.setStores(stores);
     }
 
     /**
@@ -290,7 +505,48 @@ class OnnuriMapApp {
         document.getElementById('dialogDirectionsBtn').href = directionsUrls.naver;
 
         // Dialog 표시
-        dialog.showModal();
+        if (!dialog.open) {
+            dialog.showModal();
+        }
+
+        this.showNearbyStores(store);
+    }
+
+    /**
+     * 상세 Dialog에 주변 가맹점 표시 (빌드할 때 미리 계산한 목록)
+     * @param {Object} store - 가맹점 정보
+     */
+    async showNearbyStores(store) {
+        const section = document.querySelector('.dialog-nearby');
+        const list = document.getElementById('dialogNearbyList');
+        this.dialogStoreId = store.id;
+        section.style.display = 'none';
+
+        let stores = [];
+        try {
+            stores = await storeClient.nearby(store.id);
+        } catch (error) {
+            console.warn('주변 가맹점 로드 실패:', error);
+        }
+
+        // 기다리는 동안 다른 가맹점을 열었으면 무시
+        if (this.dialogStoreId !== store.id || stores.length === 0) {
+            return;
+        }
+
+        list.replaceChildren(...stores.map(neighbor => {
+            const item = document.createElement('li');
+            const name = document.createElement('span');
+            const distance = document.createElement('span');
+            name.textContent = `${neighbor.name} · ${neighbor.category || '기타'}`;
+            distance.className = 'nearby-distance';
+            distance.textContent = formatDistance(neighbor.distance);
+            item.append(name, distance);
+            item.store = neighbor;
+            return item;
+        }));
+        list.scrollTop = 0;
+        section.style.display = 'block';
     }
 
     /**
@@ -298,6 +554,7 @@ class OnnuriMapApp {
      */
     closeDialog() {
         const dialog = document.getElementById('storeDialog');
+        this.dialogStoreId = null;
         dialog.close();
     }
 
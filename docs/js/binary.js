@@ -0,0 +1,305 @@
+// 가맹점 컬럼 테이블 (stores.bin / stores.json 공용)
+//
+// stores.bin 레이아웃은 scripts/store_binary.py 참고.
+// 좌표/유형/카테고리는 TypedArray로 두고, 가맹점 객체는 필요할 때만 만든다.
+
+const STORE_BINARY_MAGIC = 'ONNB';
+const STORE_COORD_SCALE = 1e7;
+const STORE_NO_CATEGORY = 0xFFFF;
+const STORE_NO_STRING = 0xFFFFFFFF;
+const STORE_TYPE_BITS = { card: 1, paper: 2, mobile: 4 };
+
+/**
+ * 상품권 유형 배열을 비트마스크로 변환
+ * @param {Array<string>} types - 유형 배열
+ * @returns {number} 비트마스크
+ */
+function typesToMask(types) {
+    return (types || []).reduce((mask, type) => mask | (STORE_TYPE_BITS[type] || 0), 0);
+}
+
+/**
+ * 비트마스크를 상품권 유형 배열로 변환
+ * @param {number} mask - 비트마스크
+ * @returns {Array<string>} 유형 배열
+ */
+function maskToTypes(mask) {
+    return Object.keys(STORE_TYPE_BITS).filter(type => mask & STORE_TYPE_BITS[type]);
+}
+
+class StoreTable {
+    /**
+     * @param {Object} columns - 컬럼 데이터
+     */
+    constructor(columns) {
+        this.length = columns.ids.length;
+        this.ids = columns.ids;              // Int32Array
+        this.latE7 = columns.latE7;          // Int32Array
+        this.lngE7 = columns.lngE7;          // Int32Array
+        this.categoryCodes = columns.categoryCodes;  // Uint16Array
+        this.types = columns.types;          // Uint8Array
+        this.categories = columns.categories;
+        this.lastUpdated = columns.lastUpdated || null;
+
+        // 바이너리 문자열 필드 (JSON 원본이면 null)
+        this.fields = columns.fields || [];
+        this.refs = columns.refs || null;
+        this.stringOffsets = columns.stringOffsets || null;
+        this.heap = columns.heap || null;
+        this.stringCache = [];
+
+        // 가맹점 객체 (JSON 원본이면 그대로, 바이너리면 필요할 때 생성)
+        this.objects = columns.objects || new Array(this.length);
+        this.idIndex = null;
+        this.latIndex = null;
+    }
+
+    /**
+     * stores.bin ArrayBuffer에서 생성 (복사 없이 뷰만 생성)
+     * @param {ArrayBuffer} buffer - stores.bin 내용
+     * @returns {StoreTable}
+     */
+    static fromArrayBuffer(buffer) {
+        const header = new DataView(buffer, 0, 32);
+        const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+        if (magic !== STORE_BINARY_MAGIC) {
+            throw new Error('stores.bin 형식이 아닙니다.');
+        }
+
+        const fieldCount = header.getUint16(6, true);
+        const count = header.getUint32(8, true);
+        const categoryCount = header.getUint32(12, true);
+        const stringCount = header.getUint32(16, true);
+        const heapSize = header.getUint32(20, true);
+        const lastUpdatedRef = header.getUint32(24, true);
+
+        let offset = 32;
+        const take = (ArrayType, length) => {
+            const view = new ArrayType(buffer, offset, length);
+            offset += length * ArrayType.BYTES_PER_ELEMENT;
+            offset = Math.ceil(offset / 8) * 8;
+            return view;
+        };
+
+        const ids = take(Int32Array, count);
+        const latE7 = take(Int32Array, count);
+        const lngE7 = take(Int32Array, count);
+        const categoryCodes = take(Uint16Array, count);
+        const types = take(Uint8Array, count);
+        const refs = take(Uint32Array, fieldCount * count);
+        const stringOffsets = take(Uint32Array, stringCount + 1);
+        const heap = new Uint8Array(buffer, offset, heapSize);
+
+        const table = new StoreTable({
+            ids, latE7, lngE7, categoryCodes, types, refs, stringOffsets, heap,
+            categories: []
+        });
+
+        for (let i = 0; i < categoryCount; i++) {
+            table.categories.push(table.getString(i));
+        }
+        for (let i = 0; i < fieldCount; i++) {
+            table.fields.push(table.getString(categoryCount + i));
+        }
+        table.lastUpdated = table.getString(lastUpdatedRef);
+
+        return table;
+    }
+
+    /**
+     * stores.json의 가맹점 배열에서 생성
+     * @param {Array} stores - 가맹점 배열
+     * @param {string} lastUpdated - 업데이트 시각
+     * @returns {StoreTable}
+     */
+    static fromStores(stores, lastUpdated) {
+        const count = stores.length;
+        const categories = [...new Set(stores.map(store => store.category).filter(Boolean))].sort();
+        const categoryIndex = new Map(categories.map((name, i) => [name, i]));
+
+        const columns = {
+            ids: new Int32Array(count),
+            latE7: new Int32Array(count),
+            lngE7: new Int32Array(count),
+            categoryCodes: new Uint16Array(count),
+            types: new Uint8Array(count),
+            categories: categories,
+            lastUpdated: lastUpdated,
+            objects: stores
+        };
+
+        stores.forEach((store, i) => {
+            columns.ids[i] = store.id;
+            columns.latE7[i] = Math.round(store.lat * STORE_COORD_SCALE);
+            columns.lngE7[i] = Math.round(store.lng * STORE_COORD_SCALE);
+            columns.categoryCodes[i] = store.category
+                ? categoryIndex.get(store.category)
+                : STORE_NO_CATEGORY;
+            columns.types[i] = typesToMask(store.types);
+        });
+
+        return new StoreTable(columns);
+    }
+
+    /**
+     * 위도
+     * @param {number} i - 행 번호
+     * @returns {number}
+     */
+    lat(i) {
+        return this.latE7[i] / STORE_COORD_SCALE;
+    }
+
+    /**
+     * 경도
+     * @param {number} i - 행 번호
+     * @returns {number}
+     */
+    lng(i) {
+        return this.lngE7[i] / STORE_COORD_SCALE;
+    }
+
+    /**
+     * 카테고리 이름
+     * @param {number} i - 행 번호
+     * @returns {string|undefined}
+     */
+    category(i) {
+        const code = this.categoryCodes[i];
+        return code === STORE_NO_CATEGORY ? undefined : this.categories[code];
+    }
+
+    /**
+     * 카테고리 이름 → 코드 (없는 카테고리는 -1)
+     * @param {string} name - 카테고리 이름
+     * @returns {number}
+     */
+    categoryCode(name) {
+        return this.categories.indexOf(name);
+    }
+
+    /**
+     * 문자열 테이블에서 문자열 읽기
+     * @param {number} index - 문자열 인덱스
+     * @returns {string}
+     */
+    getString(index) {
+        let value = this.stringCache[index];
+        if (value === undefined) {
+            const start = this.stringOffsets[index];
+            const end = this.stringOffsets[index + 1];
+            value = StoreTable.decoder.decode(this.heap.subarray(start, end));
+            this.stringCache[index] = value;
+        }
+        return value;
+    }
+
+    /**
+     * 가맹점 객체 가져오기 (바이너리면 처음 접근할 때 생성)
+     * @param {number} i - 행 번호
+     * @returns {Object}
+     */
+    getStore(i) {
+        let store = this.objects[i];
+        if (store === undefined) {
+            store = this.buildStore(i);
+            this.objects[i] = store;
+        }
+        return store;
+    }
+
+    /**
+     * 컬럼 데이터로 가맹점 객체 생성
+     * @param {number} i - 행 번호
+     * @returns {Object}
+     */
+    buildStore(i) {
+        const store = {
+            id: this.ids[i],
+            lat: this.lat(i),
+            lng: this.lng(i),
+            category: this.category(i),
+            types: maskToTypes(this.types[i])
+        };
+        this.fields.forEach((field, f) => {
+            const ref = this.refs[f * this.length + i];
+            if (ref !== STORE_NO_STRING) {
+                store[field] = this.getString(ref);
+            }
+        });
+        return store;
+    }
+
+    /**
+     * 전체 가맹점 객체 배열 (테이블 내부 캐시에는 남기지 않음)
+     * @returns {Array}
+     */
+    toStores() {
+        const stores = new Array(this.length);
+        for (let i = 0; i < this.length; i++) {
+            stores[i] = this.objects[i] || this.buildStore(i);
+        }
+        return stores;
+    }
+
+    /**
+     * 위도순 행 번호 (처음 호출할 때 생성)
+     * @returns {Int32Array}
+     */
+    latOrder() {
+        if (!this.latIndex) {
+            const order = new Int32Array(this.length);
+            for (let i = 0; i < this.length; i++) {
+                order[i] = i;
+            }
+            order.sort((a, b) => this.latE7[a] - this.latE7[b] || a - b);
+            this.latIndex = order;
+        }
+        return this.latIndex;
+    }
+
+    /**
+     * 위도 범위에 드는 latOrder 위치 구간
+     * @param {number} minLat - 최소 위도
+     * @param {number} maxLat - 최대 위도
+     * @returns {Array<number>} [시작, 끝)
+     */
+    latRange(minLat, maxLat) {
+        const order = this.latOrder();
+        const lowerBound = (value) => {
+            let lo = 0;
+            let hi = order.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >>> 1;
+                if (this.latE7[order[mid]] < value) {
+                    lo = mid + 1;
+                } else {
+                    hi = mid;
+                }
+            }
+            return lo;
+        };
+        return [
+            lowerBound(Math.ceil(minLat * STORE_COORD_SCALE)),
+            lowerBound(Math.floor(maxLat * STORE_COORD_SCALE) + 1)
+        ];
+    }
+
+    /**
+     * ID로 행 번호 찾기
+     * @param {number} id - 가맹점 ID
+     * @returns {number} 행 번호 (없으면 -1)
+     */
+    indexOfId(id) {
+        if (!this.idIndex) {
+            this.idIndex = new Map();
+            for (let i = 0; i < this.length; i++) {
+                this.idIndex.set(this.ids[i], i);
+            }
+        }
+        const index = this.idIndex.get(id);
+        return index === undefined ? -1 : index;
+    }
+}
+
+StoreTable.decoder = new TextDecoder('utf-8');
@@ -3,9 +3,27 @@ const CONFIG = {
     // 카카오 JavaScript 키
     KAKAO_JAVASCRIPT_KEY: 'd6d7f886f9a0726d9948aae19b1f1296',
 
-    // 데이터 파일 경로 (캐시 무효화를 위한 버전 파라미터 추가)
+    // 콘텐츠 해시 파일명 목록 (매번 재검증, 아래 경로보다 우선)
+    MANIFEST_URL: 'data/manifest.json',
+
+    // 로컬 사본(IndexedDB)에 적용할 최대 패치 수 (넘으면 전체 다운로드)
+    MAX_PATCH_CHAIN: 6,
+
+    // 데이터 파일 경로 (manifest가 없을 때 사용, 캐시 무효화를 위한 버전 파라미터 추가)
     DATA_URL: 'data/stores.json?v=20251109-2',
 
+    // 바이너리 가맹점 데이터 (JSON 파싱 없이 로드, 없으면 DATA_URL 사용)
+    BINARY_DATA_URL: 'data/stores.bin?v=20251109-2',
+
+    // 줌 레벨별 사전 집계 클러스터 (generate_json.py에서 생성, 없으면 생략)
+    CLUSTER_URL: 'data/clusters.json',
+
+    // 격자 셀별 업종/유형 개수 (generate_json.py에서 생성, 없으면 개수 표시 생략)
+    FACET_URL: 'data/facets.json',
+
+    // 주소 검색용 장소 자동완성 인덱스 (generate_json.py에서 생성, 없으면 카카오 API만 사용)
+    PLACE_URL: 'data/places.json',
+
     // 기본 지도 설정
     DEFAULT_CENTER: {
         lat: 37.5665,  // 서울 시청
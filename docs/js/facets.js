@@ -0,0 +1,97 @@
+// 격자 셀별 업종/상품권 유형 개수 (facets.json, generate_json.py에서 생성)
+//
+// 반경 안의 셀만 더해 가맹점 데이터 없이도 개수를 보여준다.
+// 셀 중심이 반경 안에 있는 셀만 더하므로 근사값이다.
+
+class FacetGrid {
+    /**
+     * @param {Object} data - facets.json 데이터
+     */
+    constructor(data) {
+        this.cellSize = data.cellSize;
+        this.categories = data.categories;
+        this.types = data.types;
+
+        // "cx,cy" → [카테고리 코드, 유형 마스크, 가맹점 수, ...]
+        this.cells = new Map();
+        data.cells.forEach(([cx, cy, values]) => {
+            this.cells.set(`${cx},${cy}`, values);
+        });
+    }
+
+    /**
+     * 상품권 유형 배열을 facets.json 기준 비트마스크로 변환
+     * @param {Array<string>} types - 유형 배열
+     * @returns {number}
+     */
+    typeMask(types) {
+        return (types || []).reduce((mask, type) => {
+            const bit = this.types.indexOf(type);
+            return bit === -1 ? mask : mask | (1 << bit);
+        }, 0);
+    }
+
+    /**
+     * 반경 안 개수 집계 (필터 규칙은 FilterManager.applyFilters와 같음)
+     * @param {number} lat - 중심 위도
+     * @param {number} lng - 중심 경도
+     * @param {number} radius - 반경 (미터)
+     * @param {string} category - 선택한 카테고리 ('all'이면 전체)
+     * @param {Array<string>} types - 선택한 유형 (비어 있으면 전체)
+     * @returns {Object} {
+     *   total: 카테고리/유형 필터를 모두 통과한 수,
+     *   categories: 카테고리별 수 (유형 필터만 적용),
+     *   types: 유형별 수 (카테고리 필터만 적용)
+     * }
+     */
+    summarize(lat, lng, radius, category, types) {
+        const size = this.cellSize;
+        const dLat = radius / 6371e3 * 180 / Math.PI;
+        const dLng = dLat / Math.cos(lat * Math.PI / 180);
+
+        const categoryCode = category === 'all' ? null : this.categories.indexOf(category);
+        const selectedMask = this.typeMask(types);
+
+        const summary = { total: 0, categories: {}, types: {} };
+        this.categories.forEach(name => { summary.categories[name] = 0; });
+        this.types.forEach(type => { summary.types[type] = 0; });
+
+        for (let cy = Math.floor((lat - dLat) / size); cy <= Math.floor((lat + dLat) / size); cy++) {
+            for (let cx = Math.floor((lng - dLng) / size); cx <= Math.floor((lng + dLng) / size); cx++) {
+                const values = this.cells.get(`${cx},${cy}`);
+                if (!values) {
+                    continue;
+                }
+
+                // 셀 중심이 반경 밖이면 제외
+                if (calculateDistance(lat, lng, (cy + 0.5) * size, (cx + 0.5) * size) > radius) {
+                    continue;
+                }
+
+                for (let k = 0; k < values.length; k += 3) {
+                    const code = values[k];
+                    const mask = values[k + 1];
+                    const count = values[k + 2];
+                    const typeMatch = !selectedMask || (mask & selectedMask);
+                    const categoryMatch = categoryCode === null || code === categoryCode;
+
+                    if (typeMatch) {
+                        summary.categories[this.categories[code]] += count;
+                    }
+                    if (categoryMatch) {
+                        this.types.forEach((type, bit) => {
+                            if (mask & (1 << bit)) {
+                                summary.types[type] += count;
+                            }
+                        });
+                    }
+                    if (typeMatch && categoryMatch) {
+                        summary.total += count;
+                    }
+                }
+            }
+        }
+
+        return summary;
+    }
+}
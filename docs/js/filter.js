@@ -1,12 +1,15 @@
 // 필터링 관리 모듈
 class FilterManager {
     constructor() {
-        this.allStores = [];
+        this.storeTable = StoreTable.fromStores([]);
         this.filteredStores = [];
         this.userLocation = null;
         this.selectedRadius = CONFIG.RADIUS.SMALL;
         this.selectedCategory = 'all';
         this.selectedTypes = ['card', 'paper', 'mobile'];
+
+        // 위치별 거리순 후보 캐시 (카테고리/유형을 바꿔도 재사용)
+        this.candidates = null;
     }
 
     /**
@@ -14,8 +17,17 @@ class FilterManager {
      * @param {Array} stores - 가맹점 배열
      */
     setStores(stores) {
-        this.allStores = stores;
-        console.log(`전체 가맹점 ${stores.length}개 로드 완료`);
+        this.setStoreTable(StoreTable.fromStores(stores));
+    }
+
+    /**
+     * 가맹점 컬럼 테이블 설정
+     * @param {StoreTable} table - 가맹점 테이블
+     */
+    setStoreTable(table) {
+        this.storeTable = table;
+        this.candidates = null;
+        console.log(`전체 가맹점 ${table.length}개 로드 완료`);
     }
 
     /**
@@ -61,6 +73,91 @@ class FilterManager {
         }
     }
 
+    /**
+     * 현재 위치/반경의 거리순 후보 (카테고리/유형 필터 전)
+     *
+     * 위치가 같으면 이전 결과를 재사용하고, 반경이 넓어지면 새로 들어온 위도 구간만
+     * 거리를 계산해 기존 배열에 병합한다. 반경이 좁아지면 앞부분만 사용한다.
+     * @returns {Object} { rows: 행 번호, distances: 거리 (오름차순), count: 반경 안 개수 }
+     */
+    getCandidates() {
+        const table = this.storeTable;
+        const { lat, lng } = this.userLocation;
+        const radius = this.selectedRadius;
+
+        let cache = this.candidates;
+        if (!cache || cache.lat !== lat || cache.lng !== lng) {
+            cache = {
+                lat, lng,
+                radius: 0,
+                start: 0,
+                end: 0,
+                rows: new Int32Array(0),
+                distances: new Float64Array(0),
+                stores: new Map()
+            };
+            this.candidates = cache;
+        }
+
+        if (radius > cache.radius) {
+            // 반경 안의 가맹점은 모두 이 위도 구간 안에 있음 (거리 ≥ 남북 거리)
+            const dLat = radius / 6371e3 * 180 / Math.PI;
+            const [start, end] = table.latRange(lat - dLat, lat + dLat);
+            const order = table.latOrder();
+            const ranges = cache.radius === 0
+                ? [[start, end]]
+                : [[start, cache.start], [cache.end, end]];
+
+            const addedRows = [];
+            const addedDistances = [];
+            for (const [from, to] of ranges) {
+                for (let k = from; k < to; k++) {
+                    const i = order[k];
+                    addedRows.push(i);
+                    addedDistances.push(calculateDistance(lat, lng, table.lat(i), table.lng(i)));
+                }
+            }
+            const addedOrder = addedRows.map((_, k) => k);
+            addedOrder.sort((a, b) => addedDistances[a] - addedDistances[b] || addedRows[a] - addedRows[b]);
+
+            // 거리순 병합
+            const total = cache.rows.length + addedRows.length;
+            const rows = new Int32Array(total);
+            const distances = new Float64Array(total);
+            let a = 0;
+            let b = 0;
+            for (let k = 0; k < total; k++) {
+                const takeOld = b >= addedOrder.length || (a < cache.rows.length && (
+                    cache.distances[a] < addedDistances[addedOrder[b]] ||
+                    (cache.distances[a] === addedDistances[addedOrder[b]] && cache.rows[a] < addedRows[addedOrder[b]])
+                ));
+                if (takeOld) {
+                    rows[k] = cache.rows[a];
+                    distances[k] = cache.distances[a++];
+                } else {
+                    rows[k] = addedRows[addedOrder[b]];
+                    distances[k] = addedDistances[addedOrder[b++]];
+                }
+            }
+
+            Object.assign(cache, { radius, start, end, rows, distances });
+        }
+
+        // 반경 안 개수 (distances는 오름차순)
+        let lo = 0;
+        let hi = cache.distances.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >>> 1;
+            if (cache.distances[mid] <= radius) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+
+        return { rows: cache.rows, distances: cache.distances, count: lo };
+    }
+
     /**
      * 필터 적용
      */
@@ -72,37 +169,40 @@ class FilterManager {
 
         const startTime = performance.now();
 
-        // 1. 거리 계산 및 반경 필터
-        let filtered = this.allStores.map(store => {
-            const distance = calculateDistance(
-                this.userLocation.lat,
-                this.userLocation.lng,
-                store.lat,
-                store.lng
-            );
-
-            return {
-                ...store,
-                distance: distance
-            };
-        }).filter(store => store.distance <= this.selectedRadius);
+        const table = this.storeTable;
 
-        // 2. 카테고리 필터
-        if (this.selectedCategory !== 'all') {
-            filtered = filtered.filter(store =>
-                store.category === this.selectedCategory
-            );
-        }
+        // 1. 거리순 후보 (위치/반경이 그대로면 캐시 사용)
+        const { rows, distances, count } = this.getCandidates();
+        const storeCache = this.candidates.stores;
 
-        // 3. 상품권 유형 필터
-        if (this.selectedTypes.length > 0) {
-            filtered = filtered.filter(store =>
-                store.types.some(type => this.selectedTypes.includes(type))
-            );
-        }
+        // 카테고리/유형은 TypedArray 값으로 거름
+        const categoryCode = this.selectedCategory === 'all'
+            ? null
+            : table.categoryCode(this.selectedCategory);
+        const typeMask = typesToMask(this.selectedTypes);
+
+        const filtered = [];
+        for (let k = 0; k < count; k++) {
+            const i = rows[k];
 
-        // 4. 거리순 정렬
-        filtered.sort((a, b) => a.distance - b.distance);
+            // 2. 카테고리 필터
+            if (categoryCode !== null && table.categoryCodes[i] !== categoryCode) {
+                continue;
+            }
+
+            // 3. 상품권 유형 필터
+            if (typeMask && !(table.types[i] & typeMask)) {
+                continue;
+            }
+
+            // 거리가 붙은 가맹점 객체는 위치가 바뀔 때까지 재사용
+            let store = storeCache.get(i);
+            if (store === undefined) {
+                store = { ...table.getStore(i), distance: distances[k] };
+                storeCache.set(i, store);
+            }
+            filtered.push(store);
+        }
 
         this.filteredStores = filtered;
 
@@ -126,7 +226,7 @@ class FilterManager {
      */
     getStats() {
         return {
-            total: this.allStores.length,
+            total: this.storeTable.length,
             filtered: this.filteredStores.length,
             categories: this.getCategoryStats(),
             types: this.getTypeStats()
@@ -168,7 +268,8 @@ class FilterManager {
      * @returns {Object|null}
      */
     findStoreById(id) {
-        return this.allStores.find(store => store.id === id) || null;
+        const index = this.storeTable.indexOfId(id);
+        return index === -1 ? null : this.storeTable.getStore(index);
     }
 
     /**
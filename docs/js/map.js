@@ -3,10 +3,18 @@ class MapManager {
     constructor() {
         this.map = null;
         this.markers = [];
+        this.markerById = new Map();
+        this.markerPool = [];
+        this.onMarkerClick = null;
         this.clusterer = null;
         this.userMarker = null;
         this.radiusCircle = null;
         this.geocoder = null;
+        this.clusterPyramid = null;
+        this.pyramidOverlays = [];
+
+        // 사전 집계 클러스터에 반영할 필터 (업종, 유형 전체 선택 여부)
+        this.clusterFilter = { category: 'all', allTypes: true };
     }
 
     /**
@@ -30,6 +38,11 @@ class MapManager {
             disableClickZoom: true
         });
 
+        // 줌/이동 시 사전 집계 클러스터 갱신
+        kakao.maps.event.addListener(this.map, 'idle', () => {
+            this.renderClusterPyramid();
+        });
+
         // 지도 로딩 완료
         document.getElementById('mapLoading').style.display = 'none';
         console.log('카카오맵 초기화 완료');
@@ -117,41 +130,103 @@ class MapManager {
 
     /**
      * 가맹점 마커 표시
+     * 이전 표시와 가맹점 ID로 비교해 추가/삭제된 마커만 클러스터러에 반영
      * @param {Array} stores - 가맹점 배열
      * @param {Function} onMarkerClick - 마커 클릭 콜백
      */
     displayStoreMarkers(stores, onMarkerClick) {
-        // 기존 마커 제거
-        this.clearMarkers();
+        const startTime = performance.now();
+        this.onMarkerClick = onMarkerClick;
 
-        if (!stores || stores.length === 0) {
-            return;
+        stores = stores || [];
+
+        // 1. 빠진 가맹점의 마커를 먼저 풀에 반납 (새 가맹점 마커로 재사용)
+        const nextIds = new Set(stores.map(store => store.id));
+        const removed = [];
+        this.markerById.forEach((marker, id) => {
+            if (!nextIds.has(id)) {
+                removed.push(marker);
+            }
+        });
+        if (removed.length > 0) {
+            this.clusterer.removeMarkers(removed, true);
+            this.releaseMarkers(removed);
         }
 
-        const markers = stores.map(store => {
-            const position = new kakao.maps.LatLng(store.lat, store.lng);
+        // 2. 남은 마커는 그대로 두고 새 가맹점만 추가
+        const next = new Map();
+        const added = [];
+        stores.forEach(store => {
+            let marker = this.markerById.get(store.id);
+            if (!marker) {
+                marker = this.acquireMarker(store);
+                added.push(marker);
+            }
+            // 같은 가맹점이어도 거리 등이 바뀌므로 객체는 교체
+            marker.store = store;
+            next.set(store.id, marker);
+        });
+        if (added.length > 0) {
+            this.clusterer.addMarkers(added, true);
+        }
 
-            // 마커 생성
-            const marker = new kakao.maps.Marker({
-                position: position,
-                title: store.name
-            });
+        // 클러스터러는 한 번만 다시 그림
+        if (removed.length > 0 || added.length > 0) {
+            this.clusterer.redraw();
+        }
 
-            // 마커 클릭 이벤트
-            kakao.maps.event.addListener(marker, 'click', () => {
-                onMarkerClick(store);
-                // 지도 중심을 마커 위치로 이동
-                this.map.setCenter(position);
-            });
+        this.markerById = next;
+        this.markers = Array.from(next.values());
+
+        console.log(
+            `${this.markers.length}개 가맹점 마커 표시 완료 ` +
+            `(추가 ${added.length}, 삭제 ${removed.length}, ${(performance.now() - startTime).toFixed(2)}ms)`
+        );
+    }
 
-            return marker;
+    /**
+     * 마커 가져오기 (풀에 있으면 재사용)
+     * @param {Object} store - 가맹점 정보
+     * @returns {kakao.maps.Marker}
+     */
+    acquireMarker(store) {
+        const position = new kakao.maps.LatLng(store.lat, store.lng);
+
+        const pooled = this.markerPool.pop();
+        if (pooled) {
+            pooled.setPosition(position);
+            pooled.setTitle(store.name);
+            return pooled;
+        }
+
+        const marker = new kakao.maps.Marker({
+            position: position,
+            title: store.name
+        });
+
+        // 클릭 리스너는 마커를 만들 때 한 번만 등록 (재사용 시 marker.store만 교체)
+        kakao.maps.event.addListener(marker, 'click', () => {
+            if (this.onMarkerClick) {
+                this.onMarkerClick(marker.store);
+            }
+            // 지도 중심을 마커 위치로 이동
+            this.map.setCenter(marker.getPosition());
         });
 
-        // 클러스터러에 마커 추가
-        this.clusterer.addMarkers(markers);
-        this.markers = markers;
+        return marker;
+    }
 
-        console.log(`${stores.length}개 가맹점 마커 표시 완료`);
+    /**
+     * 마커를 풀에 반납
+     * @param {Array} markers - 클러스터러에서 뺀 마커
+     */
+    releaseMarkers(markers) {
+        markers.forEach(marker => {
+            marker.store = null;
+            if (this.markerPool.length < MapManager.MAX_POOL_SIZE) {
+                this.markerPool.push(marker);
+            }
+        });
     }
 
     /**
@@ -161,9 +236,94 @@ class MapManager {
         if (this.clusterer) {
             this.clusterer.clear();
         }
+        this.releaseMarkers(this.markers);
+        this.markerById = new Map();
         this.markers = [];
     }
 
+    /**
+     * 사전 집계 클러스터 피라미드 설정
+     * @param {Object} pyramid - clusters.json 데이터
+     */
+    setClusterPyramid(pyramid) {
+        this.clusterPyramid = pyramid;
+        this.renderClusterPyramid();
+    }
+
+    /**
+     * 사전 집계 클러스터에 필터 반영
+     * @param {string} category - 업종 ('all'이면 전체)
+     * @param {boolean} allTypes - 상품권 유형을 모두 선택했는지
+     */
+    setClusterFilter(category, allTypes) {
+        this.clusterFilter = { category, allTypes };
+        this.renderClusterPyramid();
+    }
+
+    /**
+     * 현재 레벨의 사전 집계 클러스터 표시
+     * 피라미드 레벨 이상(넓은 영역)에서는 개별 마커 대신 집계 결과를 표시
+     *
+     * 업종 필터는 클러스터의 업종별 개수로 반영합니다.
+     * 유형별 개수는 집계에 없으므로 유형 필터 중에는 필터된 개별 마커 클러스터러를 계속 표시하고,
+     * 집계 결과는 유형 필터와 무관한 '전체' 개수로 구분해 표시합니다.
+     */
+    renderClusterPyramid() {
+        this.pyramidOverlays.forEach(overlay => overlay.setMap(null));
+        this.pyramidOverlays = [];
+
+        if (!this.clusterPyramid) {
+            return;
+        }
+
+        const level = this.map.getLevel();
+        const usePyramid = level >= this.clusterPyramid.minLevel;
+        const { category, allTypes } = this.clusterFilter;
+
+        // 개별 마커 클러스터러는 피라미드를 쓰지 않는 레벨이나 유형 필터 중에만 표시
+        this.clusterer.setMap(usePyramid && allTypes ? null : this.map);
+
+        if (!usePyramid) {
+            return;
+        }
+
+        const pyramidLevel = Math.min(level, this.clusterPyramid.maxLevel);
+        const clusters = this.clusterPyramid.levels[pyramidLevel] || [];
+        const categories = this.clusterPyramid.categories;
+        const categoryIndex = categories.indexOf(category);
+        const bounds = this.map.getBounds();
+
+        clusters.forEach(([lat, lng, total, breakdown]) => {
+            const count = category === 'all' ? total : (breakdown[categoryIndex] || 0);
+            const position = new kakao.maps.LatLng(lat, lng);
+            if (count === 0 || !bounds.contain(position)) {
+                return;
+            }
+
+            const content = document.createElement('div');
+            content.className = allTypes ? 'pyramid-cluster' : 'pyramid-cluster pyramid-cluster-all';
+            content.textContent = allTypes ? count.toLocaleString() : `전체 ${count.toLocaleString()}`;
+            content.title = breakdown
+                .map((n, i) => (n > 0 ? `${categories[i]} ${n}` : null))
+                .filter(Boolean)
+                .join(', ') + (allTypes ? '' : ' (상품권 유형 필터 미적용)');
+
+            // 클릭 시 한 단계 확대
+            content.addEventListener('click', () => {
+                this.map.setLevel(level - 1, { anchor: position });
+            });
+
+            const overlay = new kakao.maps.CustomOverlay({
+                position: position,
+                content: content,
+                xAnchor: 0.5,
+                yAnchor: 0.5
+            });
+            overlay.setMap(this.map);
+            this.pyramidOverlays.push(overlay);
+        });
+    }
+
     /**
      * 특정 위치로 지도 이동
      * @param {number} lat - 위도
@@ -195,5 +355,8 @@ class MapManager {
     }
 }
 
+// 재사용을 위해 보관할 최대 마커 수
+MapManager.MAX_POOL_SIZE = 2000;
+
 // 전역 인스턴스 생성
 const mapManager = new MapManager();
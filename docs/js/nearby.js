@@ -0,0 +1,75 @@
+// 주변 가맹점 목록 (generate_json.py에서 가맹점마다 미리 계산)
+//
+// 목록 파일(nearby.<해시>.json)에 샤드 키 → 샤드 파일명이 있고,
+// 샤드 파일에는 그 샤드 안 가맹점의 { ID: [가까운 순 가맹점 ID, ...] }가 있다.
+// 샤드는 가맹점 위치로 정해지므로 필요한 샤드만 받는다.
+
+class NearbyIndex {
+    /**
+     * @param {string} indexUrl - 목록 파일 URL (절대 경로)
+     * @param {string} dataBaseUrl - 데이터 폴더 URL (절대 경로)
+     */
+    constructor(indexUrl, dataBaseUrl) {
+        this.indexUrl = indexUrl;
+        this.dataBaseUrl = dataBaseUrl;
+        this.index = null;
+
+        // 샤드 키 → Promise<Object> (같은 샤드를 두 번 받지 않음)
+        this.shards = new Map();
+    }
+
+    /**
+     * 목록 파일 로드 (한 번만)
+     * @returns {Promise<Object>}
+     */
+    loadIndex() {
+        if (!this.index) {
+            this.index = fetch(this.indexUrl).then(response => {
+                if (!response.ok) {
+                    throw new Error('주변 가맹점 목록 로드 실패');
+                }
+                return response.json();
+            });
+            // 실패하면 다음 요청에서 다시 시도
+            this.index.catch(() => { this.index = null; });
+        }
+        return this.index;
+    }
+
+    /**
+     * 좌표가 속한 샤드 로드
+     * @param {number} lat - 위도
+     * @param {number} lng - 경도
+     * @returns {Promise<Object>} { 가맹점 ID: [주변 가맹점 ID, ...] } (샤드가 없으면 빈 객체)
+     */
+    async loadShard(lat, lng) {
+        const index = await this.loadIndex();
+        const key = `${Math.floor(lng / index.shardSize)}_${Math.floor(lat / index.shardSize)}`;
+        const filename = index.shards[key];
+        if (!filename) {
+            return {};
+        }
+
+        if (!this.shards.has(key)) {
+            const shard = fetch(this.dataBaseUrl + filename).then(response => {
+                if (!response.ok) {
+                    throw new Error('주변 가맹점 샤드 로드 실패');
+                }
+                return response.json();
+            });
+            shard.catch(() => this.shards.delete(key));
+            this.shards.set(key, shard);
+        }
+        return this.shards.get(key);
+    }
+
+    /**
+     * 가맹점의 주변 가맹점 ID
+     * @param {Object} store - 가맹점 (id, lat, lng)
+     * @returns {Promise<Array<number>>} 가까운 순 ID 배열
+     */
+    async neighbors(store) {
+        const shard = await this.loadShard(store.lat, store.lng);
+        return shard[store.id] || [];
+    }
+}
@@ -0,0 +1,181 @@
+// 장소 자동완성 인덱스 (places.json, generate_json.py에서 생성)
+//
+// 시장명, 시/도, 시/군/구, 동/읍/면, 도로명을 자모 단위 검색 키로 정렬해 둔 배열이다.
+// 입력 중인 글자("광장ㅅ")도 자모 단위로는 완성된 이름의 앞부분이므로
+// 이진 탐색으로 접두어가 같은 범위를 찾고, 범위 전체를 훑으며 상위 몇 개만 남긴다.
+// 검색 키 규칙은 scripts/place_index.py의 search_key와 같아야 한다.
+
+const HANGUL_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ';
+const HANGUL_JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ';
+const HANGUL_JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+    'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'];
+
+// 겹모음 / 겹받침은 두 번 입력하는 글자이므로 나눔
+const HANGUL_COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ'
+};
+
+class PlaceIndex {
+    /**
+     * @param {Object} data - places.json 데이터
+     */
+    constructor(data) {
+        this.kinds = data.kinds;
+        this.keys = data.keys;
+        this.places = data.places;
+
+        // 상위 지역 → 단어별 검색 키 (지역 힌트 비교용, 지역 수만큼만 계산)
+        this.regionKeys = new Map();
+    }
+
+    /**
+     * 검색 키 (NFC, 소문자, 공백/기호 제거 후 자모 분해)
+     * @param {string} text - 장소 이름 또는 입력한 검색어
+     * @returns {string}
+     */
+    static searchKey(text) {
+        const cleaned = String(text).normalize('NFC').toLowerCase().replace(/[^0-9a-z가-힣ㄱ-ㅣ]/g, '');
+        let key = '';
+        for (const char of cleaned) {
+            const code = char.charCodeAt(0);
+            if (code >= 0xAC00 && code <= 0xD7A3) {
+                const index = code - 0xAC00;
+                const jung = HANGUL_JUNGSEONG[Math.floor((index % 588) / 28)];
+                const jong = HANGUL_JONGSEONG[index % 28];
+                key += HANGUL_CHOSEONG[Math.floor(index / 588)] +
+                    (HANGUL_COMPOUND_JAMO[jung] || jung) +
+                    (HANGUL_COMPOUND_JAMO[jong] || jong);
+            } else {
+                key += HANGUL_COMPOUND_JAMO[char] || char;
+            }
+        }
+        return key;
+    }
+
+    /**
+     * 검색 키가 prefix 이상인 첫 위치 (이진 탐색)
+     * @param {string} prefix - 검색 키
+     * @returns {number}
+     */
+    lowerBound(prefix) {
+        let low = 0;
+        let high = this.keys.length;
+        while (low < high) {
+            const mid = (low + high) >>> 1;
+            if (this.keys[mid] < prefix) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return low;
+    }
+
+    /**
+     * 장소 검색
+     *
+     * 마지막 단어를 장소 이름으로, 앞 단어들을 지역 힌트로 봅니다.
+     * ("서울 중구" → 이름 "중구", 서울에 있는 중구가 먼저)
+     * 번지까지 입력한 주소("... 정조로 1")는 로컬 인덱스로 찾을 수 없으므로 빈 배열을 반환합니다.
+     * 접두어가 같은 범위 전체를 훑으므로 "ㄱ"처럼 짧은 입력에도 가맹점이 많은 장소가 빠지지 않습니다.
+     *
+     * @param {string} query - 검색어
+     * @param {number} limit - 최대 결과 수
+     * @returns {Array<Object>} { name, region, kind, lat, lng, count } (지역 힌트, 정확히 일치, 가맹점 수 순)
+     */
+    search(query, limit = 5) {
+        const words = String(query).trim().split(/\s+/).filter(Boolean);
+        const name = words.pop();
+        if (!name || /^\d/.test(name)) {
+            return [];
+        }
+
+        const prefix = PlaceIndex.searchKey(name);
+        if (!prefix) {
+            return [];
+        }
+        const hints = words.map(word => PlaceIndex.searchKey(word)).filter(Boolean);
+
+        // 접두어 범위 [start, end): 자모 키 뒤에 올 수 있는 어떤 글자보다 큰 글자를 붙여 상한 탐색
+        const start = this.lowerBound(prefix);
+        const end = this.lowerBound(prefix + '\uffff');
+
+        // 상위 limit개만 순위대로 유지
+        const top = [];
+        const better = (a, b) =>
+            (a.hinted - b.hinted) || (a.exact - b.exact) || (a.count - b.count);
+        for (let i = start; i < end; i++) {
+            const candidate = {
+                index: i,
+                count: this.places[i][5],
+                exact: this.keys[i] === prefix ? 1 : 0,
+                hinted: hints.length ? this.matchRegion(this.places[i][1], hints) : 0
+            };
+            if (top.length === limit && better(candidate, top[top.length - 1]) <= 0) {
+                continue;
+            }
+
+            let at = top.length;
+            while (at > 0 && better(candidate, top[at - 1]) > 0) {
+                at--;
+            }
+            top.splice(at, 0, candidate);
+            if (top.length > limit) {
+                top.pop();
+            }
+        }
+
+        return top.map(({ index }) => {
+            const [placeName, region, kind, lat, lng, count] = this.places[index];
+            return { name: placeName, region, kind: this.kinds[kind], lat, lng, count };
+        });
+    }
+
+    /**
+     * 검색어가 장소를 정확히 가리키는지 (이름 또는 자동완성 표시 문자열과 같음)
+     * 입력 중인 앞부분만으로는 지도를 옮기지 않기 위해 사용합니다.
+     * @param {Object} place - search 결과 항목
+     * @param {string} query - 검색어
+     * @returns {boolean}
+     */
+    static matches(place, query) {
+        const key = PlaceIndex.searchKey(query);
+        return key === PlaceIndex.searchKey(place.name) ||
+            key === PlaceIndex.searchKey(PlaceIndex.label(place));
+    }
+
+    /**
+     * 지역 힌트가 상위 지역과 몇 개 맞는지
+     * ("서울특별시"는 "서울"로 시작하므로 맞음, "종로"는 "종로구"의 앞부분이므로 맞음)
+     * @param {string} region - 상위 지역 ("서울 종로구")
+     * @param {Array<string>} hints - 지역 힌트 검색 키
+     * @returns {number}
+     */
+    matchRegion(region, hints) {
+        if (!hints.length || !region) {
+            return 0;
+        }
+        let regionKeys = this.regionKeys.get(region);
+        if (!regionKeys) {
+            regionKeys = region.split(' ').map(word => PlaceIndex.searchKey(word));
+            this.regionKeys.set(region, regionKeys);
+        }
+        return hints.filter(hint =>
+            regionKeys.some(key => hint.startsWith(key) || key.startsWith(hint))
+        ).length;
+    }
+
+    /**
+     * 자동완성 표시 문자열 ("서울 중구"처럼 상위 지역을 붙여 다시 검색해도 같은 장소가 먼저 나옴)
+     * @param {Object} place - search 결과 항목
+     * @returns {string}
+     */
+    static label(place) {
+        if (place.kind === 'province' || !place.region) {
+            return place.name;
+        }
+        return `${place.region} ${place.name}`;
+    }
+}
@@ -0,0 +1,128 @@
+// 로컬 가맹점 데이터 캐시 (IndexedDB) 및 증분 패치 적용
+
+class StoreCache {
+    /**
+     * @param {string} dbName - IndexedDB 이름
+     * @param {string} storeName - Object store 이름
+     */
+    constructor(dbName = 'onnuri-map', storeName = 'stores') {
+        this.dbName = dbName;
+        this.storeName = storeName;
+        this.db = null;
+    }
+
+    /**
+     * IndexedDB 사용 가능 여부
+     * @returns {boolean}
+     */
+    isSupported() {
+        return typeof indexedDB !== 'undefined';
+    }
+
+    /**
+     * DB 열기
+     * @returns {Promise<IDBDatabase>}
+     */
+    open() {
+        if (this.db) {
+            return Promise.resolve(this.db);
+        }
+
+        return new Promise((resolve, reject) => {
+            const request = indexedDB.open(this.dbName, 1);
+            request.onupgradeneeded = () => {
+                request.result.createObjectStore(this.storeName);
+            };
+            request.onsuccess = () => {
+                this.db = request.result;
+                resolve(this.db);
+            };
+            request.onerror = () => reject(request.error);
+        });
+    }
+
+    /**
+     * 로컬 사본 읽기
+     * @returns {Promise<{version: string, lastUpdated: string, stores: Array}|null>}
+     */
+    async load() {
+        const db = await this.open();
+        return new Promise((resolve, reject) => {
+            const request = db.transaction(this.storeName, 'readonly')
+                .objectStore(this.storeName)
+                .get('current');
+            request.onsuccess = () => resolve(request.result || null);
+            request.onerror = () => reject(request.error);
+        });
+    }
+
+    /**
+     * 로컬 사본 저장
+     * @param {{version: string, lastUpdated: string, stores: Array}} record - 저장할 데이터
+     * @returns {Promise<void>}
+     */
+    async save(record) {
+        const db = await this.open();
+        return new Promise((resolve, reject) => {
+            const transaction = db.transaction(this.storeName, 'readwrite');
+            transaction.objectStore(this.storeName).put(record, 'current');
+            transaction.oncomplete = () => resolve();
+            transaction.onerror = () => reject(transaction.error);
+        });
+    }
+}
+
+/**
+ * 로컬 버전에서 최신 버전까지의 패치 체인 찾기
+ * @param {Array} patches - manifest의 패치 목록
+ * @param {string} fromVersion - 로컬 데이터 버전
+ * @param {string} toVersion - 최신 데이터 버전
+ * @param {number} maxLength - 최대 패치 수
+ * @returns {Array|null} 적용할 패치 목록 (체인이 없거나 너무 길면 null)
+ */
+function resolvePatchChain(patches, fromVersion, toVersion, maxLength) {
+    const chain = [];
+    let version = fromVersion;
+
+    while (version !== toVersion) {
+        const patch = patches.find(p => p.from === version);
+        if (!patch || chain.length >= maxLength) {
+            return null;
+        }
+        chain.push(patch);
+        version = patch.to;
+    }
+
+    return chain;
+}
+
+/**
+ * 가맹점 배열에 패치 적용 (ID 기준 추가/수정/삭제)
+ * @param {Array} stores - 가맹점 배열
+ * @param {Object} patch - 패치 데이터 ({added, updated, removed})
+ * @returns {Array} 패치가 적용된 가맹점 배열
+ */
+function applyStorePatch(stores, patch) {
+    const removed = new Set(patch.removed);
+    const upserts = new Map();
+    patch.added.concat(patch.updated).forEach(store => upserts.set(store.id, store));
+
+    const result = [];
+    stores.forEach(store => {
+        if (removed.has(store.id)) {
+            return;
+        }
+        if (upserts.has(store.id)) {
+            result.push(upserts.get(store.id));
+            upserts.delete(store.id);
+        } else {
+            result.push(store);
+        }
+    });
+    upserts.forEach(store => result.push(store));
+
+    return result;
+}
+
+// 전역 인스턴스 생성
+const storeCache = new StoreCache();
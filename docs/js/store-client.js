@@ -0,0 +1,114 @@
+// 가맹점 데이터 Worker 클라이언트
+//
+// 데이터 로드와 필터링은 store-worker.js에서 처리하고, 메인 스레드는 결과만 받아 그린다.
+// 필터 결과는 ID/거리 TypedArray로 받고, 가맹점 객체는 처음 나올 때 한 번만 받아 보관한다.
+
+class StoreClient {
+    /**
+     * @param {string} workerUrl - Worker 스크립트 경로
+     */
+    constructor(workerUrl = 'js/store-worker.js') {
+        this.worker = new Worker(workerUrl);
+        this.nextRequestId = 1;
+        this.pending = new Map();
+
+        // ID → 가맹점 객체 (Worker에서 받은 것)
+        this.stores = new Map();
+
+        // 가장 최근 필터 요청 (이전 요청의 결과는 버림)
+        this.latestFilterId = 0;
+
+        this.worker.onmessage = (event) => {
+            const { id, ok, result, error } = event.data;
+            const request = this.pending.get(id);
+            if (!request) {
+                return;
+            }
+            this.pending.delete(id);
+            if (ok) {
+                request.resolve(result);
+            } else {
+                request.reject(new Error(error));
+            }
+        };
+
+        this.worker.onerror = (event) => {
+            console.error('Worker 에러:', event.message);
+            this.pending.forEach(request => request.reject(new Error(event.message)));
+            this.pending.clear();
+        };
+    }
+
+    /**
+     * Worker에 요청
+     * @param {string} type - 요청 종류
+     * @param {Object} payload - 요청 데이터
+     * @returns {Promise<Object>}
+     */
+    request(type, payload) {
+        const id = this.nextRequestId++;
+        return new Promise((resolve, reject) => {
+            this.pending.set(id, { resolve, reject });
+            this.worker.postMessage({ id, type, payload });
+        });
+    }
+
+    /**
+     * 가맹점 데이터 로드
+     * Worker 기준 상대 경로가 되지 않도록 URL은 절대 경로로 바꿔 보냄
+     * @param {Object|null} manifest - manifest.json 내용
+     * @param {string} dataBaseUrl - 데이터 폴더 URL
+     * @param {Object} dataUrls - { stores, binary, clusters, nearby }
+     * @returns {Promise<Object>} { totalStores, lastUpdated }
+     */
+    load(manifest, dataBaseUrl, dataUrls) {
+        const absolute = (url) => url ? new URL(url, location.href).href : url;
+        const urls = {};
+        Object.entries(dataUrls).forEach(([key, url]) => {
+            urls[key] = absolute(url);
+        });
+
+        this.stores.clear();
+        return this.request('load', {
+            manifest,
+            dataBaseUrl: absolute(dataBaseUrl),
+            dataUrls: urls
+        });
+    }
+
+    /**
+     * 필터 적용
+     * @param {Object} filters - { location, radius, category, types, query }
+     * @returns {Promise<Array|null>} 거리가 붙은 가맹점 배열 (더 새로운 요청이 있으면 null)
+     */
+    async filter(filters) {
+        const requestId = this.nextRequestId;
+        this.latestFilterId = requestId;
+
+        const { ids, distances, stores } = await this.request('filter', filters);
+        stores.forEach(store => this.stores.set(store.id, store));
+
+        if (requestId !== this.latestFilterId) {
+            return null;
+        }
+
+        const results = new Array(ids.length);
+        for (let i = 0; i < ids.length; i++) {
+            results[i] = { ...this.stores.get(ids[i]), distance: distances[i] };
+        }
+        return results;
+    }
+
+    /**
+     * 미리 계산한 주변 가맹점
+     * @param {number} id - 가맹점 ID
+     * @returns {Promise<Array>} 거리가 붙은 가맹점 배열 (가까운 순)
+     */
+    async nearby(id) {
+        const { stores } = await this.request('nearby', { id });
+        return stores;
+    }
+}
+
+// 전역 인스턴스 생성
+const storeClient = new StoreClient();
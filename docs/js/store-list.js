@@ -0,0 +1,150 @@
+// 가맹점 리스트 (가상 스크롤)
+//
+// 보이는 행과 앞뒤 여유분만 DOM에 두고, 스크롤할 때 행 노드를 재사용한다.
+// 클릭은 컨테이너 하나에서 위임 처리한다.
+
+class VirtualStoreList {
+    /**
+     * @param {HTMLElement} container - 스크롤 컨테이너
+     * @param {Function} onSelect - 가맹점 클릭 콜백 (store)
+     * @param {Object} options - { buffer: 화면 밖에 미리 그릴 행 수 }
+     */
+    constructor(container, onSelect, options = {}) {
+        this.container = container;
+        this.onSelect = onSelect;
+        this.buffer = options.buffer || 8;
+
+        this.stores = [];
+        this.rowHeight = 0;
+        this.pool = [];
+        this.frame = null;
+
+        // 전체 높이를 잡는 영역 (행은 이 안에 절대 위치로 배치)
+        this.spacer = document.createElement('div');
+        this.spacer.className = 'store-list-spacer';
+
+        this.message = document.createElement('div');
+        this.message.className = 'loading';
+
+        this.container.addEventListener('scroll', () => this.scheduleRender(), { passive: true });
+        window.addEventListener('resize', () => this.scheduleRender());
+
+        // 클릭 위임
+        this.container.addEventListener('click', (e) => {
+            const item = e.target.closest('.store-item');
+            if (!item) {
+                return;
+            }
+            const store = this.stores[Number(item.dataset.index)];
+            if (store) {
+                this.onSelect(store);
+            }
+        });
+    }
+
+    /**
+     * 가맹점 목록 설정 (맨 위로 스크롤)
+     * @param {Array} stores - 거리순 가맹점 배열
+     */
+    setStores(stores) {
+        this.stores = stores;
+
+        if (stores.length === 0) {
+            this.message.textContent = '해당 조건의 가맹점이 없습니다';
+            this.container.replaceChildren(this.message);
+            return;
+        }
+
+        if (this.spacer.parentNode !== this.container) {
+            this.container.replaceChildren(this.spacer);
+        }
+        if (!this.rowHeight) {
+            this.rowHeight = this.measureRowHeight();
+        }
+
+        this.spacer.style.height = `${stores.length * this.rowHeight}px`;
+        this.container.scrollTop = 0;
+        this.render();
+    }
+
+    /**
+     * 행 높이 측정 (CSS로 고정된 높이)
+     * @returns {number}
+     */
+    measureRowHeight() {
+        const row = this.createRow();
+        row.style.visibility = 'hidden';
+        this.spacer.appendChild(row);
+        const height = row.offsetHeight || 80;
+        row.remove();
+        return height;
+    }
+
+    /**
+     * 행 노드 생성
+     * @returns {HTMLElement}
+     */
+    createRow() {
+        const row = document.createElement('div');
+        row.className = 'store-item';
+        row.innerHTML = `
+            <h3></h3>
+            <div class="store-item-distance"></div>
+            <div class="store-item-category"></div>
+        `;
+        return row;
+    }
+
+    /**
+     * 다음 프레임에 다시 그리기 (스크롤 이벤트마다 그리지 않음)
+     */
+    scheduleRender() {
+        if (this.frame === null) {
+            this.frame = requestAnimationFrame(() => {
+                this.frame = null;
+                this.render();
+            });
+        }
+    }
+
+    /**
+     * 보이는 범위의 행만 그리기
+     */
+    render() {
+        if (this.stores.length === 0 || !this.rowHeight) {
+            return;
+        }
+
+        const first = Math.floor(this.container.scrollTop / this.rowHeight);
+        const visible = Math.ceil(this.container.clientHeight / this.rowHeight) + 1;
+        const start = Math.max(0, first - this.buffer);
+        const end = Math.min(this.stores.length, first + visible + this.buffer);
+
+        // 필요한 만큼만 행 노드 유지
+        while (this.pool.length < end - start) {
+            const row = this.createRow();
+            this.pool.push(row);
+            this.spacer.appendChild(row);
+        }
+        while (this.pool.length > end - start) {
+            this.pool.pop().remove();
+        }
+
+        for (let index = start; index < end; index++) {
+            // 같은 인덱스는 항상 같은 노드에 두어 스크롤 중 바뀌는 행만 갱신
+            const row = this.pool[index % this.pool.length];
+            const store = this.stores[index];
+            if (row.store === store) {
+                continue;
+            }
+
+            row.store = store;
+            row.dataset.index = index;
+            row.dataset.id = store.id;
+            row.style.transform = `translateY(${index * this.rowHeight}px)`;
+            row.children[0].textContent = store.name;
+            row.children[1].textContent = formatDistance(store.distance);
+            row.children[2].textContent = store.category || '기타';
+        }
+    }
+}
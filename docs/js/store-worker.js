@@ -0,0 +1,276 @@
+// 가맹점 데이터 Web Worker
+//
+// 데이터 로드(다운로드/파싱/로컬 사본 갱신)와 필터링을 메인 스레드 밖에서 처리한다.
+// 메인 스레드(store-client.js)와는 아래 메시지로 통신한다.
+//
+//   요청: { id, type, payload }
+//   응답: { id, ok: true, result } 또는 { id, ok: false, error }
+//
+//   load   { manifest, dataBaseUrl, dataUrls }              → { totalStores, lastUpdated }
+//   filter { location, radius, category, types, query }     → { ids, distances, stores }
+//          ids(Int32Array) / distances(Float64Array)는 transferable로 전달하고,
+//          stores에는 메인 스레드에 아직 보내지 않은 가맹점 객체만 담는다.
+//   nearby { id }                                          → { stores }
+//          미리 계산한 주변 가맹점 (가까운 순, 기준 가맹점과의 거리 포함)
+
+importScripts('config.js', 'utils.js', 'binary.js', 'store-cache.js', 'filter.js', 'nearby.js');
+
+class StoreLoader {
+    /**
+     * @param {Object} options - { manifest, dataBaseUrl, dataUrls } (URL은 절대 경로)
+     */
+    constructor(options) {
+        this.manifest = options.manifest;
+        this.dataBaseUrl = options.dataBaseUrl;
+        this.dataUrls = options.dataUrls;
+        this.storeData = null;
+    }
+
+    /**
+     * 가맹점 데이터 로드 (로컬 사본 → stores.bin → stores.json)
+     * @returns {Promise<StoreTable>}
+     */
+    async load() {
+        const cachedTable = await this.loadCachedStoreData();
+        const table = cachedTable ||
+            await this.loadBinaryStoreData() ||
+            await this.loadJsonStoreData();
+
+        // 전체 다운로드한 경우 다음 방문을 위해 로컬 사본 저장
+        if (!cachedTable) {
+            setTimeout(() => this.saveStoreCache(table), 0);
+        }
+
+        return table;
+    }
+
+    /**
+     * 로컬 사본(IndexedDB)에서 가맹점 데이터 로드
+     * 버전이 다르면 manifest의 패치 체인을 받아 적용
+     * @returns {Promise<StoreTable|null>} 사용할 수 없으면 null (전체 다운로드)
+     */
+    async loadCachedStoreData() {
+        if (!this.manifest || !this.manifest.dataVersion || !storeCache.isSupported()) {
+            return null;
+        }
+
+        try {
+            const local = await storeCache.load();
+            if (!local) {
+                return null;
+            }
+
+            let stores = local.stores;
+            if (local.version !== this.manifest.dataVersion) {
+                const chain = resolvePatchChain(
+                    this.manifest.patches || [],
+                    local.version,
+                    this.manifest.dataVersion,
+                    CONFIG.MAX_PATCH_CHAIN
+                );
+                if (!chain) {
+                    return null;
+                }
+
+                for (const entry of chain) {
+                    const response = await fetch(this.dataBaseUrl + entry.file);
+                    if (!response.ok) {
+                        return null;
+                    }
+                    stores = applyStorePatch(stores, await response.json());
+                }
+
+                await storeCache.save({
+                    version: this.manifest.dataVersion,
+                    lastUpdated: this.manifest.lastUpdated,
+                    stores: stores
+                });
+                console.log(`패치 ${chain.length}개 적용 완료`);
+            }
+
+            this.storeData = {
+                lastUpdated: this.manifest.lastUpdated,
+                totalStores: stores.length
+            };
+            return StoreTable.fromStores(stores, this.manifest.lastUpdated);
+        } catch (error) {
+            console.warn('로컬 데이터 로드 실패, 전체 다운로드:', error);
+            return null;
+        }
+    }
+
+    /**
+     * 로컬 사본(IndexedDB) 저장
+     * @param {StoreTable} table - 가맹점 테이블
+     */
+    async saveStoreCache(table) {
+        if (!this.manifest || !this.manifest.dataVersion || !storeCache.isSupported()) {
+            return;
+        }
+
+        try {
+            await storeCache.save({
+                version: this.manifest.dataVersion,
+                lastUpdated: this.manifest.lastUpdated,
+                stores: table.toStores()
+            });
+        } catch (error) {
+            console.warn('로컬 데이터 저장 실패:', error);
+        }
+    }
+
+    /**
+     * 바이너리 가맹점 데이터 로드 (stores.bin)
+     * @returns {Promise<StoreTable|null>} 파일이 없으면 null
+     */
+    async loadBinaryStoreData() {
+        if (!this.dataUrls.binary) {
+            return null;
+        }
+
+        try {
+            const response = await fetch(this.dataUrls.binary);
+            if (!response.ok) {
+                return null;
+            }
+
+            const table = StoreTable.fromArrayBuffer(await response.arrayBuffer());
+            this.storeData = {
+                lastUpdated: table.lastUpdated,
+                totalStores: table.length
+            };
+            return table;
+        } catch (error) {
+            console.warn('바이너리 데이터 로드 실패, JSON 사용:', error);
+            return null;
+        }
+    }
+
+    /**
+     * JSON 가맹점 데이터 로드 (stores.json)
+     * @returns {Promise<StoreTable>}
+     */
+    async loadJsonStoreData() {
+        const response = await fetch(this.dataUrls.stores);
+        if (!response.ok) {
+            throw new Error('데이터 로드 실패');
+        }
+
+        const data = await response.json();
+        this.storeData = {
+            lastUpdated: data.lastUpdated,
+            totalStores: data.stores.length
+        };
+        return StoreTable.fromStores(data.stores, data.lastUpdated);
+    }
+}
+
+// 데이터 로드가 끝날 때까지 필터 요청은 대기
+let ready = Promise.resolve();
+
+// 메인 스레드에 이미 보낸 가맹점 ID (객체는 한 번만 전달)
+let sentIds = new Set();
+
+// 주변 가맹점 목록 (manifest에 없으면 null)
+let nearbyIndex = null;
+
+const handlers = {
+    /**
+     * 데이터 로드
+     * @param {Object} payload - { manifest, dataBaseUrl, dataUrls }
+     * @returns {Promise<Object>} { totalStores, lastUpdated }
+     */
+    async load(payload) {
+        const loader = new StoreLoader(payload);
+        nearbyIndex = payload.dataUrls.nearby
+            ? new NearbyIndex(payload.dataUrls.nearby, payload.dataBaseUrl)
+            : null;
+        ready = loader.load().then(table => {
+            filterManager.setStoreTable(table);
+            sentIds = new Set();
+        });
+        await ready;
+        return loader.storeData;
+    },
+
+    /**
+     * 필터 적용
+     * @param {Object} payload - { location, radius, category, types, query }
+     * @returns {Promise<Object>} { ids, distances, stores }
+     */
+    async filter(payload) {
+        await ready;
+
+        // 위치/반경이 그대로면 FilterManager의 거리순 후보 캐시를 재사용
+        filterManager.selectedRadius = payload.radius;
+        filterManager.selectedCategory = payload.category;
+        filterManager.selectedTypes = payload.types;
+        if (payload.location) {
+            filterManager.userLocation = payload.location;
+
+            // 현재 위치 샤드를 미리 받아 상세 Dialog를 바로 열 수 있게 함
+            if (nearbyIndex) {
+                nearbyIndex.loadShard(payload.location.lat, payload.location.lng).catch(() => {});
+            }
+        }
+        filterManager.applyFilters();
+
+        const results = filterManager.searchStores(payload.query);
+        const ids = new Int32Array(results.length);
+        const distances = new Float64Array(results.length);
+        const stores = [];
+        results.forEach((store, i) => {
+            ids[i] = store.id;
+            distances[i] = store.distance;
+            if (!sentIds.has(store.id)) {
+                sentIds.add(store.id);
+                stores.push(store);
+            }
+        });
+
+        return { ids, distances, stores };
+    },
+
+    /**
+     * 주변 가맹점
+     * @param {Object} payload - { id }
+     * @returns {Promise<Object>} { stores } (주변 가맹점 목록이 없으면 빈 배열)
+     */
+    async nearby(payload) {
+        await ready;
+
+        const table = filterManager.storeTable;
+        const row = table.indexOfId(payload.id);
+        if (!nearbyIndex || row === -1) {
+            return { stores: [] };
+        }
+
+        const store = table.getStore(row);
+        const ids = await nearbyIndex.neighbors(store);
+        const stores = [];
+        ids.forEach(id => {
+            const neighborRow = table.indexOfId(id);
+            if (neighborRow !== -1) {
+                const neighbor = table.getStore(neighborRow);
+                stores.push({
+                    ...neighbor,
+                    distance: calculateDistance(store.lat, store.lng, neighbor.lat, neighbor.lng)
+                });
+            }
+        });
+        return { stores };
+    }
+};
+
+self.onmessage = async (event) => {
+    const { id, type, payload } = event.data;
+
+    try {
+        const result = await handlers[type](payload);
+        const transfer = result && result.ids ? [result.ids.buffer, result.distances.buffer] : [];
+        self.postMessage({ id, ok: true, result }, transfer);
+    } catch (error) {
+        console.error(`Worker 요청 실패 (${type}):`, error);
+        self.postMessage({ id, ok: false, error: error.message });
+    }
+};
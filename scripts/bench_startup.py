@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CLI 시작 시간 벤치마크
+
+각 명령을 새 프로세스로 여러 번 실행해 중앙값을 비교합니다.
+
+- import fetch_data / geocode / generate_json: 단계 스크립트를 따로 실행할 때 드는 import 비용
+- onnuri.py --help: 무거운 모듈 없이 CLI만 시작
+- onnuri.py all (최신): 모든 단계의 출력이 입력보다 새로워 전부 건너뛰는 경우
+  (--offline으로 원본 다운로드 요청은 제외)
+
+사용 예:
+    python scripts/bench_startup.py
+    python scripts/bench_startup.py --repeat 20
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+import tempfile
+import statistics
+import subprocess
+
+from onnuri import STAGES, SCRIPTS_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def measure(command, repeat, cwd=None):
+    """
+    명령 실행 시간 측정
+
+    Args:
+        command: 실행할 명령 (목록)
+        repeat: 반복 횟수
+        cwd: 작업 폴더
+
+    Returns:
+        float: 중앙값 (ms)
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def make_up_to_date_tree(root):
+    """
+    모든 단계가 최신인 가짜 data 폴더 생성 (원본 → 단계 순서대로 수정 시각 증가)
+
+    Args:
+        root: 작업 폴더
+    """
+    now = time.time()
+    files = [('data/raw/source.xlsx', 0)]
+    for i, stage in enumerate(STAGES.values(), start=1):
+        files.extend((output, i) for output in stage['outputs'])
+
+    for path, i in files:
+        path = os.path.join(root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, 'w').close()
+        os.utime(path, (now - len(STAGES) + i, now - len(STAGES) + i))
+
+def main():
+    """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='CLI 시작 시간 벤치마크')
+    parser.add_argument('--repeat', type=int, default=10, help='반복 횟수')
+    args = parser.parse_args()
+
+    cli = os.path.join(SCRIPTS_DIR, 'onnuri.py')
+    results = {}
+
+    for module in ('fetch_data', 'geocode', 'generate_json'):
+        command = [sys.executable, '-c', f"import sys; sys.path.insert(0, {SCRIPTS_DIR!r}); import {module}"]
+        results[f"import {module}"] = measure(command, args.repeat)
+
+    results['onnuri.py --help'] = measure([sys.executable, cli, '--help'], args.repeat)
+
+    with tempfile.TemporaryDirectory() as root:
+        make_up_to_date_tree(root)
+        results['onnuri.py all (최신)'] = measure([sys.executable, cli, 'all', '--offline'], args.repeat, cwd=root)
+
+    logger.info("=" * 60)
+    for name, elapsed in results.items():
+        logger.info(f"{name:<28} {elapsed:8.1f}ms")
+    logger.info("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+store_query 벤치마크
+
+가상의 전국 가맹점(기본 200,000개)과 기준점(기본 10,000개)으로
+반경 검색과 k-최근접 검색 시간을 측정하고, 전수 계산 결과와 일치하는지 확인합니다.
+빌드 시 주변 가맹점 목록(StoreIndex.knn_self) 계산 시간도 측정합니다.
+
+사용 예:
+    python scripts/bench_store_query.py
+    python scripts/bench_store_query.py --stores 50000 --points 1000
+"""
+
+import math
+import time
+import argparse
+import logging
+
+import numpy as np
+
+from store_query import StoreIndex, haversine
+
+logger = logging.getLogger(__name__)
+
+# 주요 도시 중심 (가상 데이터 밀집 지역)
+CITY_CENTERS = [
+    (37.5665, 126.9780),  # 서울
+    (35.1796, 129.0756),  # 부산
+    (35.8714, 128.6014),  # 대구
+    (37.4563, 126.7052),  # 인천
+    (35.1595, 126.8526),  # 광주
+    (36.3504, 127.3845),  # 대전
+    (35.5384, 129.3114),  # 울산
+]
+
+
+def js_calculate_distance(lat1, lng1, lat2, lng2):
+    """docs/js/utils.js calculateDistance를 그대로 옮긴 함수 (비교용)"""
+    R = 6371e3
+    phi1 = lat1 * math.pi / 180
+    phi2 = lat2 * math.pi / 180
+    d_phi = (lat2 - lat1) * math.pi / 180
+    d_lambda = (lng2 - lng1) * math.pi / 180
+
+    a = (math.sin(d_phi / 2) * math.sin(d_phi / 2) +
+         math.cos(phi1) * math.cos(phi2) *
+         math.sin(d_lambda / 2) * math.sin(d_lambda / 2))
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return R * c
+
+
+def generate_points(n, rng):
+    """도시 주변에 몰린 가상 좌표 생성 (절반은 도시, 절반은 전국 균등)"""
+    n_city = n // 2
+    centers = np.array(CITY_CENTERS)[rng.integers(0, len(CITY_CENTERS), n_city)]
+    city = centers + rng.normal(0, 0.08, (n_city, 2))
+    rural = np.column_stack([
+        rng.uniform(34.5, 38.3, n - n_city),
+        rng.uniform(126.2, 129.4, n - n_city)
+    ])
+    points = np.vstack([city, rural])
+    return points[:, 0], points[:, 1]
+
+
+def timed(label, func):
+    """실행 시간 측정"""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    logger.info(f"{label}: {elapsed:.2f}초")
+    return result, elapsed
+
+
+def main():
+    """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='store_query 벤치마크')
+    parser.add_argument('--stores', type=int, default=200_000, help='가맹점 수')
+    parser.add_argument('--points', type=int, default=10_000, help='기준점 수')
+    parser.add_argument('--k', type=int, default=10, help='최근접 개수')
+    parser.add_argument('--check', type=int, default=200, help='전수 비교할 기준점 수')
+    parser.add_argument('--nearby-radius', type=float, default=1000, help='주변 가맹점 반경 (미터)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    store_lat, store_lng = generate_points(args.stores, rng)
+    query_lat, query_lng = generate_points(args.points, rng)
+
+    index, _ = timed(f"인덱스 생성 ({args.stores:,}개)", lambda: StoreIndex(store_lat, store_lng))
+
+    results = {}
+    for radius in (1000, 3000, 5000):
+        results[radius], elapsed = timed(
+            f"반경 {radius / 1000:.0f}km 검색 ({args.points:,}개 기준점)",
+            lambda: index.query_radius(query_lat, query_lng, radius)
+        )
+        found = np.mean([len(rows) for rows, _ in results[radius]])
+        logger.info(f"  평균 {found:.1f}개, {args.points / elapsed:,.0f} 쿼리/초")
+
+    knn, elapsed = timed(
+        f"k={args.k} 최근접 검색 ({args.points:,}개 기준점)",
+        lambda: index.query_knn(query_lat, query_lng, args.k)
+    )
+    logger.info(f"  {args.points / elapsed:,.0f} 쿼리/초")
+
+    # 전체 가맹점의 주변 가맹점 (generate_json.py의 nearby.json)
+    nearby_index = StoreIndex(store_lat, store_lng, cell_size=np.degrees(args.nearby_radius / 6371e3))
+    (nearby, nearby_distances), _ = timed(
+        f"전체 주변 가맹점 k={args.k}, 반경 {args.nearby_radius:.0f}m ({args.stores:,}개)",
+        lambda: nearby_index.knn_self(args.k, args.nearby_radius)
+    )
+    logger.info(f"  평균 {np.isfinite(nearby_distances).sum(axis=1).mean():.1f}개")
+
+    # 전수 계산과 비교
+    lat_rad, lng_rad = np.radians(store_lat), np.radians(store_lng)
+    mismatches = 0
+    for i in range(min(args.check, args.points)):
+        distances = haversine(np.radians(query_lat[i]), np.radians(query_lng[i]), lat_rad, lng_rad)
+
+        expected = set(np.flatnonzero(distances <= 3000))
+        if set(results[3000][i][0]) != expected:
+            mismatches += 1
+
+        expected_knn = np.sort(distances)[:args.k]
+        if not np.allclose(knn[i][1], expected_knn):
+            mismatches += 1
+
+    for i in rng.choice(args.stores, min(args.check, args.stores), replace=False):
+        distances = haversine(lat_rad[i], lng_rad[i], lat_rad, lng_rad)
+        distances[i] = np.inf
+        expected = np.sort(distances[distances <= args.nearby_radius])[:args.k]
+        found = nearby_distances[i][np.isfinite(nearby_distances[i])]
+        if not np.allclose(found, expected):
+            mismatches += 1
+
+    # 프론트엔드 공식과 비교
+    max_error = 0.0
+    for i in range(min(args.check, args.points)):
+        rows, distances = results[5000][i]
+        for row, distance in zip(rows[:5], distances[:5]):
+            js = js_calculate_distance(query_lat[i], query_lng[i], store_lat[row], store_lng[row])
+            max_error = max(max_error, abs(js - distance))
+
+    logger.info("=" * 60)
+    logger.info(f"전수 비교 불일치: {mismatches}건 ({args.check}개 기준점 + 가맹점)")
+    logger.info(f"calculateDistance 대비 최대 오차: {max_error:.6f}m")
+    logger.info("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
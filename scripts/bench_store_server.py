@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+store_server 부하 테스트
+
+가상의 가맹점(기본 200,000개)으로 stores.bin을 만들어 서버를 띄우고
+여러 스레드에서 검색 요청을 보내 QPS와 응답 시간을 측정합니다.
+--url을 주면 이미 실행 중인 서버에 요청합니다.
+
+사용 예:
+    python scripts/bench_store_server.py
+    python scripts/bench_store_server.py --url http://127.0.0.1:8000 --requests 5000
+"""
+
+import os
+import time
+import tempfile
+import argparse
+import threading
+import logging
+import urllib.request
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bench_store_query import generate_points
+from store_binary import encode_stores
+from store_server import StoreSearch, create_server
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ['음식점', '식료품', '의류', '생활용품', '기타']
+TYPE_CHOICES = [['card', 'paper', 'mobile'], ['paper'], ['card', 'mobile'], ['paper', 'mobile']]
+
+
+def generate_stores(n, rng):
+    """가상 가맹점 생성"""
+    lat, lng = generate_points(n, rng)
+    categories = rng.integers(0, len(CATEGORIES), n)
+    types = rng.integers(0, len(TYPE_CHOICES), n)
+    return [
+        {
+            'id': i + 1,
+            'name': f"가게{i}",
+            'address': f"주소 {i}",
+            'lat': float(lat[i]),
+            'lng': float(lng[i]),
+            'category': CATEGORIES[categories[i]],
+            'types': TYPE_CHOICES[types[i]],
+            'market': f"시장{i % 500}"
+        }
+        for i in range(n)
+    ]
+
+
+def generate_queries(n, rng, hot_ratio=0.3):
+    """
+    검색 요청 생성 (hot_ratio만큼은 같은 위치를 반복해 캐시 적중 확인)
+
+    Returns:
+        list: 쿼리 문자열 목록
+    """
+    lat, lng = generate_points(n, rng)
+    hot = max(1, n // 100)
+    queries = []
+    for i in range(n):
+        j = i % hot if rng.random() < hot_ratio else i
+        params = {'lat': f"{lat[j]:.5f}", 'lng': f"{lng[j]:.5f}",
+                  'radius': int(rng.choice([500, 1000, 3000]))}
+        if rng.random() < 0.3:
+            params['category'] = CATEGORIES[rng.integers(0, len(CATEGORIES))]
+        if rng.random() < 0.3:
+            params['types'] = 'paper'
+        if rng.random() < 0.1:
+            params['q'] = f"시장{rng.integers(0, 500)}"
+        queries.append(urlencode(params))
+    return queries
+
+
+def run_load(base_url, queries, concurrency):
+    """
+    동시 요청 실행
+
+    Returns:
+        tuple: (응답 시간 목록(초), 전체 시간(초), 캐시 적중 수)
+    """
+    latencies = []
+    hits = [0]
+    lock = threading.Lock()
+
+    def request(query):
+        start = time.perf_counter()
+        with urllib.request.urlopen(f"{base_url}/stores?{query}", timeout=30) as response:
+            response.read()
+            cached = response.headers.get('X-Cache') == 'HIT'
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            hits[0] += cached
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(request, queries))
+    return latencies, time.perf_counter() - start, hits[0]
+
+
+def main():
+    """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='store_server 부하 테스트')
+    parser.add_argument('--url', help='실행 중인 서버 주소 (없으면 가상 데이터로 서버 실행)')
+    parser.add_argument('--stores', type=int, default=200_000, help='가상 가맹점 수')
+    parser.add_argument('--requests', type=int, default=2000, help='요청 수')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 요청 수')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    server = None
+    base_url = args.url
+
+    if not base_url:
+        path = os.path.join(tempfile.mkdtemp(), 'stores.bin')
+        with open(path, 'wb') as f:
+            f.write(encode_stores(generate_stores(args.stores, rng), 'bench'))
+
+        server = create_server(StoreSearch.load(path), port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+    queries = generate_queries(args.requests, rng)
+    latencies, elapsed, hits = run_load(base_url, queries, args.concurrency)
+    latencies = np.array(latencies) * 1000
+
+    logger.info("=" * 60)
+    logger.info(f"요청 {len(latencies)}건 / {elapsed:.2f}초 (동시 {args.concurrency})")
+    logger.info(f"QPS: {len(latencies) / elapsed:,.0f}")
+    logger.info(
+        f"응답 시간: p50 {np.percentile(latencies, 50):.1f}ms, "
+        f"p95 {np.percentile(latencies, 95):.1f}ms, p99 {np.percentile(latencies, 99):.1f}ms"
+    )
+    logger.info(f"캐시 적중: {hits}건 ({hits / len(latencies) * 100:.1f}%)")
+    logger.info("=" * 60)
+
+    if server:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계 캐시 확인
+
+임시 폴더에 가상의 geocoded_stores.csv를 만들고 generate 단계를 세 번 실행해
+같은 입력으로 다시 실행하면 건너뛰거나 캐시에서 복원하는지 확인합니다.
+
+1. 처음 실행: 'ran'
+2. 그대로 다시 실행: 'skipped' (출력이 입력보다 새로움)
+3. 내용은 같고 mtime만 바뀐 CSV로 실행: 'restored' (캐시 키가 같음)
+
+generate는 data/store_ids.json을 읽고 다시 쓰므로, 캐시 키를 실행 전 내용으로 계산하면
+3번이 다시 실행됩니다.
+
+사용 예:
+    python scripts/check_stage_cache.py
+    python scripts/check_stage_cache.py --stores 1000
+"""
+
+import os
+import sys
+import csv
+import time
+import random
+import argparse
+import logging
+import tempfile
+
+from onnuri import run_stage
+from stage_cache import StageCache
+
+logger = logging.getLogger(__name__)
+
+EXPECTED = ['ran', 'skipped', 'restored']
+
+
+def write_sample_csv(path, count, seed=0):
+    """
+    가상 가맹점 CSV 생성 (geocode 단계 출력 형식)
+
+    Args:
+        path: 저장 경로
+        count: 가맹점 수
+        seed: 난수 시드
+    """
+    rng = random.Random(seed)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['name', 'address', 'lat', 'lng', 'category', 'types', 'market'])
+        for i in range(count):
+            writer.writerow([
+                f"가게{i}",
+                f"서울특별시 종로구 종로 {i}",
+                37.57 + rng.uniform(-0.05, 0.05),
+                126.98 + rng.uniform(-0.05, 0.05),
+                rng.choice(['음식점', '식료품', '기타']),
+                "['card', 'paper']",
+                rng.choice(['광장시장', '통인시장'])
+            ])
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='generate 단계 캐시 확인')
+    parser.add_argument('--stores', type=int, default=300, help='가상 가맹점 수')
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    results = []
+    with tempfile.TemporaryDirectory() as root:
+        csv_file = os.path.join(root, 'data', 'raw', 'geocoded_stores.csv')
+        write_sample_csv(csv_file, args.stores)
+
+        os.chdir(root)
+        try:
+            cache = StageCache('data/cache')
+            results.append(run_stage('generate', cache=cache))
+            results.append(run_stage('generate', cache=cache))
+
+            # 원본을 다시 받은 것처럼 mtime만 바꿈
+            later = time.time() + 10
+            os.utime(csv_file, (later, later))
+            results.append(run_stage('generate', cache=cache))
+        finally:
+            os.chdir(cwd)
+
+    logger.info("=" * 60)
+    for expected, result in zip(EXPECTED, results):
+        logger.info(f"기대 {expected:<10} 결과 {result:<10} {'OK' if expected == result else '실패'}")
+    logger.info("=" * 60)
+
+    if results != EXPECTED:
+        logger.error("같은 입력으로 다시 실행했는데 건너뛰거나 복원하지 않았습니다.")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유사 중복 가맹점 탐지 및 병합
+
+전체 쌍을 비교(O(n²))하지 않고 후보를 블록으로 나눈 뒤 블록 안에서만 비교합니다.
+
+- Geocoding 전: 정규화한 주소 앞부분(시/도 + 시/군/구 + 동/로)으로 블로킹
+- Geocoding 후: 좌표 격자 셀로 블로킹 (지번/도로명 주소로 따로 올라온 같은 가게)
+
+블록 안에서는 정규화한 가맹점명으로 정렬한 뒤 가까운 이웃(window)끼리만
+문자열 유사도를 비교하므로(sorted neighborhood) 전체 비용이 거의 선형입니다.
+"""
+
+import os
+import re
+import unicodedata
+import logging
+from difflib import SequenceMatcher
+
+import numpy as np
+import pandas as pd
+
+from regions import PROVINCE_ALIASES
+
+logger = logging.getLogger(__name__)
+
+# 주소 블록을 끝내는 토큰 (동/리/가/로/길)
+_LOCALITY_SUFFIX = re.compile(r'(동|리|가|로|길)$')
+_PARENTHESES = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+_DIGITS = re.compile(r'\d+')
+
+
+def normalize_name(name):
+    """
+    비교용 가맹점명 정규화 (NFKC, 소문자, 괄호 내용/공백 제거)
+
+    괄호 안의 숫자는 남깁니다. "삼성수산(2)"는 "삼성수산"과 다른 가게입니다.
+
+    Args:
+        name: 가맹점명
+
+    Returns:
+        str: 정규화된 가맹점명
+    """
+    if name is None or (isinstance(name, float) and np.isnan(name)):
+        return ''
+    text = unicodedata.normalize('NFKC', str(name)).lower()
+    text = _PARENTHESES.sub(lambda match: ''.join(_DIGITS.findall(match.group())), text)
+    return re.sub(r'[\s\-_.,·]+', '', text)
+
+
+def normalize_address(address):
+    """
+    주소 정규화 (NFKC, 공백 정리, 시/도 이름 통일)
+
+    Args:
+        address: 주소 문자열
+
+    Returns:
+        str: 정규화된 주소
+    """
+    if address is None or (isinstance(address, float) and np.isnan(address)):
+        return ''
+    tokens = unicodedata.normalize('NFKC', str(address)).split()
+    if tokens:
+        tokens[0] = PROVINCE_ALIASES.get(tokens[0], tokens[0])
+    return ' '.join(tokens)
+
+
+def address_block_key(address):
+    """
+    주소 블록 키 (시/도 + 시/군/구 + 첫 동/리/가/로/길까지)
+
+    Args:
+        address: 주소 문자열
+
+    Returns:
+        str: 블록 키 (주소가 없으면 '')
+    """
+    tokens = normalize_address(address).split()
+    for i, token in enumerate(tokens[1:], start=1):
+        if _LOCALITY_SUFFIX.search(token):
+            return ' '.join(tokens[:i + 1])
+    return ' '.join(tokens[:3])
+
+
+class DuplicateDetector:
+    """블로킹 기반 유사 중복 가맹점 탐지 클래스"""
+
+    def __init__(self, threshold=0.85, window=5, cell_size=0.0005):
+        """
+        Args:
+            threshold: 가맹점명 유사도 기준 (0~1)
+            window: 정렬 후 비교할 이웃 수
+            cell_size: 좌표 블로킹 격자 크기 (도, 0.0005 ≈ 50m)
+        """
+        self.threshold = threshold
+        self.window = window
+        self.cell_size = cell_size
+
+        # 병합 기록 (유지한 행, 제거한 행)
+        self.merged = []
+
+        self.stats = {
+            'blocks': 0,
+            'comparisons': 0,
+            'duplicates': 0
+        }
+
+    def is_similar(self, a, b):
+        """
+        정규화된 가맹점명 유사 여부
+
+        같은 이름, 유사도 기준 이상, 또는 한쪽이 다른 쪽 + 'OO점'(지점명)이면 중복으로 봅니다.
+        숫자가 다르면("제일수산1호점" / "제일수산2호점") 전통시장에서는 다른 가게이므로 중복이 아닙니다.
+
+        Args:
+            a, b: normalize_name 결과
+
+        Returns:
+            bool
+        """
+        if not a or not b:
+            return False
+        if a == b:
+            return True
+        if _DIGITS.findall(a) != _DIGITS.findall(b):
+            return False
+
+        shorter, longer = (a, b) if len(a) <= len(b) else (b, a)
+        if len(shorter) >= 3 and longer.startswith(shorter) and longer.endswith('점'):
+            return True
+
+        # 길이 차이가 크면 유사도 계산 생략
+        if len(shorter) / len(longer) < self.threshold:
+            return False
+        matcher = SequenceMatcher(None, a, b)
+        return (matcher.real_quick_ratio() >= self.threshold and
+                matcher.quick_ratio() >= self.threshold and
+                matcher.ratio() >= self.threshold)
+
+    def _find(self, parent, i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _match_blocks(self, names, block_keys, parent):
+        """
+        블록별 sorted neighborhood 비교 후 union-find로 묶기
+
+        Args:
+            names: 정규화된 가맹점명 (위치 기반 배열)
+            block_keys: 블록 키 Series (위치 기반, 빈 값은 비교 제외)
+            parent: union-find 부모 배열
+        """
+        keys = pd.Series(block_keys.to_numpy())
+        positions = np.flatnonzero((keys.notna() & (keys != '')).to_numpy())
+        if len(positions) < 2:
+            return
+
+        # 같은 블록끼리 모이도록 정렬한 뒤 2개 이상인 구간만 비교
+        codes, _ = pd.factorize(keys.iloc[positions])
+        order = np.argsort(codes, kind='stable')
+        positions, codes = positions[order], codes[order]
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate([[0], boundaries])
+        ends = np.concatenate([boundaries, [len(codes)]])
+        multi = (ends - starts) >= 2
+
+        for start, end in zip(starts[multi], ends[multi]):
+            block = positions[start:end]
+            self.stats['blocks'] += 1
+
+            ordered = sorted(block, key=lambda p: names[p])
+            for i, a in enumerate(ordered):
+                for b in ordered[i + 1:i + 1 + self.window]:
+                    self.stats['comparisons'] += 1
+                    if self.is_similar(names[a], names[b]):
+                        root_a, root_b = self._find(parent, a), self._find(parent, b)
+                        if root_a != root_b:
+                            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    def _merge(self, df, parent):
+        """
+        중복 그룹을 하나로 병합 (값이 가장 많은 행을 남기고 빈 값을 채움)
+
+        Args:
+            df: DataFrame
+            parent: union-find 부모 배열
+
+        Returns:
+            pd.DataFrame: 병합된 DataFrame
+        """
+        roots = np.array([self._find(parent, i) for i in range(len(df))])
+        duplicated = pd.Series(roots).duplicated(keep=False).to_numpy()
+        if not duplicated.any():
+            return df
+
+        # 그룹마다 값이 가장 많은 행이 맨 앞에 오도록 정렬
+        positions = np.flatnonzero(duplicated)
+        filled = df.iloc[positions].notna().sum(axis=1).to_numpy()
+        order = np.lexsort((positions, -filled, roots[positions]))
+        positions, group_roots = positions[order], roots[positions][order]
+        is_keep = np.concatenate([[True], group_roots[1:] != group_roots[:-1]])
+
+        # 그룹별 첫 번째 비어있지 않은 값 = 남길 행에 나머지 행 값을 차례로 채운 결과
+        merged = df.iloc[positions].groupby(group_roots, sort=False).first()
+        keep_positions = positions[is_keep]
+
+        df = df.copy()
+        for j, column in enumerate(df.columns):
+            if column in merged.columns:
+                df.iloc[keep_positions, j] = merged[column].to_numpy()
+
+        keep_of_group = dict(zip(group_roots[is_keep], keep_positions))
+        drop_positions = positions[~is_keep]
+        for p, root in zip(drop_positions, group_roots[~is_keep]):
+            self.merged.append((df.index[keep_of_group[root]], df.index[p]))
+
+        self.stats['duplicates'] += len(drop_positions)
+        keep_mask = np.ones(len(df), dtype=bool)
+        keep_mask[drop_positions] = False
+        return df[keep_mask]
+
+    def dedupe_by_address(self, df, name_column='name', address_columns=('address', 'roadAddress')):
+        """
+        주소 앞부분 블로킹으로 유사 중복 제거 (Geocoding 전)
+
+        Args:
+            df: DataFrame
+            name_column: 가맹점명 컬럼
+            address_columns: 블로킹에 쓸 주소 컬럼들 (컬럼별로 한 번씩 비교)
+
+        Returns:
+            pd.DataFrame: 중복이 병합된 DataFrame
+        """
+        if name_column not in df.columns or len(df) < 2:
+            return df
+
+        before = len(df)
+        names = df[name_column].map(normalize_name).to_numpy()
+        parent = list(range(len(df)))
+
+        for column in address_columns:
+            if column in df.columns:
+                self._match_blocks(names, df[column].map(address_block_key), parent)
+
+        df = self._merge(df, parent)
+        logger.info(f"유사 중복 제거 (주소 블록): {before - len(df)}개")
+        return df
+
+    def dedupe_by_location(self, df, name_column='name'):
+        """
+        좌표 격자 블로킹으로 유사 중복 제거 (Geocoding 후)
+
+        셀 경계에 걸친 쌍을 놓치지 않도록 반 칸 어긋난 격자로 한 번 더 비교합니다.
+
+        Args:
+            df: DataFrame (lat, lng 필요)
+            name_column: 가맹점명 컬럼
+
+        Returns:
+            pd.DataFrame: 중복이 병합된 DataFrame
+        """
+        if name_column not in df.columns or len(df) < 2:
+            return df
+
+        before = len(df)
+        names = df[name_column].map(normalize_name).to_numpy()
+        parent = list(range(len(df)))
+
+        lat = pd.to_numeric(df['lat'], errors='coerce').to_numpy() / self.cell_size
+        lng = pd.to_numeric(df['lng'], errors='coerce').to_numpy() / self.cell_size
+        valid = ~(np.isnan(lat) | np.isnan(lng))
+
+        for offset in (0.0, 0.5):
+            rows = np.floor(np.where(valid, lat, 0) + offset).astype(np.int64)
+            cols = np.floor(np.where(valid, lng, 0) + offset).astype(np.int64)
+            keys = pd.Series(rows * 10_000_000 + cols).where(valid)
+            self._match_blocks(names, keys, parent)
+
+        df = self._merge(df, parent)
+        logger.info(f"유사 중복 제거 (좌표 블록): {before - len(df)}개")
+        return df
+
+    def save_report(self, df_original, output_path='data/raw/duplicates.csv', name_column='name'):
+        """
+        병합 기록 저장 (검토용)
+
+        Args:
+            df_original: 병합 전 DataFrame
+            output_path: 출력 파일 경로
+            name_column: 가맹점명 컬럼
+        """
+        # 병합이 없어도 헤더만 있는 파일로 덮어써서 지난 실행의 기록이 남지 않게 함
+        columns = [c for c in (name_column, 'address', 'roadAddress') if c in df_original.columns]
+        rows = []
+        for kept, removed in self.merged:
+            row = {f'kept_{c}': df_original.at[kept, c] for c in columns}
+            row.update({f'removed_{c}': df_original.at[removed, c] for c in columns})
+            rows.append(row)
+
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        header = [f'{side}_{c}' for side in ('kept', 'removed') for c in columns]
+        pd.DataFrame(rows, columns=header).to_csv(output_path, index=False, encoding='utf-8-sig')
+        logger.info(f"중복 병합 기록 저장: {output_path} ({len(rows)}건)")
@@ -8,11 +8,20 @@
 
 import os
 import sys
+import json
+import time
+import base64
+import hashlib
 import requests
 import pandas as pd
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
+from dedup import DuplicateDetector
+from sources import source_files
+from profiling import record_time, run_main
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +30,27 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def read_source_file(filepath, column_mapping=None):
+    """
+    원본 파일 하나를 읽어 컬럼명 통일 (프로세스 풀 작업 함수)
+
+    Args:
+        filepath: Excel/CSV 파일 경로
+        column_mapping: 원본 컬럼명 → 통일 컬럼명
+
+    Returns:
+        pd.DataFrame: 가맹점 데이터
+    """
+    if filepath.endswith('.csv'):
+        df = pd.read_csv(filepath, encoding='utf-8-sig')
+    else:
+        df = pd.read_excel(filepath, engine='openpyxl' if filepath.endswith('.xlsx') else None)
+
+    if column_mapping:
+        df = df.rename(columns={k: v for k, v in column_mapping.items() if k in df.columns})
+    return df
+
+
 class OnnuriDataFetcher:
     """온누리 상품권 가맹점 데이터 수집 클래스"""
 
@@ -28,85 +58,272 @@ class OnnuriDataFetcher:
     # 실제 URL은 data.go.kr에서 확인 필요
     DATA_URL = "https://www.data.go.kr/cmm/cmm/fileDownload.do?atchFileId=FILE_000000002951466&fileDetailSn=1"
 
+    # 컬럼명 매핑 (실제 데이터 구조에 맞게 수정 필요)
+    COLUMN_MAPPING = {
+        '가맹점명': 'name',
+        '소재지도로명주소': 'roadAddress',
+        '소재지지번주소': 'address',
+        '시장명': 'market',
+        '업종': 'category',
+        '취급품목': 'subCategory',
+        '전화번호': 'phone'
+    }
+
+    # 다운로드 파일 이름 (매주 같은 파일을 덮어써서 load_data가 지난 파일과 섞지 않게 함)
+    DOWNLOAD_FILENAME = 'onnuri_stores.xlsx'
+
+    # 스트리밍 단위 (바이트)
+    CHUNK_SIZE = 1 << 20
+
     def __init__(self, output_dir='data/raw'):
         """
         Args:
             output_dir: 다운로드한 파일을 저장할 디렉토리
         """
         self.output_dir = output_dir
+        self.state_file = os.path.join(output_dir, 'download_state.json')
         os.makedirs(output_dir, exist_ok=True)
 
-    def download_data(self):
+    def load_download_state(self):
+        """
+        이전 다운로드 정보 로드 (ETag, Last-Modified, 체크섬 등)
+
+        Returns:
+            dict: 다운로드 정보 (없으면 빈 dict)
+        """
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"다운로드 정보 로드 실패: {e}")
+        return {}
+
+    def save_download_state(self, state):
+        """다운로드 정보 저장"""
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def _file_sha256(filepath, chunk_size=1 << 20):
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest
+
+    @staticmethod
+    def _expected_sha256(response):
+        """
+        응답 헤더의 SHA-256 (Repr-Digest / Digest, 없으면 None)
+
+        Returns:
+            str: 16진수 해시 또는 None
+        """
+        for header in ('Repr-Digest', 'Digest'):
+            for item in response.headers.get(header, '').split(','):
+                name, _, value = item.strip().partition('=')
+                if name.lower() == 'sha-256' and value:
+                    try:
+                        return base64.b64decode(value.strip(':')).hex()
+                    except ValueError:
+                        return None
+        return None
+
+    def download_data(self, url=None, expected_sha256=None):
         """
         공공데이터포털에서 데이터 파일 다운로드
 
+        - 이전 응답의 ETag / Last-Modified로 조건부 요청 (바뀌지 않았으면 304로 끝)
+        - 파일에 바로 나눠 쓰기 (메모리에 전체를 올리지 않음)
+        - 끊긴 다운로드는 .part 파일에서 Range 요청으로 이어받기
+        - SHA-256 확인 (expected_sha256 또는 응답의 Digest 헤더) 및 속도 기록
+
+        Args:
+            url: 다운로드 URL (None이면 ONNURI_DATA_URL 환경 변수, 없으면 DATA_URL)
+            expected_sha256: 기대하는 파일 SHA-256 (16진수)
+
         Returns:
-            str: 다운로드한 파일 경로
+            str: 다운로드한 파일 경로 (실패 시 None, data/raw의 기존 파일은 그대로)
         """
+        url = url or os.getenv('ONNURI_DATA_URL') or self.DATA_URL
+        filepath = os.path.join(self.output_dir, self.DOWNLOAD_FILENAME)
+        part_file = f"{filepath}.part"
+
         logger.info("온누리 상품권 가맹점 데이터 다운로드 시작...")
 
-        # 수동 다운로드 안내
-        logger.warning("=" * 60)
-        logger.warning("자동 다운로드가 제한될 수 있습니다.")
-        logger.warning("다음 단계를 수행해주세요:")
-        logger.warning("")
-        logger.warning("1. https://www.data.go.kr/data/3060079/fileData.do 접속")
-        logger.warning("2. '파일 데이터' 탭에서 최신 파일 다운로드")
-        logger.warning("3. 다운로드한 파일을 data/raw/ 폴더로 이동")
-        logger.warning("4. 파일명을 확인하고 load_data() 함수에서 경로 수정")
-        logger.warning("=" * 60)
+        state = self.load_download_state()
+        validators = state if state.get('url') == url else {}
 
         # 자동 다운로드 시도 (작동하지 않을 수 있음)
         try:
-            response = requests.get(self.DATA_URL, timeout=30)
-            response.raise_for_status()
-
-            # 파일명 생성
-            timestamp = datetime.now().strftime('%Y%m%d')
-            filename = f'onnuri_stores_{timestamp}.xlsx'
-            filepath = os.path.join(self.output_dir, filename)
-
-            # 파일 저장
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-
-            logger.info(f"다운로드 완료: {filepath}")
+            headers = {}
+            offset = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+
+            if offset and (validators.get('partial_etag') or validators.get('partial_last_modified')):
+                # 이어받기 (서버 파일이 바뀌었으면 If-Range 때문에 200으로 전체를 다시 받음)
+                headers['Range'] = f"bytes={offset}-"
+                headers['If-Range'] = validators.get('partial_etag') or validators['partial_last_modified']
+            else:
+                offset = 0
+                # 이전 파일이 그대로 있을 때만 조건부 요청
+                if (os.path.exists(filepath) and validators.get('sha256')
+                        and self._file_sha256(filepath).hexdigest() == validators['sha256']):
+                    if validators.get('etag'):
+                        headers['If-None-Match'] = validators['etag']
+                    if validators.get('last_modified'):
+                        headers['If-Modified-Since'] = validators['last_modified']
+
+            start = time.perf_counter()
+            received = 0
+            with requests.get(url, headers=headers, stream=True, timeout=(10, 60)) as response:
+                if response.status_code == 304:
+                    logger.info(f"원본 파일이 바뀌지 않았습니다: {filepath}")
+                    return filepath
+
+                if response.status_code == 416 and offset:
+                    # .part를 이미 끝까지 받은 경우 (Content-Range: bytes */<전체 크기>)
+                    total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                    if total.isdigit() and int(total) != offset:
+                        os.remove(part_file)
+                        raise IOError(f"이어받기 범위 오류 (받은 {offset:,}바이트, 전체 {int(total):,}바이트) "
+                                      "- 다음 실행에서 처음부터 다시 받기")
+                    logger.info(f"이어받을 부분이 없어 받아 둔 {part_file}로 마무리합니다.")
+                    digest = self._file_sha256(part_file)
+                    etag = validators.get('partial_etag')
+                    last_modified = validators.get('partial_last_modified')
+                    expected_size = offset
+                else:
+                    response.raise_for_status()
+                    digest, etag, last_modified, expected_sha256, expected_size, offset, received = \
+                        self._write_part(response, part_file, offset, url, state, expected_sha256)
+
+            elapsed = time.perf_counter() - start
+            record_time('network', elapsed)
+            size = offset + received
+            sha256 = digest.hexdigest()
+
+            # 검증 (크기 / 체크섬)
+            if expected_size is not None and size != expected_size:
+                raise IOError(f"크기 불일치: {size:,}바이트 (기대 {expected_size:,}바이트) - 다음 실행에서 이어받기")
+            if expected_sha256 and sha256 != expected_sha256.lower():
+                os.remove(part_file)
+                raise IOError(f"체크섬 불일치: {sha256} (기대 {expected_sha256})")
+
+            os.replace(part_file, filepath)
+
+            throughput = received / elapsed if elapsed > 0 else 0
+            state = {
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'sha256': sha256,
+                'size': size,
+                'downloaded_at': datetime.now().isoformat(),
+                'throughput': round(throughput)
+            }
+            self.save_download_state(state)
+
+            logger.info(f"다운로드 완료: {filepath} ({size:,}바이트, {throughput / 1e6:.2f}MB/s)")
+            logger.info(f"SHA-256: {sha256}")
             return filepath
 
         except Exception as e:
-            logger.error(f"자동 다운로드 실패: {e}")
-            logger.info("수동으로 다운로드해주세요.")
+            logger.warning(f"자동 다운로드 실패: {e}")
+            logger.warning("data/raw/의 기존 파일을 사용합니다. 파일이 없으면 수동으로 다운로드해주세요:")
+            logger.warning("  1. https://www.data.go.kr/data/3060079/fileData.do 접속")
+            logger.warning("  2. '파일 데이터' 탭에서 최신 파일 다운로드")
+            logger.warning("  3. 다운로드한 파일을 data/raw/ 폴더로 이동")
             return None
 
-    def load_data(self, filepath=None):
+    def _write_part(self, response, part_file, offset, url, state, expected_sha256):
         """
-        다운로드한 파일을 pandas DataFrame으로 로드
+        응답 본문을 .part 파일에 나눠 쓰기 (206이면 이어 쓰기)
 
         Args:
-            filepath: 파일 경로 (None이면 raw 폴더에서 최신 파일 찾기)
+            response: requests.Response (stream=True)
+            part_file: .part 파일 경로
+            offset: 이미 받은 바이트 수
+            url: 다운로드 URL
+            state: 다운로드 정보 (이어받기용 검증값을 먼저 기록)
+            expected_sha256: 기대하는 파일 SHA-256 (None이면 응답 헤더 사용)
 
         Returns:
-            pd.DataFrame: 가맹점 데이터
+            tuple: (SHA-256 객체, ETag, Last-Modified, 기대 SHA-256, 기대 크기,
+                    이어 쓴 위치 (전체를 다시 받으면 0), 이번에 받은 바이트 수)
+        """
+        # 잘못된 URL이면 파일 대신 안내 페이지(HTML)가 200으로 오므로 원본 파일을 덮어쓰지 않음
+        if 'text/html' in response.headers.get('Content-Type', ''):
+            raise IOError("파일 대신 HTML 페이지를 받았습니다 (다운로드 URL 확인 필요, ONNURI_DATA_URL)")
+
+        if response.status_code == 206:
+            logger.info(f"{offset:,}바이트부터 이어받기")
+            digest = self._file_sha256(part_file)
+            mode = 'ab'
+        else:
+            offset = 0
+            digest = hashlib.sha256()
+            mode = 'wb'
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        expected_sha256 = expected_sha256 or self._expected_sha256(response)
+        content_length = response.headers.get('Content-Length')
+        expected_size = offset + int(content_length) if content_length else None
+
+        # 끊겨도 이어받을 수 있게 검증값을 먼저 기록
+        state.update({'url': url, 'partial_etag': etag, 'partial_last_modified': last_modified})
+        self.save_download_state(state)
+
+        received = 0
+        with open(part_file, mode) as f:
+            for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+                received += len(chunk)
+
+        return digest, etag, last_modified, expected_sha256, expected_size, offset, received
+
+    def load_data(self, filepath=None, pattern=None, max_workers=None):
         """
-        if filepath is None:
-            # raw 폴더에서 Excel 파일 찾기
-            files = [f for f in os.listdir(self.output_dir) if f.endswith(('.xlsx', '.xls', '.csv'))]
-            if not files:
-                raise FileNotFoundError(f"{self.output_dir}에 데이터 파일이 없습니다.")
+        원본 파일을 pandas DataFrame으로 로드
 
-            # 가장 최신 파일 선택
-            files.sort(reverse=True)
-            filepath = os.path.join(self.output_dir, files[0])
+        데이터가 지역/구분별 여러 파일로 나뉘어 있으면 패턴에 맞는 파일을 모두 찾아
+        프로세스 풀에서 나눠 읽고, 컬럼명을 COLUMN_MAPPING으로 통일한 뒤 한 번에 합칩니다.
 
-        logger.info(f"데이터 로드 중: {filepath}")
+        Args:
+            filepath: 파일 경로 (None이면 raw 폴더에서 패턴에 맞는 파일 전체)
+            pattern: 파일 이름 패턴 (None이면 ONNURI_SOURCE_PATTERN 환경 변수, 없으면 전체)
+            max_workers: 프로세스 수 (None이면 파일 수와 CPU 수 중 작은 값)
 
-        # 파일 형식에 따라 로드
-        if filepath.endswith('.csv'):
-            df = pd.read_csv(filepath, encoding='utf-8-sig')
+        Returns:
+            pd.DataFrame: 가맹점 데이터
+        """
+        files = [filepath] if filepath else source_files(self.output_dir, pattern)
+        if not files:
+            raise FileNotFoundError(f"{self.output_dir}에 데이터 파일이 없습니다.")
+
+        start = time.perf_counter()
+        for path in files:
+            logger.info(f"데이터 로드 중: {path}")
+
+        workers = min(len(files), max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                frames = list(pool.map(read_source_file, files, [self.COLUMN_MAPPING] * len(files)))
         else:
-            df = pd.read_excel(filepath, engine='openpyxl')
+            frames = [read_source_file(path, self.COLUMN_MAPPING) for path in files]
 
-        logger.info(f"총 {len(df)}개 가맹점 로드 완료")
+        for path, frame in zip(files, frames):
+            logger.info(f"  {os.path.basename(path)}: {len(frame)}개")
+
+        # 파일마다 없는 컬럼은 빈 값으로 채워 합침 (복사는 concat 한 번)
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True, sort=False)
+
+        logger.info(
+            f"총 {len(df)}개 가맹점 로드 완료 "
+            f"(파일 {len(files)}개, 프로세스 {workers}개, {time.perf_counter() - start:.1f}초)"
+        )
         logger.info(f"컬럼: {list(df.columns)}")
 
         return df
@@ -125,19 +342,8 @@ class OnnuriDataFetcher:
 
         original_count = len(df)
 
-        # 컬럼명 매핑 (실제 데이터 구조에 맞게 수정 필요)
-        column_mapping = {
-            '가맹점명': 'name',
-            '소재지도로명주소': 'roadAddress',
-            '소재지지번주소': 'address',
-            '시장명': 'market',
-            '업종': 'category',
-            '취급품목': 'subCategory',
-            '전화번호': 'phone'
-        }
-
-        # 존재하는 컬럼만 매핑
-        actual_mapping = {k: v for k, v in column_mapping.items() if k in df.columns}
+        # 존재하는 컬럼만 매핑 (load_data에서 이미 매핑했으면 그대로)
+        actual_mapping = {k: v for k, v in self.COLUMN_MAPPING.items() if k in df.columns}
         df = df.rename(columns=actual_mapping)
 
         # 필수 컬럼 확인
@@ -156,6 +362,12 @@ class OnnuriDataFetcher:
         df = df.dropna(subset=['name', 'address'])
         logger.info(f"빈 값 제거 후: {len(df)}개")
 
+        # 유사 중복 병합 (띄어쓰기/지점명 차이, 지번/도로명 주소로 따로 올라온 경우)
+        detector = DuplicateDetector()
+        df_before = df
+        df = detector.dedupe_by_address(df)
+        detector.save_report(df_before)
+
         # 상품권 유형 파싱 (실제 데이터 구조에 맞게 수정 필요)
         # 예: "충전식O, 지류O, 모바일X" 형식이라고 가정
         if '상품권종류' in df.columns:
@@ -206,12 +418,18 @@ class OnnuriDataFetcher:
         logger.info(f"정제된 데이터 저장: {output_path}")
 
 
-def main():
-    """메인 함수"""
+def main(download=True):
+    """
+    메인 함수
+
+    Args:
+        download: 원본 파일 다운로드 여부 (onnuri.py는 단계 실행 여부를 정하기 전에 따로 받음)
+    """
     fetcher = OnnuriDataFetcher()
 
-    # 1. 데이터 다운로드 (수동 다운로드 권장)
-    # fetcher.download_data()
+    # 1. 데이터 다운로드 (실패하면 data/raw의 기존 파일 사용)
+    if download:
+        fetcher.download_data()
 
     # 2. 데이터 로드
     try:
@@ -234,4 +452,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_main('fetch', main)
@@ -7,13 +7,24 @@ Geocoding된 데이터를 프론트엔드에서 사용할 JSON 형식으로 변
 """
 
 import os
+import re
 import sys
 import json
+import shutil
+import hashlib
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from collections import Counter
 import logging
 
+from store_binary import encode_stores, types_to_mask, TYPE_BITS
+from store_ids import StoreIdRegistry
+from dedup import DuplicateDetector
+from store_query import StoreIndex, EARTH_RADIUS
+from place_index import PLACE_KINDS, address_places, search_key
+from profiling import run_main
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -25,7 +36,32 @@ logger = logging.getLogger(__name__)
 class JSONGenerator:
     """JSON 파일 생성 클래스"""
 
-    def __init__(self):
+    # 클러스터 피라미드 설정 (카카오맵 레벨 기준, 숫자가 클수록 넓은 영역)
+    CLUSTER_MIN_LEVEL = 8
+    CLUSTER_MAX_LEVEL = 14
+    CLUSTER_RADIUS_PX = 60
+
+    # 패싯 격자 셀 크기 (도, 약 550m x 440m)
+    FACET_CELL_SIZE = 0.005
+
+    # 주변 가맹점 목록 (가맹점마다 반경(미터) 안 가까운 k개, 샤드 크기는 도 단위 약 10km)
+    NEARBY_K = 10
+    NEARBY_RADIUS = 1000
+    NEARBY_SHARD_SIZE = 0.1
+
+    # 콘텐츠 해시 파일명 길이 (예: stores.1a2b3c4d5e.json)
+    HASH_LENGTH = 10
+
+    # 패치 체인 설정 (주 1회 기준 약 3개월 보관, 전체 대비 50% 넘으면 패치 생략)
+    PATCH_CHAIN_LENGTH = 12
+    PATCH_MAX_RATIO = 0.5
+
+    def __init__(self, id_registry=None):
+        """
+        Args:
+            id_registry: 가맹점 고정 ID 레지스트리 (None이면 data/store_ids.json 사용)
+        """
+        self.id_registry = id_registry or StoreIdRegistry()
         self.metadata = {
             'lastUpdated': datetime.now().isoformat() + 'Z',
             'dataSource': '공공데이터포털 - 온누리상품권 가맹점',
@@ -113,8 +149,11 @@ class JSONGenerator:
 
         logger.info(f"유효한 데이터: {len(df_valid)}/{len(df)}개")
 
-        # ID 추가
-        df_valid['id'] = range(1, len(df_valid) + 1)
+        # 좌표가 거의 같은 유사 중복 병합 (주소 표기가 달라 Geocoding 전에 못 찾은 경우)
+        df_valid = DuplicateDetector().dedupe_by_location(df_valid)
+
+        # ID 추가 (가맹점명 + 주소 기준 고정 ID)
+        df_valid['id'] = self.id_registry.assign(df_valid['name'], df_valid['address'])
 
         # stores 배열 생성
         stores = []
@@ -211,6 +250,619 @@ class JSONGenerator:
         file_size = os.path.getsize(output_path)
         logger.info(f"파일 크기: {file_size / 1024:.1f} KB")
 
+    def save_binary(self, data, output_path='data/stores.bin'):
+        """
+        바이너리 포맷(stores.bin) 저장
+
+        클라이언트가 JSON 파싱 없이 TypedArray로 바로 읽을 수 있는 형식입니다.
+        (형식은 store_binary.py 참고)
+
+        Args:
+            data: JSON 데이터
+            output_path: 출력 파일 경로
+        """
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        with open(output_path, 'wb') as f:
+            f.write(encode_stores(data['stores'], data['lastUpdated']))
+
+        file_size = os.path.getsize(output_path)
+        logger.info(f"바이너리 저장 완료: {output_path} ({file_size / 1024:.1f} KB)")
+
+    def build_cluster_pyramid(self, stores):
+        """
+        줌 레벨별 사전 집계 클러스터 생성 (supercluster 방식)
+
+        가장 세밀한 레벨에서 Web Mercator 격자로 가맹점을 집계한 뒤,
+        한 레벨씩 올라가며 인접한 2x2 셀을 합쳐 상위 레벨을 만듭니다.
+        카카오맵 레벨 L은 타일 줌 20 - L에 대응합니다.
+
+        Args:
+            stores: 가맹점 배열 (convert_to_json_format 결과의 stores)
+
+        Returns:
+            dict: 클러스터 피라미드 데이터
+                levels의 각 항목은 [위도, 경도, 가맹점 수, [카테고리별 수]] 형식
+        """
+        logger.info("클러스터 피라미드 생성 중...")
+
+        categories = sorted({store.get('category') or '기타' for store in stores})
+        pyramid = {
+            'version': '1.0.0',
+            'lastUpdated': self.metadata['lastUpdated'],
+            'minLevel': self.CLUSTER_MIN_LEVEL,
+            'maxLevel': self.CLUSTER_MAX_LEVEL,
+            'radius': self.CLUSTER_RADIUS_PX,
+            'categories': categories,
+            'levels': {}
+        }
+
+        if not stores:
+            return pyramid
+
+        lat = np.array([store['lat'] for store in stores], dtype=np.float64)
+        lng = np.array([store['lng'] for store in stores], dtype=np.float64)
+
+        # Web Mercator 정규 좌표 (0~1)
+        x = (lng + 180) / 360
+        sin_lat = np.sin(np.radians(lat))
+        y = 0.5 - np.log((1 + sin_lat) / (1 - sin_lat)) / (4 * np.pi)
+
+        # 가장 세밀한 레벨의 격자 셀 (셀 한 변 = CLUSTER_RADIUS_PX 픽셀)
+        zoom = 20 - self.CLUSTER_MIN_LEVEL
+        scale = 256 * 2 ** zoom / self.CLUSTER_RADIUS_PX
+
+        cells = pd.DataFrame({
+            'cx': np.floor(x * scale).astype(np.int64),
+            'cy': np.floor(y * scale).astype(np.int64),
+            'lat': lat,
+            'lng': lng,
+            'count': 1
+        })
+        category_codes = pd.Categorical(
+            [store.get('category') or '기타' for store in stores],
+            categories=categories
+        ).codes
+        for code in range(len(categories)):
+            cells[f'c{code}'] = (category_codes == code).astype(np.int64)
+
+        level_cells = cells.groupby(['cx', 'cy'], sort=False).sum()
+
+        for level in range(self.CLUSTER_MIN_LEVEL, self.CLUSTER_MAX_LEVEL + 1):
+            if level > self.CLUSTER_MIN_LEVEL:
+                # 상위 레벨: 셀 크기가 2배이므로 인덱스를 절반으로 합침
+                level_cells = level_cells.reset_index()
+                level_cells['cx'] //= 2
+                level_cells['cy'] //= 2
+                level_cells = level_cells.groupby(['cx', 'cy'], sort=False).sum()
+
+            counts = level_cells['count'].to_numpy()
+            centroid_lat = np.round(level_cells['lat'].to_numpy() / counts, 6)
+            centroid_lng = np.round(level_cells['lng'].to_numpy() / counts, 6)
+            breakdown = level_cells[[f'c{code}' for code in range(len(categories))]].to_numpy()
+
+            pyramid['levels'][str(level)] = [
+                [float(centroid_lat[i]), float(centroid_lng[i]), int(counts[i]),
+                 [int(n) for n in breakdown[i]]]
+                for i in range(len(counts))
+            ]
+
+            logger.info(f"  레벨 {level}: 클러스터 {len(counts)}개")
+
+        return pyramid
+
+    def save_clusters(self, pyramid, output_path='data/clusters.json'):
+        """
+        클러스터 피라미드 저장
+
+        Args:
+            pyramid: build_cluster_pyramid 결과
+            output_path: 출력 파일 경로
+        """
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(pyramid, f, ensure_ascii=False, separators=(',', ':'))
+
+        file_size = os.path.getsize(output_path)
+        logger.info(f"클러스터 저장 완료: {output_path} ({file_size / 1024:.1f} KB)")
+
+    def build_facet_grid(self, stores):
+        """
+        격자 셀별 카테고리 x 상품권 유형 가맹점 수 집계
+
+        프론트엔드는 반경 안의 셀만 더해 가맹점 데이터 없이도 업종/유형별 개수를 표시합니다.
+        상품권 유형은 가맹점의 유형 조합(비트마스크, store_binary.TYPE_BITS)별로 세므로
+        어떤 유형을 선택해도 "하나라도 겹치면 통과" 규칙으로 합칠 수 있습니다.
+
+        Args:
+            stores: 가맹점 배열 (convert_to_json_format 결과의 stores)
+
+        Returns:
+            dict: 패싯 격자 데이터
+                cells의 각 항목은 [cx, cy, [카테고리 코드, 유형 마스크, 가맹점 수, ...]] 형식
+                (cx = floor(경도 / cellSize), cy = floor(위도 / cellSize))
+        """
+        categories = sorted({store.get('category') or '기타' for store in stores})
+        grid = {
+            'version': '1.0.0',
+            'lastUpdated': self.metadata['lastUpdated'],
+            'cellSize': self.FACET_CELL_SIZE,
+            'categories': categories,
+            'types': list(TYPE_BITS),
+            'cells': []
+        }
+
+        if not stores:
+            return grid
+
+        facets = pd.DataFrame({
+            'cx': np.floor(np.array([store['lng'] for store in stores]) / self.FACET_CELL_SIZE).astype(np.int64),
+            'cy': np.floor(np.array([store['lat'] for store in stores]) / self.FACET_CELL_SIZE).astype(np.int64),
+            'code': pd.Categorical(
+                [store.get('category') or '기타' for store in stores],
+                categories=categories
+            ).codes.astype(np.int64),
+            'mask': [types_to_mask(store.get('types')) for store in stores]
+        })
+        counts = facets.groupby(['cx', 'cy', 'code', 'mask']).size().reset_index(name='n')
+
+        values = counts[['code', 'mask', 'n']].to_numpy()
+        keys = counts[['cx', 'cy']].to_numpy()
+        starts = np.flatnonzero(np.r_[True, (keys[1:] != keys[:-1]).any(axis=1)])
+        ends = np.r_[starts[1:], len(counts)]
+
+        grid['cells'] = [
+            [int(keys[start, 0]), int(keys[start, 1]), values[start:end].ravel().tolist()]
+            for start, end in zip(starts, ends)
+        ]
+
+        logger.info(f"패싯 격자: 셀 {len(grid['cells'])}개 (셀 크기 {self.FACET_CELL_SIZE}도)")
+        return grid
+
+    def save_facets(self, grid, output_path='data/facets.json'):
+        """
+        패싯 격자 저장
+
+        Args:
+            grid: build_facet_grid 결과
+            output_path: 출력 파일 경로
+        """
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(grid, f, ensure_ascii=False, separators=(',', ':'))
+
+        file_size = os.path.getsize(output_path)
+        logger.info(f"패싯 저장 완료: {output_path} ({file_size / 1024:.1f} KB)")
+
+    def build_nearby(self, stores):
+        """
+        가맹점마다 반경 안 가장 가까운 가맹점 ID 목록 계산
+
+        상세 Dialog의 "주변 온누리 가맹점"을 클라이언트에서 전체 거리 계산 없이 보여주기 위해
+        빌드할 때 격자 인덱스(store_query.StoreIndex.knn_self)로 한 번에 계산합니다.
+        배포할 때 샤드 파일로 나눌 수 있게 가맹점 위치 기준 샤드별로 묶어 둡니다.
+
+        Args:
+            stores: 가맹점 배열 (convert_to_json_format 결과의 stores)
+
+        Returns:
+            dict: 주변 가맹점 데이터
+                shards의 키는 "cx_cy" (cx = floor(경도 / shardSize), cy = floor(위도 / shardSize)),
+                값은 {가맹점 ID: [가까운 순 가맹점 ID, ...]} (주변 가맹점이 없으면 생략)
+        """
+        nearby = {
+            'version': '1.0.0',
+            'lastUpdated': self.metadata['lastUpdated'],
+            'k': self.NEARBY_K,
+            'radius': self.NEARBY_RADIUS,
+            'shardSize': self.NEARBY_SHARD_SIZE,
+            'shards': {}
+        }
+
+        if not stores:
+            return nearby
+
+        # 셀 크기를 반경과 같게 잡으면 주변 셀 3x3 정도만 비교
+        index = StoreIndex.from_stores(stores, cell_size=float(np.degrees(self.NEARBY_RADIUS / EARTH_RADIUS)))
+        neighbors, _ = index.knn_self(self.NEARBY_K, self.NEARBY_RADIUS)
+
+        # 이웃은 가까운 순으로 앞에서부터 채워져 있음 (모자라면 뒤가 -1)
+        counts = (neighbors >= 0).sum(axis=1)
+        neighbor_ids = index.ids[np.maximum(neighbors, 0)].tolist()
+        shard_x = np.floor(index.lng_deg / self.NEARBY_SHARD_SIZE).astype(np.int64).tolist()
+        shard_y = np.floor(index.lat_deg / self.NEARBY_SHARD_SIZE).astype(np.int64).tolist()
+
+        for store_id, x, y, row, count in zip(index.ids.tolist(), shard_x, shard_y, neighbor_ids, counts.tolist()):
+            if count:
+                nearby['shards'].setdefault(f"{x}_{y}", {})[str(store_id)] = row[:count]
+
+        found = int(counts.sum())
+        logger.info(
+            f"주변 가맹점: 평균 {found / len(stores):.1f}개 "
+            f"(k={self.NEARBY_K}, 반경 {self.NEARBY_RADIUS}m, 샤드 {len(nearby['shards'])}개)"
+        )
+        return nearby
+
+    def save_nearby(self, nearby, output_path='data/nearby.json'):
+        """
+        주변 가맹점 데이터 저장 (배포 전 전체 파일)
+
+        Args:
+            nearby: build_nearby 결과
+            output_path: 출력 파일 경로
+        """
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(nearby, f, ensure_ascii=False, separators=(',', ':'))
+
+        file_size = os.path.getsize(output_path)
+        logger.info(f"주변 가맹점 저장 완료: {output_path} ({file_size / 1024:.1f} KB)")
+
+    def build_place_index(self, stores):
+        """
+        장소 자동완성 인덱스 생성 (시장명, 시/도, 시/군/구, 동/읍/면, 도로명)
+
+        프론트엔드 주소 검색이 카카오 API를 부르기 전에 먼저 찾아보는 인덱스입니다.
+        장소마다 소속 가맹점 좌표의 중앙값을 대표 좌표로 쓰고,
+        자모 분해한 검색 키(place_index.search_key) 순으로 정렬합니다.
+
+        Args:
+            stores: 가맹점 배열 (convert_to_json_format 결과의 stores)
+
+        Returns:
+            dict: 장소 인덱스 데이터
+                keys[i]는 places[i]의 검색 키,
+                places의 각 항목은 [이름, 상위 지역, 종류 코드, 위도, 경도, 가맹점 수]
+        """
+        index = {
+            'version': '1.0.0',
+            'lastUpdated': self.metadata['lastUpdated'],
+            'kinds': list(PLACE_KINDS),
+            'keys': [],
+            'places': []
+        }
+
+        rows = []
+        for store in stores:
+            # 지번/도로명 주소에 같은 장소가 있으면 한 번만 셈
+            places = set()
+            region = ''
+            for address in (store.get('address'), store.get('roadAddress')):
+                if not address:
+                    continue
+                found = address_places(address)
+                places.update(found)
+                if not region:
+                    # 시장의 상위 지역 = 시/도 + 시/군/구
+                    region = ' '.join(name for kind, name, _ in found if kind in ('province', 'district'))
+            if store.get('market'):
+                places.add(('market', store['market'], region))
+            rows.extend((kind, name, region, store['lat'], store['lng']) for kind, name, region in places)
+
+        if not rows:
+            return index
+
+        places = (
+            pd.DataFrame(rows, columns=['kind', 'name', 'region', 'lat', 'lng'])
+            .groupby(['kind', 'name', 'region'])
+            .agg(lat=('lat', 'median'), lng=('lng', 'median'), count=('lat', 'size'))
+            .reset_index()
+        )
+        places['key'] = places['name'].map(search_key)
+        places = places[places['key'] != ''].sort_values(['key', 'count'], ascending=[True, False])
+
+        index['keys'] = places['key'].tolist()
+        index['places'] = [
+            [name, region, PLACE_KINDS.index(kind), round(lat, 6), round(lng, 6), count]
+            for name, region, kind, lat, lng, count in zip(
+                places['name'], places['region'], places['kind'],
+                places['lat'].tolist(), places['lng'].tolist(), places['count'].tolist())
+        ]
+
+        counts = places['kind'].value_counts()
+        logger.info(
+            f"장소 인덱스: {len(places)}개 (" +
+            ', '.join(f"{kind} {counts.get(kind, 0)}" for kind in PLACE_KINDS) + ")"
+        )
+        return index
+
+    def save_place_index(self, index, output_path='data/places.json'):
+        """
+        장소 인덱스 저장
+
+        Args:
+            index: build_place_index 결과
+            output_path: 출력 파일 경로
+        """
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+
+        file_size = os.path.getsize(output_path)
+        logger.info(f"장소 인덱스 저장 완료: {output_path} ({file_size / 1024:.1f} KB)")
+
+    def load_previous_data(self, filepath='data/stores.json'):
+        """
+        이전에 생성한 stores.json 로드
+
+        Args:
+            filepath: 파일 경로
+
+        Returns:
+            dict: JSON 데이터 (없거나 읽을 수 없으면 None)
+        """
+        if not os.path.exists(filepath):
+            return None
+
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"이전 데이터 로드 실패: {e}")
+            return None
+
+    def reuse_last_updated(self, data, previous):
+        """
+        가맹점 데이터가 이전과 같으면 이전 업데이트 시각 유지
+
+        lastUpdated만 바뀌어 모든 산출물의 해시가 달라지는 것을 막습니다.
+
+        Args:
+            data: JSON 데이터
+            previous: 이전 JSON 데이터 (load_previous_data 결과)
+
+        Returns:
+            bool: 데이터 변경 여부
+        """
+        if previous is None or previous.get('stores') != data['stores']:
+            return True
+
+        data['lastUpdated'] = previous['lastUpdated']
+        self.metadata['lastUpdated'] = previous['lastUpdated']
+        logger.info(f"가맹점 데이터 변경 없음 (업데이트 시각 유지: {data['lastUpdated']})")
+        return False
+
+    def build_patch(self, previous_stores, stores):
+        """
+        이전 가맹점 데이터와 비교한 변경분 생성 (ID 기준)
+
+        Args:
+            previous_stores: 이전 가맹점 배열
+            stores: 새 가맹점 배열
+
+        Returns:
+            dict: {'added': [...], 'updated': [...], 'removed': [id, ...]}
+        """
+        previous_by_id = {store['id']: store for store in previous_stores}
+        current_ids = set()
+
+        added = []
+        updated = []
+        for store in stores:
+            current_ids.add(store['id'])
+            previous = previous_by_id.get(store['id'])
+            if previous is None:
+                added.append(store)
+            elif previous != store:
+                updated.append(store)
+
+        removed = [store_id for store_id in previous_by_id if store_id not in current_ids]
+
+        return {'added': added, 'updated': updated, 'removed': removed}
+
+    def _load_manifest(self, manifest_path):
+        """
+        기존 manifest.json 로드
+
+        Args:
+            manifest_path: 파일 경로
+
+        Returns:
+            dict: manifest 데이터 (없으면 빈 dict)
+        """
+        if not os.path.exists(manifest_path):
+            return {}
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"이전 manifest 로드 실패: {e}")
+            return {}
+
+    def _publish_nearby(self, nearby_path, publish_dir, previous_manifest):
+        """
+        주변 가맹점 데이터를 샤드 파일로 나눠 배포
+
+        샤드마다 nearby_<cx>_<cy>.<해시>.json을 만들고, 샤드 키 → 파일명 목록을
+        nearby.<해시>.json으로 저장합니다. 클라이언트는 목록과 필요한 샤드만 받습니다.
+        현재/직전 목록이 참조하지 않는 샤드 파일은 삭제합니다.
+
+        Args:
+            nearby_path: save_nearby로 저장한 파일
+            publish_dir: 배포 디렉토리
+            previous_manifest: 직전 manifest 데이터
+
+        Returns:
+            str: 목록 파일명
+        """
+        with open(nearby_path, 'r', encoding='utf-8') as f:
+            nearby = json.load(f)
+
+        def write_hashed(stem, data):
+            content = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            filename = f"{stem}.{hashlib.sha256(content).hexdigest()[:self.HASH_LENGTH]}.json"
+            target = os.path.join(publish_dir, filename)
+            if not os.path.exists(target):
+                with open(target, 'wb') as f:
+                    f.write(content)
+            return filename
+
+        shards = {key: write_hashed(f"nearby_{key}", shard) for key, shard in nearby['shards'].items()}
+        index = {name: value for name, value in nearby.items() if name != 'shards'}
+        index['shards'] = shards
+        filename = write_hashed('nearby', index)
+        logger.info(f"  nearby: {filename} (샤드 {len(shards)}개)")
+
+        # 오래된 샤드 파일 정리 (직전 목록의 샤드는 유지)
+        keep = set(shards.values())
+        previous_index = previous_manifest.get('files', {}).get('nearby')
+        if previous_index and os.path.exists(os.path.join(publish_dir, previous_index)):
+            with open(os.path.join(publish_dir, previous_index), 'r', encoding='utf-8') as f:
+                keep |= set(json.load(f).get('shards', {}).values())
+
+        pattern = re.compile(r'^nearby_-?\d+_-?\d+\.[0-9a-f]{%d}\.json$' % self.HASH_LENGTH)
+        removed = 0
+        for name in os.listdir(publish_dir):
+            if pattern.match(name) and name not in keep:
+                os.remove(os.path.join(publish_dir, name))
+                removed += 1
+        if removed:
+            logger.info(f"  삭제: 주변 가맹점 샤드 {removed}개")
+
+        return filename
+
+    def _publish_patch(self, previous_manifest, manifest, stores, previous_stores, publish_dir):
+        """
+        직전 버전 → 현재 버전 패치 파일 생성 및 패치 체인 갱신
+
+        Args:
+            previous_manifest: 직전 manifest
+            manifest: 새 manifest (patches 항목을 채움)
+            stores: 새 가맹점 배열
+            previous_stores: 직전 가맹점 배열 (없으면 None)
+            publish_dir: 배포 디렉토리
+        """
+        chain = list(previous_manifest.get('patches', []))
+        previous_version = previous_manifest.get('dataVersion')
+        version = manifest['dataVersion']
+
+        if previous_stores is not None and previous_version and previous_version != version:
+            patch = self.build_patch(previous_stores, stores)
+            patch_data = {
+                'from': previous_version,
+                'to': version,
+                'lastUpdated': manifest['lastUpdated'],
+                'totalStores': len(stores),
+                **patch
+            }
+            encoded = json.dumps(patch_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            full_size = os.path.getsize(os.path.join(publish_dir, manifest['files']['stores']))
+
+            # 변경분이 너무 크면 패치 대신 전체 다운로드
+            if len(encoded) > full_size * self.PATCH_MAX_RATIO:
+                logger.info(f"  패치 생략: 변경분이 큼 ({len(encoded) / 1024:.1f} KB)")
+            else:
+                filename = f"patch.{previous_version}.{version}.json"
+                with open(os.path.join(publish_dir, filename), 'wb') as f:
+                    f.write(encoded)
+
+                chain.append({
+                    'from': previous_version,
+                    'to': version,
+                    'file': filename,
+                    'added': len(patch['added']),
+                    'updated': len(patch['updated']),
+                    'removed': len(patch['removed'])
+                })
+                logger.info(
+                    f"  패치: {filename} (추가 {len(patch['added'])}, "
+                    f"수정 {len(patch['updated'])}, 삭제 {len(patch['removed'])})"
+                )
+
+        manifest['patches'] = chain[-self.PATCH_CHAIN_LENGTH:]
+
+        # 체인에서 빠진 패치 파일 정리
+        keep = {entry['file'] for entry in manifest['patches']}
+        pattern = re.compile(r'^patch\.[0-9a-f]+\.[0-9a-f]+\.json$')
+        for filename in os.listdir(publish_dir):
+            if pattern.match(filename) and filename not in keep:
+                os.remove(os.path.join(publish_dir, filename))
+                logger.info(f"  삭제: {filename}")
+
+    def publish_artifacts(self, artifacts, publish_dir='docs/data', stores=None, previous_stores=None):
+        """
+        산출물을 콘텐츠 해시 파일명으로 배포하고 manifest.json 생성
+
+        파일명이 내용에 따라 정해지므로 바뀌지 않은 파일은 브라우저 캐시를
+        그대로 쓰고, 클라이언트는 작은 manifest.json만 다시 확인합니다.
+        현재/직전 manifest가 참조하지 않는 해시 파일은 삭제합니다.
+
+        stores를 주면 stores 산출물의 해시를 데이터 버전(dataVersion)으로 삼고,
+        직전 버전과의 변경분을 패치 파일로 만들어 패치 체인에 추가합니다.
+        'nearby' 산출물은 샤드 파일로 나눠 배포합니다 (_publish_nearby).
+
+        Args:
+            artifacts: {키: 원본 파일 경로} (예: {'stores': 'data/stores.json'})
+            publish_dir: 배포 디렉토리
+            stores: 새 가맹점 배열 (패치 생성용)
+            previous_stores: 직전 가맹점 배열 (패치 생성용)
+
+        Returns:
+            dict: manifest 데이터
+        """
+        os.makedirs(publish_dir, exist_ok=True)
+        manifest_path = os.path.join(publish_dir, 'manifest.json')
+
+        # 직전 manifest (캐시된 manifest를 가진 클라이언트를 위해 파일 유지)
+        previous_manifest = self._load_manifest(manifest_path)
+        previous_files = set(previous_manifest.get('files', {}).values())
+
+        manifest = {
+            'version': '1.0.0',
+            'lastUpdated': self.metadata['lastUpdated'],
+            'totalStores': self.metadata['totalStores'],
+            'files': {}
+        }
+
+        for key, path in artifacts.items():
+            # 주변 가맹점은 샤드 파일 + 목록 파일로 배포
+            if key == 'nearby':
+                manifest['files'][key] = self._publish_nearby(path, publish_dir, previous_manifest)
+                continue
+
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()[:self.HASH_LENGTH]
+
+            stem, ext = os.path.splitext(os.path.basename(path))
+            filename = f"{stem}.{digest}{ext}"
+            target = os.path.join(publish_dir, filename)
+
+            if os.path.exists(target):
+                logger.info(f"  {key}: {filename} (변경 없음)")
+            else:
+                shutil.copyfile(path, target)
+                logger.info(f"  {key}: {filename} (새 파일)")
+
+            manifest['files'][key] = filename
+            if key == 'stores':
+                manifest['dataVersion'] = digest
+
+        # 오래된 해시 파일 정리
+        keep = set(manifest['files'].values()) | previous_files
+        stems = {os.path.splitext(os.path.basename(path))[0] for path in artifacts.values()}
+        pattern = re.compile(
+            r'^(%s)\.[0-9a-f]{%d}\.\w+$' % ('|'.join(map(re.escape, stems)), self.HASH_LENGTH)
+        )
+        for filename in os.listdir(publish_dir):
+            if pattern.match(filename) and filename not in keep:
+                os.remove(os.path.join(publish_dir, filename))
+                logger.info(f"  삭제: {filename}")
+
+        if stores is not None and 'dataVersion' in manifest:
+            self._publish_patch(previous_manifest, manifest, stores, previous_stores, publish_dir)
+
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        logger.info(f"manifest 저장 완료: {manifest_path}")
+
+        return manifest
+
     def save_metadata(self, output_path='data/metadata.json'):
         """
         메타데이터 저장
@@ -226,6 +878,56 @@ class JSONGenerator:
         logger.info(f"메타데이터 저장 완료: {output_path}")
 
 
+# 배포 산출물 {manifest 키: 원본 파일 경로}
+PUBLISH_ARTIFACTS = {
+    'stores': 'data/stores.json',
+    'binary': 'data/stores.bin',
+    'clusters': 'data/clusters.json',
+    'facets': 'data/facets.json',
+    'nearby': 'data/nearby.json',
+    'places': 'data/places.json'
+}
+
+
+def publish_outputs(publish_dir='docs/data'):
+    """
+    data/에 있는 산출물을 다시 배포 (단계 캐시에서 복원한 뒤 onnuri.py가 호출)
+
+    복원한 data/stores.json과 docs/data/manifest.json이 가리키는 버전이 다를 수 있으므로
+    manifest, 해시 파일, 패치 체인, 주변 가맹점 샤드를 복원한 데이터 기준으로 다시 만듭니다.
+    직전 가맹점 배열은 직전 manifest가 가리키는 배포본에서 읽습니다.
+
+    Args:
+        publish_dir: 배포 디렉토리
+
+    Returns:
+        dict: manifest 데이터
+    """
+    generator = JSONGenerator()
+
+    data = generator.load_previous_data('data/stores.json')
+    if data is None:
+        logger.error("data/stores.json이 없어 배포하지 않습니다.")
+        return None
+
+    with open('data/metadata.json', 'r', encoding='utf-8') as f:
+        generator.metadata = json.load(f)
+
+    previous_stores = None
+    previous_manifest = generator._load_manifest(os.path.join(publish_dir, 'manifest.json'))
+    previous_file = previous_manifest.get('files', {}).get('stores')
+    if previous_file:
+        previous_data = generator.load_previous_data(os.path.join(publish_dir, previous_file))
+        previous_stores = previous_data['stores'] if previous_data else None
+
+    return generator.publish_artifacts(
+        PUBLISH_ARTIFACTS,
+        publish_dir,
+        stores=data['stores'],
+        previous_stores=previous_stores
+    )
+
+
 def main():
     """메인 함수"""
 
@@ -243,11 +945,29 @@ def main():
 
     # JSON 변환
     json_data = generator.convert_to_json_format(df)
+    generator.id_registry.save_registry()
+
+    # 데이터가 그대로면 업데이트 시각 유지 (해시 파일명 유지)
+    previous_data = generator.load_previous_data('data/stores.json')
+    generator.reuse_last_updated(json_data, previous_data)
 
     # 저장
     generator.save_json(json_data, 'data/stores.json')
+    generator.save_binary(json_data, 'data/stores.bin')
+    generator.save_clusters(generator.build_cluster_pyramid(json_data['stores']), 'data/clusters.json')
+    generator.save_facets(generator.build_facet_grid(json_data['stores']), 'data/facets.json')
+    generator.save_nearby(generator.build_nearby(json_data['stores']), 'data/nearby.json')
+    generator.save_place_index(generator.build_place_index(json_data['stores']), 'data/places.json')
     generator.save_metadata('data/metadata.json')
 
+    # 콘텐츠 해시 파일명으로 배포
+    generator.publish_artifacts(
+        PUBLISH_ARTIFACTS,
+        'docs/data',
+        stores=json_data['stores'],
+        previous_stores=previous_data['stores'] if previous_data else None
+    )
+
     # 통계 출력
     logger.info("=" * 60)
     logger.info("JSON 생성 완료!")
@@ -257,9 +977,15 @@ def main():
     logger.info("")
     logger.info("파일 경로:")
     logger.info("  - data/stores.json (프론트엔드용)")
+    logger.info("  - data/stores.bin (바이너리 포맷)")
+    logger.info("  - data/clusters.json (줌 레벨별 클러스터)")
+    logger.info("  - data/facets.json (격자 셀별 업종/유형 개수)")
+    logger.info("  - data/nearby.json (가맹점별 주변 가맹점, 샤드로 나눠 배포)")
+    logger.info("  - data/places.json (주소 검색용 장소 자동완성 인덱스)")
     logger.info("  - data/metadata.json (통계 정보)")
+    logger.info("  - docs/data/manifest.json (해시 파일명 목록)")
     logger.info("=" * 60)
 
 
 if __name__ == '__main__':
-    main()
+    run_main('generate', main)
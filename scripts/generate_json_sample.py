@@ -12,6 +12,8 @@ from datetime import datetime
 from collections import Counter
 import logging
 
+from store_ids import StoreIdRegistry
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -92,11 +94,15 @@ def main():
     df_valid = df[df['lat'].notna() & df['lng'].notna()].copy()
     logger.info(f"유효한 데이터: {len(df_valid)}/{len(df)}개")
 
+    # 가맹점명 + 주소 기준 고정 ID
+    id_registry = StoreIdRegistry()
+    store_ids = id_registry.assign(df_valid['가맹점명'], df_valid['address'])
+
     # stores 배열 생성
     stores = []
     category_counts = Counter()
 
-    for idx, row in df_valid.iterrows():
+    for store_id, (idx, row) in zip(store_ids, df_valid.iterrows()):
         # 업종 분류
         category, subCategory = categorize_business(row.get('category'))
         category_counts[category] += 1
@@ -105,7 +111,7 @@ def main():
         types = parse_types(row)
 
         store = {
-            'id': len(stores) + 1,
+            'id': store_id,
             'name': str(row['가맹점명']),
             'address': str(row['address']) if pd.notna(row.get('address')) else '',
             'lat': float(row['lat']),
@@ -142,6 +148,8 @@ def main():
         'stores': stores
     }
 
+    id_registry.save_registry()
+
     # 저장
     output_file = 'data/stores.json'
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
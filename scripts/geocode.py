@@ -8,14 +8,18 @@
 
 import os
 import sys
-import time
 import json
-import requests
 import pandas as pd
 from datetime import datetime
 from dotenv import load_dotenv
 import logging
 
+from rate_limiter import AdaptiveRateLimiter, QuotaExceededError, RateLimitedError
+from regions import RegionIndex
+from geocode_chain import GeocodingEngine, LocalIndexProvider, UrlGeocoder
+from geocode_keyword import KakaoKeywordGeocoder
+from profiling import run_main
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -23,8 +27,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 환경 변수 로드
-load_dotenv()
+# 호출 한도/제한으로 남은 행 기록 (있으면 onnuri.py가 다음 실행에서 단계를 건너뛰거나 캐시하지 않음)
+PENDING_FILE = 'data/raw/geocode_pending.json'
 
 
 class KakaoGeocoder:
@@ -32,11 +36,16 @@ class KakaoGeocoder:
 
     API_URL = "https://dapi.kakao.com/v2/local/search/address.json"
 
-    def __init__(self, api_key=None):
+    name = 'kakao_address'
+
+    def __init__(self, api_key=None, rate_limiter=None, address_column='address'):
         """
         Args:
             api_key: 카카오 REST API 키
+            rate_limiter: 호출 속도 조절기 (None이면 새로 생성, 여러 Geocoder가 공유 가능)
+            address_column: 주소 컬럼명
         """
+        self.address_column = address_column
         self.api_key = api_key or os.getenv('KAKAO_REST_API_KEY')
         if not self.api_key:
             raise ValueError("KAKAO_REST_API_KEY가 설정되지 않았습니다.")
@@ -45,12 +54,15 @@ class KakaoGeocoder:
             'Authorization': f'KakaoAK {self.api_key}'
         }
 
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+
         # API 호출 통계
         self.stats = {
             'total': 0,
             'success': 0,
             'failed': 0,
-            'cached': 0
+            'cached': 0,
+            'throttled': 0
         }
 
         # 캐시 (이미 변환한 주소 저장)
@@ -75,7 +87,7 @@ class KakaoGeocoder:
 
     def save_cache(self, cache_file='data/raw/geocode_cache.json'):
         """
-        캐시 파일 저장
+        캐시 파일 / 호출 수 저장
 
         Args:
             cache_file: 캐시 파일 경로
@@ -83,7 +95,9 @@ class KakaoGeocoder:
         os.makedirs(os.path.dirname(cache_file), exist_ok=True)
         with open(cache_file, 'w', encoding='utf-8') as f:
             json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        self.rate_limiter.save_quota()
         logger.info(f"캐시 저장 완료: {len(self.cache)}개")
+        logger.info(f"API 호출: {self.rate_limiter.summary()}")
 
     def geocode(self, address):
         """
@@ -105,7 +119,7 @@ class KakaoGeocoder:
         # API 호출
         try:
             params = {'query': address}
-            response = requests.get(
+            response = self.rate_limiter.get(
                 self.API_URL,
                 headers=self.headers,
                 params=params,
@@ -145,18 +159,32 @@ class KakaoGeocoder:
             self.stats['failed'] += 1
             return None
 
+        except QuotaExceededError:
+            raise
+
+        except RateLimitedError as e:
+            # 호출 제한은 실패로 확정하지 않음 (캐시에 없으므로 다음 실행에서 다시 시도)
+            logger.warning(f"호출 제한으로 건너뜀: {e}")
+            self.stats['throttled'] += 1
+            return None
+
         except Exception as e:
             logger.error(f"Geocoding 에러 ({address}): {e}")
             self.stats['failed'] += 1
             return None
 
-        finally:
-            # Rate limiting (카카오 API 제한 준수)
-            time.sleep(0.1)  # 초당 10건
+    def query_key(self, row):
+        """행 → 검색할 주소 (GeocodingEngine 제공자 인터페이스)"""
+        address = row.get(self.address_column)
+        return None if pd.isna(address) else str(address)
+
+    def lookup(self, key):
+        """주소 → 좌표 (GeocodingEngine 제공자 인터페이스)"""
+        return self.geocode(key)
 
     def geocode_dataframe(self, df, address_column='address'):
         """
-        DataFrame의 모든 주소를 변환
+        DataFrame의 모든 주소를 변환 (주소 검색만 사용)
 
         Args:
             df: pandas DataFrame
@@ -165,61 +193,53 @@ class KakaoGeocoder:
         Returns:
             pd.DataFrame: 좌표가 추가된 DataFrame
         """
-        logger.info(f"{len(df)}개 주소 Geocoding 시작...")
-
-        # 좌표 컬럼 추가
-        df['lat'] = None
-        df['lng'] = None
-        df['roadAddress'] = None
-
-        # 진행률 표시
-        total = len(df)
-        for idx, row in df.iterrows():
-            address = row[address_column]
-
-            if pd.isna(address):
-                continue
-
-            # Geocoding
-            coord = self.geocode(address)
-
-            if coord:
-                df.at[idx, 'lat'] = coord['lat']
-                df.at[idx, 'lng'] = coord['lng']
-                if 'roadAddress' in coord:
-                    df.at[idx, 'roadAddress'] = coord['roadAddress']
-
-            # 진행률 출력
-            if (idx + 1) % 100 == 0 or (idx + 1) == total:
-                success_rate = (self.stats['success'] / self.stats['total'] * 100) if self.stats['total'] > 0 else 0
-                logger.info(
-                    f"진행: {idx + 1}/{total} "
-                    f"(성공: {self.stats['success']}, "
-                    f"실패: {self.stats['failed']}, "
-                    f"캐시: {self.stats['cached']}, "
-                    f"성공률: {success_rate:.1f}%)"
-                )
-
-        # 캐시 저장
-        self.save_cache()
-
-        # 통계 출력
-        logger.info("=" * 60)
-        logger.info("Geocoding 완료!")
-        logger.info(f"전체: {self.stats['total']}개")
-        logger.info(f"성공: {self.stats['success']}개")
-        logger.info(f"실패: {self.stats['failed']}개")
-        logger.info(f"캐시: {self.stats['cached']}개")
-        success_rate = (self.stats['success'] / self.stats['total'] * 100) if self.stats['total'] > 0 else 0
-        logger.info(f"성공률: {success_rate:.1f}%")
-        logger.info("=" * 60)
-
-        return df
+        self.address_column = address_column
+        return GeocodingEngine([self]).geocode_dataframe(df)
+
+
+def save_pending(df, providers, pending_file=PENDING_FILE):
+    """
+    호출 한도 초과/제한으로 남은 행 기록
+
+    한도 초과나 재시도 후에도 제한(429)으로 포기한 요청이 있으면 좌표가 없는 행은
+    실패로 확정하지 않고 다음 실행에서 다시 시도해야 하므로 기록을 남깁니다.
+    모든 요청이 끝까지 처리됐으면 기록을 지웁니다.
+
+    Args:
+        df: Geocoding 결과 DataFrame
+        providers: 제공자 목록
+        pending_file: 기록 파일 경로
+
+    Returns:
+        int: 다시 시도할 행 수
+    """
+    limiters = {id(p.rate_limiter): p.rate_limiter for p in providers if getattr(p, 'rate_limiter', None)}
+    interrupted = [limiter for limiter in limiters.values() if limiter.interrupted]
+    pending = int(df['lat'].isna().sum()) if interrupted else 0
+
+    if not pending:
+        if os.path.exists(pending_file):
+            os.remove(pending_file)
+        return 0
+
+    os.makedirs(os.path.dirname(pending_file), exist_ok=True)
+    with open(pending_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created': datetime.now().isoformat(),
+            'rows': pending,
+            'quotaExceeded': sum(limiter.stats['quota_exceeded'] for limiter in interrupted),
+            'rateLimited': sum(limiter.stats['rate_limited'] for limiter in interrupted)
+        }, f, ensure_ascii=False, indent=2)
+    logger.warning(f"호출 한도/제한으로 {pending}개 행이 남았습니다. 다음 실행에서 다시 시도합니다.")
+    return pending
 
 
 def main():
     """메인 함수"""
 
+    # 환경 변수 로드 (import만 할 때는 .env를 읽지 않음)
+    load_dotenv()
+
     # 정제된 데이터 로드
     input_file = 'data/raw/cleaned_stores.csv'
     if not os.path.exists(input_file):
@@ -240,8 +260,25 @@ def main():
         logger.info("또는 .env 파일을 생성해주세요.")
         sys.exit(1)
 
-    # Geocoding 실행
-    df = geocoder.geocode_dataframe(df, address_column='address')
+    # 1차: 로컬 인덱스 → 카카오 주소
+    address_engine = GeocodingEngine([LocalIndexProvider(), geocoder])
+    df = address_engine.geocode_dataframe(df)
+
+    # 이번 실행에서 주소로 찾은 좌표로 시/군/구 경계 생성 (키워드 검색 결과 검증용)
+    # 지난 실행의 경계 파일을 읽지 않으므로 경계도 단계 입력(cleaned_stores.csv)만으로 정해짐
+    by_address = df[df['geocoder'].isin([LocalIndexProvider.name, KakaoGeocoder.name])]
+    region_index = RegionIndex.from_points(by_address['address'], by_address['lat'], by_address['lng'])
+    region_index.save()
+
+    # 2차: 카카오 키워드 → URL 제공자 (주소 검색과 같은 API 키 한도를 공유)
+    keyword_geocoder = KakaoKeywordGeocoder(
+        rate_limiter=geocoder.rate_limiter, region_index=region_index,
+        name_column='name', market_column='market', region_column='address',
+        fields=('lat', 'lng', 'roadAddress')
+    )
+    keyword_engine = GeocodingEngine([keyword_geocoder, UrlGeocoder.from_env()])
+    df = keyword_engine.geocode_dataframe(df)
+    save_pending(df, address_engine.providers + keyword_engine.providers)
 
     # 결과 저장
     output_file = 'data/raw/geocoded_stores.csv'
@@ -262,4 +299,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_main('geocode', main)
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Geocoding 제공자 체인
+
+여러 Geocoding 제공자를 순서대로 시도합니다. 각 단계는 아직 좌표가 없는 행만 모아
+한 번에 처리하고, 같은 검색어는 한 번만 조회합니다.
+
+    로컬 인덱스 (이전에 만든 stores.json) → 카카오 주소 검색 → 카카오 키워드 검색 → URL 제공자
+
+제공자는 아래 속성/메서드를 가진 객체입니다.
+
+- name: 제공자 이름 (통계, geocoder 컬럼)
+- query_key(row): 행 → 검색어 (해시 가능한 값, 검색할 수 없으면 None)
+- lookup(key): 검색어 → {'lat', 'lng', ...} 또는 None (제공자별 캐시 사용)
+- validate(rows, coords): (선택) 단계 결과를 한꺼번에 검증/보정
+- fields: (선택) DataFrame에 옮길 결과 키 (없으면 전부)
+- save_cache(): (선택) 캐시 저장
+"""
+
+import os
+import json
+import logging
+from urllib.parse import quote
+
+import pandas as pd
+
+from rate_limiter import AdaptiveRateLimiter, QuotaExceededError, RateLimitedError
+from store_ids import store_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class LocalIndexProvider:
+    """이미 좌표를 알고 있는 가맹점 (이전 stores.json) 조회"""
+
+    name = 'local'
+
+    def __init__(self, stores_file='data/stores.json', name_column='name', address_column='address'):
+        """
+        Args:
+            stores_file: 이전에 생성한 stores.json 경로
+            name_column: 가맹점명 컬럼
+            address_column: 주소 컬럼
+        """
+        self.name_column = name_column
+        self.address_column = address_column
+
+        # 가맹점 지문 → 좌표
+        self.index = {}
+        if os.path.exists(stores_file):
+            try:
+                with open(stores_file, 'r', encoding='utf-8') as f:
+                    stores = json.load(f)['stores']
+                for store in stores:
+                    coord = {'lat': store['lat'], 'lng': store['lng']}
+                    if store.get('roadAddress'):
+                        coord['roadAddress'] = store['roadAddress']
+                    self.index[store_fingerprint(store['name'], store['address'])] = coord
+                logger.info(f"로컬 인덱스 로드 완료: {len(self.index)}개")
+            except Exception as e:
+                logger.warning(f"로컬 인덱스 로드 실패: {e}")
+
+    def query_key(self, row):
+        name, address = row.get(self.name_column), row.get(self.address_column)
+        if pd.isna(name) or pd.isna(address):
+            return None
+        return store_fingerprint(name, address)
+
+    def lookup(self, key):
+        return self.index.get(key)
+
+
+class UrlGeocoder:
+    """URL 템플릿으로 설정하는 범용 Geocoding 제공자"""
+
+    def __init__(self, url_template, name='url', lat_key='lat', lng_key='lng',
+                 address_column='address', headers=None, rate_limiter=None):
+        """
+        Args:
+            url_template: 요청 URL ({query} 자리에 주소가 들어감)
+                예: "https://nominatim.openstreetmap.org/search?format=json&q={query}"
+            name: 제공자 이름 (캐시 파일 이름에 사용)
+            lat_key, lng_key: 응답 JSON의 위도/경도 키 (응답이 배열이면 첫 번째 항목)
+            address_column: 주소 컬럼
+            headers: 요청 헤더
+            rate_limiter: 호출 속도 조절기 (None이면 제공자별로 새로 생성)
+        """
+        self.url_template = url_template
+        self.name = name
+        self.lat_key = lat_key
+        self.lng_key = lng_key
+        self.address_column = address_column
+        self.headers = headers or {}
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(
+            rate=1.0, max_rate=5.0, quota_file=f'data/raw/api_quota_{name}.json'
+        )
+
+        self.cache_file = f'data/raw/geocode_{name}_cache.json'
+        self.cache = {}
+        self.load_cache()
+
+    @classmethod
+    def from_env(cls):
+        """
+        환경 변수로 생성 (GEOCODER_URL이 없으면 None)
+
+        GEOCODER_URL, GEOCODER_NAME, GEOCODER_LAT_KEY, GEOCODER_LNG_KEY
+
+        Returns:
+            UrlGeocoder 또는 None
+        """
+        url_template = os.getenv('GEOCODER_URL')
+        if not url_template:
+            return None
+        return cls(
+            url_template,
+            name=os.getenv('GEOCODER_NAME', 'url'),
+            lat_key=os.getenv('GEOCODER_LAT_KEY', 'lat'),
+            lng_key=os.getenv('GEOCODER_LNG_KEY', 'lng'),
+            headers={'User-Agent': 'onnuri-map'}
+        )
+
+    def load_cache(self):
+        """캐시 파일 로드"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.cache = json.load(f)
+                logger.info(f"{self.name} 캐시 로드 완료: {len(self.cache)}개")
+            except Exception as e:
+                logger.warning(f"{self.name} 캐시 로드 실패: {e}")
+                self.cache = {}
+
+    def save_cache(self):
+        """캐시 파일 / 호출 수 저장"""
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        self.rate_limiter.save_quota()
+        logger.info(f"{self.name} 캐시 저장 완료: {len(self.cache)}개")
+
+    def query_key(self, row):
+        address = row.get(self.address_column)
+        return None if pd.isna(address) else str(address)
+
+    def lookup(self, key):
+        if key in self.cache:
+            return self.cache[key]
+
+        try:
+            response = self.rate_limiter.get(
+                self.url_template.format(query=quote(key)),
+                headers=self.headers,
+                timeout=10
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            if isinstance(data, list):
+                data = data[0] if data else {}
+            if self.lat_key not in data or self.lng_key not in data:
+                return None
+
+            coord = {'lat': float(data[self.lat_key]), 'lng': float(data[self.lng_key])}
+            self.cache[key] = coord
+            return coord
+
+        except QuotaExceededError:
+            raise
+
+        except RateLimitedError as e:
+            logger.warning(f"{self.name} 호출 제한으로 건너뜀: {e}")
+            return None
+
+        except Exception as e:
+            logger.debug(f"{self.name} 검색 실패 ({key}): {e}")
+            return None
+
+
+class GeocodingEngine:
+    """제공자 체인 Geocoding 엔진"""
+
+    def __init__(self, providers):
+        """
+        Args:
+            providers: 제공자 목록 (앞에서부터 시도)
+        """
+        self.providers = [provider for provider in providers if provider is not None]
+
+        # 제공자별 통계
+        self.stats = {provider.name: {'rows': 0, 'queries': 0, 'resolved': 0}
+                      for provider in self.providers}
+
+    def _run_tier(self, provider, rows):
+        """
+        한 제공자로 남은 행 일괄 처리
+
+        Args:
+            provider: 제공자
+            rows: 아직 좌표가 없는 행 (DataFrame)
+
+        Returns:
+            list: 행별 좌표 (없으면 None)
+        """
+        keys = [provider.query_key(row) for row in rows.to_dict('records')]
+
+        # 같은 검색어는 한 번만 조회
+        unique_keys = [key for key in dict.fromkeys(keys) if key is not None]
+        stats = self.stats[provider.name]
+        stats['rows'] += len(rows)
+        stats['queries'] += len(unique_keys)
+        logger.info(f"[{provider.name}] {len(rows)}개 행, 검색어 {len(unique_keys)}개")
+
+        results = {}
+        found = 0
+        try:
+            for i, key in enumerate(unique_keys, start=1):
+                results[key] = provider.lookup(key)
+                found += 1 if results[key] else 0
+                if i % 100 == 0 or i == len(unique_keys):
+                    logger.info(f"[{provider.name}] 진행: {i}/{len(unique_keys)} (성공: {found})")
+        except QuotaExceededError as e:
+            logger.warning(f"[{provider.name}] {e} - 남은 행은 다음 제공자로 넘깁니다.")
+
+        coords = [results.get(key) if key is not None else None for key in keys]
+        if hasattr(provider, 'validate'):
+            coords = provider.validate(rows, coords)
+        if hasattr(provider, 'save_cache'):
+            provider.save_cache()
+
+        return coords
+
+    def geocode_dataframe(self, df):
+        """
+        좌표가 없는 행을 제공자 순서대로 변환
+
+        lat/lng는 항상 채우고, 제공자가 돌려준 나머지 값(roadAddress 등)은
+        비어 있는 칸에만 채웁니다. geocoder 컬럼에 사용한 제공자 이름을 기록합니다.
+
+        Args:
+            df: pandas DataFrame
+
+        Returns:
+            pd.DataFrame: 좌표가 추가된 DataFrame
+        """
+        for column in ('lat', 'lng', 'geocoder'):
+            if column not in df.columns:
+                df[column] = None
+
+        logger.info(f"{len(df)}개 행 Geocoding 시작 (제공자: {', '.join(p.name for p in self.providers)})")
+
+        for provider in self.providers:
+            pending = df.index[df['lat'].isna()]
+            if len(pending) == 0:
+                break
+
+            coords = self._run_tier(provider, df.loc[pending])
+            fields = getattr(provider, 'fields', None)
+            for column in sorted({column for coord in coords if coord for column in coord}):
+                if column not in df.columns and (fields is None or column in fields):
+                    df[column] = None
+
+            resolved = 0
+            for idx, coord in zip(pending, coords):
+                if not coord:
+                    continue
+                for column, value in coord.items():
+                    if fields is not None and column not in fields:
+                        continue
+                    if column in ('lat', 'lng') or pd.isna(df.at[idx, column]):
+                        df.at[idx, column] = value
+                df.at[idx, 'geocoder'] = provider.name
+                resolved += 1
+            self.stats[provider.name]['resolved'] += resolved
+
+        # 통계 출력
+        logger.info("=" * 60)
+        logger.info("Geocoding 완료!")
+        for name, stats in self.stats.items():
+            logger.info(
+                f"{name}: {stats['rows']}개 행, 검색어 {stats['queries']}개, "
+                f"성공 {stats['resolved']}개"
+            )
+        success = df['lat'].notna().sum()
+        logger.info(f"전체 성공: {success}/{len(df)}개 ({success / len(df) * 100 if len(df) else 0:.1f}%)")
+        logger.info("=" * 60)
+
+        return df
@@ -8,14 +8,17 @@
 
 import os
 import sys
-import time
 import json
-import requests
 import pandas as pd
 from datetime import datetime
 from dotenv import load_dotenv
 import logging
 
+from rate_limiter import AdaptiveRateLimiter, QuotaExceededError, RateLimitedError
+from regions import RegionIndex, parse_region
+from geocode_chain import GeocodingEngine
+from profiling import run_main
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -23,20 +26,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 환경 변수 로드
-load_dotenv()
-
 
 class KakaoKeywordGeocoder:
     """카카오 로컬 검색 API 클래스"""
 
     API_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
 
-    def __init__(self, api_key=None):
+    name = 'kakao_keyword'
+
+    def __init__(self, api_key=None, rate_limiter=None, region_index=None,
+                 name_column='가맹점명', market_column='소속 시장명(또는 상점가)', region_column='소재지',
+                 fields=None):
         """
         Args:
             api_key: 카카오 REST API 키
+            rate_limiter: 호출 속도 조절기 (None이면 새로 생성, 여러 Geocoder가 공유 가능)
+            region_index: 결과 검증용 RegionIndex (None이면 data/raw/region_bounds.json 로드)
+            name_column: 가맹점명 컬럼
+            market_column: 시장명 컬럼
+            region_column: 지역(소재지) 컬럼 (지번 주소도 가능, 검색에는 시/도 + 시/군/구만 사용)
+            fields: DataFrame에 옮길 결과 키 (None이면 전부, GeocodingEngine에서 사용)
         """
+        self.name_column = name_column
+        self.market_column = market_column
+        self.region_column = region_column
+        self.region_index = region_index
+        self.fields = fields
         self.api_key = api_key or os.getenv('KAKAO_REST_API_KEY')
         if not self.api_key:
             raise ValueError("KAKAO_REST_API_KEY가 설정되지 않았습니다.")
@@ -45,12 +60,15 @@ class KakaoKeywordGeocoder:
             'Authorization': f'KakaoAK {self.api_key}'
         }
 
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+
         # API 호출 통계
         self.stats = {
             'total': 0,
             'success': 0,
             'failed': 0,
-            'cached': 0
+            'cached': 0,
+            'throttled': 0
         }
 
         # 캐시 (이미 검색한 키워드 저장)
@@ -69,19 +87,22 @@ class KakaoKeywordGeocoder:
                 self.cache = {}
 
     def save_cache(self, cache_file='data/raw/geocode_keyword_cache.json'):
-        """캐시 파일 저장"""
+        """캐시 파일 / 호출 수 저장"""
         os.makedirs(os.path.dirname(cache_file), exist_ok=True)
         with open(cache_file, 'w', encoding='utf-8') as f:
             json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        self.rate_limiter.save_quota()
         logger.info(f"캐시 저장 완료: {len(self.cache)}개")
+        logger.info(f"API 호출: {self.rate_limiter.summary()}")
 
-    def search_place(self, query, region=None):
+    def search_place(self, query, region=None, rect=None):
         """
         키워드로 장소 검색
 
         Args:
             query: 검색 키워드 (가맹점명 + 시장명)
             region: 지역 필터 (예: "서울")
+            rect: 검색 범위 사각형 ("min_x,min_y,max_x,max_y", 카카오 API rect 파라미터)
 
         Returns:
             dict: {'lat': 위도, 'lng': 경도, 'address': 주소, 'place_name': 장소명} 또는 None
@@ -90,6 +111,8 @@ class KakaoKeywordGeocoder:
 
         # 캐시 확인
         cache_key = f"{query}_{region}" if region else query
+        if rect:
+            cache_key = f"{cache_key}_{rect}"
         if cache_key in self.cache:
             self.stats['cached'] += 1
             return self.cache[cache_key]
@@ -99,8 +122,10 @@ class KakaoKeywordGeocoder:
             params = {'query': query}
             if region:
                 params['region'] = region
+            if rect:
+                params['rect'] = rect
 
-            response = requests.get(
+            response = self.rate_limiter.get(
                 self.API_URL,
                 headers=self.headers,
                 params=params,
@@ -131,101 +156,143 @@ class KakaoKeywordGeocoder:
             self.stats['failed'] += 1
             return None
 
+        except QuotaExceededError:
+            raise
+
+        except RateLimitedError as e:
+            # 호출 제한은 실패로 확정하지 않음 (캐시에 없으므로 다음 실행에서 다시 시도)
+            logger.warning(f"호출 제한으로 건너뜀: {e}")
+            self.stats['throttled'] += 1
+            return None
+
         except Exception as e:
             logger.debug(f"검색 실패 ({query}): {e}")
             self.stats['failed'] += 1
             return None
 
-        finally:
-            # Rate limiting (카카오 API 제한 준수)
-            time.sleep(0.1)  # 초당 10건
+    def _text(self, row, column):
+        value = row.get(column)
+        return '' if value is None or pd.isna(value) else str(value)
 
-    def geocode_dataframe(self, df):
+    def _region(self, row):
         """
-        DataFrame의 모든 가맹점 검색
+        검색에 쓸 지역 (시/도 + 시/군/구, 없으면 시/도)
+
+        주소 전체("서울 종로구 낙원동 252")를 검색어에 넣으면 지역 범위 검색이 아니라
+        번지까지 맞는 장소를 찾게 되므로 앞부분만 씁니다.
+        """
+        province, district = parse_region(self._text(row, self.region_column))
+        return district or province
+
+    def query_key(self, row):
+        """행 → (가맹점명, 시장명, 지역) (GeocodingEngine 제공자 인터페이스)"""
+        name = self._text(row, self.name_column)
+        if not name:
+            return None
+        return name, self._text(row, self.market_column), self._region(row)
+
+    def lookup(self, key):
+        """
+        여러 검색 전략을 차례로 시도 (GeocodingEngine 제공자 인터페이스)
 
         Args:
-            df: pandas DataFrame (가맹점명, 소속 시장명, 소재지 필요)
+            key: (가맹점명, 시장명, 지역)
 
         Returns:
-            pd.DataFrame: 좌표가 추가된 DataFrame
+            dict: 좌표 또는 None
         """
-        logger.info(f"{len(df)}개 가맹점 검색 시작...")
-
-        # 좌표 컬럼 추가
-        df['lat'] = None
-        df['lng'] = None
-        df['address'] = None
-        df['roadAddress'] = None
-        df['place_name'] = None
-        df['category'] = None
-
-        # 진행률 표시
-        total = len(df)
-        for idx, row in df.iterrows():
-            # 검색 쿼리 생성
-            name = str(row['가맹점명']) if pd.notna(row['가맹점명']) else ''
-            market = str(row['소속 시장명(또는 상점가)']) if pd.notna(row['소속 시장명(또는 상점가)']) else ''
-            region = str(row['소재지']) if pd.notna(row['소재지']) else ''
-
-            if not name:
+        name, market, region = key
+        queries = [
+            f"{name} {market} {region}",  # 전체 조합
+            f"{name} {market}",            # 가맹점 + 시장명
+            f"{name} {region}",            # 가맹점 + 지역
+        ]
+
+        for query in queries:
+            if not query.strip():
                 continue
 
-            # 여러 검색 전략 시도
-            queries = [
-                f"{name} {market} {region}",  # 전체 조합
-                f"{name} {market}",            # 가맹점 + 시장명
-                f"{name} {region}",            # 가맹점 + 지역
-            ]
+            coord = self.search_place(query.strip(), region)
+            if coord:
+                return coord
+        return None
 
-            coord = None
-            for query in queries:
-                if not query.strip():
-                    continue
+    def validate(self, rows, coords):
+        """
+        검색 결과가 지역의 시/도, 시/군/구 안에 있는지 검사하고 벗어난 가맹점 재검색
+
+        키워드 검색은 다른 지역의 같은 이름 가게를 돌려주는 경우가 많으므로,
+        전체 좌표를 지역 경계 사각형과 한 번에 비교한 뒤 벗어난 가맹점만
+        해당 지역 rect로 범위를 좁혀 다시 검색합니다.
+        재검색에도 못 찾으면 결과를 버려 다음 제공자/실패 목록으로 넘깁니다.
 
-                coord = self.search_place(query.strip(), region)
-                if coord:
-                    break
+        Args:
+            rows: 검색한 행 (DataFrame)
+            coords: 행별 검색 결과 (없으면 None)
+
+        Returns:
+            list: 검증된 행별 결과
+        """
+        region_index = self.region_index or RegionIndex.load()
+        regions = rows[self.region_column].tolist() if self.region_column in rows.columns else [None] * len(rows)
+
+        inside = region_index.contains(
+            [coord['lat'] if coord else None for coord in coords],
+            [coord['lng'] if coord else None for coord in coords],
+            regions
+        )
+        mismatched = [i for i in range(len(coords)) if not inside[i]]
+        logger.info(f"지역 불일치: {len(mismatched)}/{sum(1 for c in coords if c)}개, 범위 지정 재검색...")
 
+        coords = list(coords)
+        records = rows.to_dict('records')
+        fixed = 0
+        for n, i in enumerate(mismatched):
+            name = self._text(records[i], self.name_column)
+            market = self._text(records[i], self.market_column)
+            rect = region_index.rect(regions[i])
+
+            coord = None
+            try:
+                for query in (f"{name} {market}", name):
+                    if query.strip():
+                        coord = self.search_place(query.strip(), rect=rect)
+                        if coord:
+                            break
+            except QuotaExceededError as e:
+                logger.warning(f"{e} - 재검색을 중단합니다.")
+                for j in mismatched[n:]:
+                    coords[j] = None
+                break
+
+            coords[i] = coord
             if coord:
-                df.at[idx, 'lat'] = coord['lat']
-                df.at[idx, 'lng'] = coord['lng']
-                df.at[idx, 'address'] = coord['address']
-                df.at[idx, 'roadAddress'] = coord['roadAddress']
-                df.at[idx, 'place_name'] = coord['place_name']
-                df.at[idx, 'category'] = coord['category']
-
-            # 진행률 출력
-            if (idx + 1) % 10 == 0 or (idx + 1) == total:
-                success_rate = (self.stats['success'] / self.stats['total'] * 100) if self.stats['total'] > 0 else 0
-                logger.info(
-                    f"진행: {idx + 1}/{total} "
-                    f"(성공: {self.stats['success']}, "
-                    f"실패: {self.stats['failed']}, "
-                    f"캐시: {self.stats['cached']}, "
-                    f"성공률: {success_rate:.1f}%)"
-                )
-
-        # 캐시 저장
-        self.save_cache()
-
-        # 통계 출력
-        logger.info("=" * 60)
-        logger.info("Geocoding 완료!")
-        logger.info(f"전체: {self.stats['total']}개 검색 시도")
-        logger.info(f"성공: {self.stats['success']}개")
-        logger.info(f"실패: {self.stats['failed']}개")
-        logger.info(f"캐시: {self.stats['cached']}개")
-        success_rate = (self.stats['success'] / self.stats['total'] * 100) if self.stats['total'] > 0 else 0
-        logger.info(f"성공률: {success_rate:.1f}%")
-        logger.info("=" * 60)
-
-        return df
+                fixed += 1
+
+        logger.info(f"재검색 성공: {fixed}개, 결과 제거: {len(mismatched) - fixed}개")
+        return coords
+
+    def geocode_dataframe(self, df):
+        """
+        DataFrame의 모든 가맹점 검색 (키워드 검색만 사용)
+
+        Args:
+            df: pandas DataFrame (가맹점명, 소속 시장명, 소재지 필요)
+
+        Returns:
+            pd.DataFrame: 좌표가 추가된 DataFrame
+        """
+        for column in ('lat', 'lng', 'address', 'roadAddress', 'place_name', 'category'):
+            df[column] = None
+        return GeocodingEngine([self]).geocode_dataframe(df)
 
 
 def main():
     """메인 함수"""
 
+    # 환경 변수 로드 (import만 할 때는 .env를 읽지 않음)
+    load_dotenv()
+
     # 서울 샘플 데이터 로드
     input_file = 'data/raw/seoul_sample_100.csv'
     if not os.path.exists(input_file):
@@ -245,7 +312,7 @@ def main():
         logger.info("또는 .env 파일을 생성해주세요.")
         sys.exit(1)
 
-    # Geocoding 실행
+    # Geocoding 실행 (지역 검증 포함)
     df = geocoder.geocode_dataframe(df)
 
     # 결과 저장
@@ -275,4 +342,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_main('geocode_keyword', main)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+온누리 가맹점 데이터 파이프라인 CLI
+
+    python scripts/onnuri.py fetch      # 원본 로드 및 정제
+    python scripts/onnuri.py geocode    # 주소 → 좌표 변환
+    python scripts/onnuri.py generate   # JSON/바이너리 생성 및 배포
+    python scripts/onnuri.py all        # 전체 (한 프로세스에서 실행)
+
+fetch는 먼저 원본 파일을 조건부로 다운로드합니다 (바뀌지 않았으면 304 응답 한 번).
+다운로드에 실패하면 data/raw의 기존 파일을 쓰고, --offline이면 다운로드하지 않습니다.
+
+각 단계는 입력 파일(및 단계 스크립트)이 출력 파일보다 새로울 때만 실행합니다.
+입력 내용과 설정이 이전 실행과 같으면 실행하지 않고 data/cache에 보관한 출력을
+복원합니다 (stage_cache.py). --force를 주면 항상 실행합니다.
+
+--profile을 주면 실행한 단계마다 cProfile/tracemalloc 결과를 data/profile에 남깁니다
+(profiling.py). 캐시에서 복원하거나 건너뛴 단계는 프로파일하지 않습니다.
+
+pandas 등 무거운 모듈은 단계를 실제로 실행할 때만 import하므로,
+--help나 모든 단계가 최신인 경우에는 바로 끝납니다.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+
+from sources import source_files
+from stage_cache import StageCache
+from profiling import add_profile_arguments
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def download_source():
+    from fetch_data import OnnuriDataFetcher
+    OnnuriDataFetcher().download_data()
+
+
+def run_fetch():
+    from fetch_data import main
+    # 다운로드는 prepare(download_source)에서 이미 함
+    main(download=False)
+
+
+def run_geocode():
+    from geocode import main
+    main()
+
+
+def run_generate():
+    from generate_json import main
+    main()
+
+
+def publish_generate():
+    from generate_json import publish_outputs
+    publish_outputs()
+
+
+def geocode_config():
+    """geocode 단계 결과에 영향을 주는 설정 (API 키 제외)"""
+    return {name: os.getenv(name) for name in
+            ('GEOCODER_URL', 'GEOCODER_NAME', 'GEOCODER_LAT_KEY', 'GEOCODER_LNG_KEY')}
+
+
+def geocode_pending():
+    """
+    지난 geocode 실행에서 호출 한도/제한으로 남은 행 수 (geocode.py의 PENDING_FILE)
+
+    남은 행이 있으면 출력이 최신이어도 건너뛰지 않고, 실행 결과도 캐시하지 않습니다.
+    남은 행의 결과는 입력 파일이 아니라 API 한도와 제공자 캐시에 따라 달라지기 때문입니다.
+
+    Returns:
+        int: 남은 행 수 (없으면 0)
+    """
+    pending_file = 'data/raw/geocode_pending.json'
+    if not os.path.exists(pending_file):
+        return 0
+    try:
+        with open(pending_file, 'r', encoding='utf-8') as f:
+            return int(json.load(f).get('rows', 0)) or 1
+    except Exception:
+        return 1
+
+
+# 단계 정의
+# - inputs: 입력 파일 함수 / outputs: 출력 파일 / run: 실행 함수
+# - scripts: 단계 스크립트 (바뀌면 다시 실행) / config: 설정값 함수
+# - pending: 다시 시도할 항목 수 함수 (0이 아니면 건너뛰거나 캐시하지 않음, 선택)
+# - restored: 캐시에서 복원한 뒤 실행할 함수 (캐시에 넣지 않는 출력을 다시 만듦, 선택)
+# - prepare: 입력 확인 전에 실행할 함수 (원본 다운로드 등, --offline이면 생략, 선택)
+STAGES = {
+    'fetch': {
+        'inputs': source_files,
+        'outputs': ['data/raw/cleaned_stores.csv'],
+        'run': run_fetch,
+        'prepare': download_source,
+        'scripts': ['fetch_data.py', 'sources.py', 'dedup.py', 'regions.py'],
+        'config': lambda: {'ONNURI_SOURCE_PATTERN': os.getenv('ONNURI_SOURCE_PATTERN')}
+    },
+    'geocode': {
+        'inputs': lambda: ['data/raw/cleaned_stores.csv'],
+        'outputs': ['data/raw/geocoded_stores.csv', 'data/raw/region_bounds.json'],
+        'run': run_geocode,
+        'scripts': ['geocode.py', 'geocode_chain.py', 'geocode_keyword.py', 'rate_limiter.py',
+                    'regions.py', 'store_ids.py'],
+        'config': geocode_config,
+        'pending': geocode_pending
+    },
+    'generate': {
+        'inputs': lambda: ['data/raw/geocoded_stores.csv', 'data/store_ids.json'],
+        'outputs': ['data/stores.json', 'data/stores.bin', 'data/clusters.json', 'data/facets.json',
+                    'data/nearby.json', 'data/places.json', 'data/metadata.json', 'data/store_ids.json'],
+        'run': run_generate,
+        'scripts': ['generate_json.py', 'store_binary.py', 'store_ids.py', 'store_query.py', 'dedup.py',
+                    'place_index.py', 'regions.py'],
+        'config': dict,
+        # docs/data(manifest, 해시 파일, 패치, 샤드)는 복원한 data/ 기준으로 다시 배포
+        'restored': publish_generate
+    },
+}
+
+
+def is_up_to_date(inputs, outputs):
+    """
+    출력 파일이 모두 있고 입력 파일보다 새로운지 확인
+
+    Args:
+        inputs: 입력 파일 목록
+        outputs: 출력 파일 목록
+
+    Returns:
+        bool
+    """
+    if not inputs or not all(os.path.exists(path) for path in outputs):
+        return False
+    # 출력이기도 한 입력(store_ids.json)은 단계가 다시 쓰므로 비교에서 제외
+    inputs = [path for path in inputs if path not in outputs]
+    existing = [path for path in inputs if os.path.exists(path)]
+    if len(existing) < len(inputs):
+        return False
+    newest_input = max(os.path.getmtime(path) for path in existing)
+    oldest_output = min(os.path.getmtime(path) for path in outputs)
+    return oldest_output >= newest_input
+
+
+def run_stage(name, force=False, cache=None, profile=None, offline=False):
+    """
+    단계 실행
+
+    1. 출력이 입력보다 새로우면 건너뜀
+    2. 입력 내용/설정이 같은 이전 출력이 캐시에 있으면 복원
+    3. 둘 다 아니면 실행하고 출력을 캐시에 보관
+
+    출력이기도 한 입력(generate의 store_ids.json)은 mtime 비교에서 빼고,
+    캐시 키는 실행 후 내용으로 계산합니다. 그래야 같은 입력으로 다시 실행하면 건너뛰거나 복원합니다.
+
+    지난 실행에서 다시 시도할 항목이 남았으면(stage['pending']) 1, 2를 하지 않고,
+    실행 후에도 남았으면 캐시에 보관하지 않습니다.
+
+    Args:
+        name: 단계 이름
+        force: 최신이거나 캐시가 있어도 실행
+        cache: StageCache (None이면 캐시 사용 안 함)
+        profile: 프로파일 설정 {'dir': 출력 폴더, 'top': 상위 개수} (None이면 사용 안 함)
+        offline: stage['prepare'](원본 다운로드) 생략
+
+    Returns:
+        str: 'skipped', 'restored', 'ran'
+    """
+    stage = STAGES[name]
+    if 'prepare' in stage and not offline:
+        stage['prepare']()
+
+    data_inputs = stage['inputs']()
+    inputs = data_inputs + [os.path.join(SCRIPTS_DIR, script) for script in stage['scripts']]
+    outputs = stage['outputs']
+    pending = stage.get('pending', lambda: 0)
+
+    retry = pending()
+    if retry:
+        logger.info(f"[{name}] 지난 실행에서 남은 {retry}개 항목을 다시 시도합니다.")
+
+    if not force and not retry and is_up_to_date(inputs, outputs):
+        logger.info(f"[{name}] 입력이 바뀌지 않아 건너뜁니다. (다시 실행하려면 --force)")
+        return 'skipped'
+
+    # 원본 파일이 없으면 캐시 없이 실행 (단계에서 안내 메시지 출력)
+    key = None
+    if cache is not None and data_inputs:
+        key = cache.stage_key(name, inputs, stage['config']())
+        if not force and not retry and cache.restore(name, key, outputs):
+            logger.info(f"[{name}] 입력 내용이 같아 캐시에서 복원했습니다. ({key[:12]})")
+            if 'restored' in stage:
+                stage['restored']()
+            return 'restored'
+
+    start = time.perf_counter()
+    logger.info(f"[{name}] 시작")
+    if profile is None:
+        stage['run']()
+    else:
+        from profiling import StageProfiler
+        with StageProfiler(name, profile['dir'], profile['top']):
+            stage['run']()
+    logger.info(f"[{name}] 완료 ({time.perf_counter() - start:.1f}초)")
+
+    left = pending()
+    if left:
+        logger.info(f"[{name}] 남은 항목 {left}개가 있어 출력을 캐시하지 않습니다.")
+        return 'ran'
+
+    # 출력이기도 한 입력은 실행하며 바뀌므로 실행 후 내용으로 키를 다시 계산
+    # (실행 전 내용으로 보관하면 같은 입력으로 다시 실행할 때 키가 맞지 않음)
+    if key is not None and set(data_inputs) & set(outputs):
+        key = cache.stage_key(name, inputs, stage['config']())
+    if key is not None and cache.store(name, key, outputs):
+        logger.info(f"[{name}] 출력을 캐시에 보관했습니다. ({key[:12]})")
+    return 'ran'
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(
+        prog='onnuri',
+        description='온누리 가맹점 데이터 파이프라인'
+    )
+    parser.add_argument('stage', choices=list(STAGES) + ['all'], help='실행할 단계')
+    parser.add_argument('--force', action='store_true', help='입력이 그대로여도 실행')
+    parser.add_argument('--no-cache', action='store_true', help='단계 출력 캐시 사용 안 함')
+    parser.add_argument('--cache-dir', default='data/cache', help='단계 출력 캐시 폴더')
+    parser.add_argument('--offline', action='store_true', help='원본 파일 다운로드 생략 (data/raw의 파일만 사용)')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    # 단계 스크립트가 서로를 바로 import하므로 scripts 폴더를 경로에 추가
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+
+    cache = None if args.no_cache else StageCache(args.cache_dir)
+    profile = {'dir': args.profile_dir, 'top': args.profile_top} if args.profile else None
+
+    # 앞 단계가 출력을 새로 쓰면 뒤 단계는 mtime으로 감지해 캐시 키를 다시 계산
+    stages = list(STAGES) if args.stage == 'all' else [args.stage]
+    for name in stages:
+        run_stage(name, args.force, cache, profile, args.offline)
+
+
+if __name__ == '__main__':
+    main()
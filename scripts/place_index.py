@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+장소 자동완성 인덱스 (시장명, 시/도, 시/군/구, 동/읍/면, 도로명)
+
+가맹점 주소와 소속 시장명에서 장소 이름을 모으고, 한글을 자모 단위로 풀어 쓴
+검색 키로 정렬해 둡니다. 입력 중인 글자("광장ㅅ", "가산" 입력 중의 "갓")도 자모 단위로는
+완성된 이름의 앞부분이므로 이진 탐색 한 번으로 접두어 검색이 됩니다.
+
+자모 분해 규칙은 프론트엔드 docs/js/places.js의 PlaceIndex.searchKey와 같아야 합니다.
+"""
+
+import re
+import unicodedata
+
+from dedup import normalize_address
+from regions import PROVINCE_BOUNDS
+
+# 장소 종류 (places.json의 kinds 순서)
+PLACE_KINDS = ('market', 'province', 'district', 'dong', 'road')
+
+# 초성 / 중성 / 종성 (한글 호환 자모, 키보드로 입력되는 글자)
+_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+              'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 겹모음 / 겹받침은 두 번 입력하는 글자이므로 나눔 ("과" 입력 중에는 "고"가 먼저 보임)
+_COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+# 검색 키에 남길 글자 (공백/기호 제거)
+_KEY_CHARS = re.compile(r'[^0-9a-z가-힣ㄱ-ㅣ]')
+
+# 주소 토큰 종류
+_DISTRICT_SUFFIX = re.compile(r'(시|군|구)$')
+_DONG_SUFFIX = re.compile(r'(동|읍|면|리|가)$')
+_ROAD_SUFFIX = re.compile(r'(로|길)$')
+
+
+def decompose_hangul(text):
+    """
+    한글 음절을 호환 자모로 분해 (겹모음/겹받침도 나눔)
+
+    Args:
+        text: 문자열
+
+    Returns:
+        str: 자모 문자열 (한글이 아닌 글자는 그대로)
+    """
+    jamo = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            index = code - _HANGUL_BASE
+            jamo.append(_CHOSEONG[index // 588])
+            jamo.append(_COMPOUND_JAMO.get(_JUNGSEONG[index % 588 // 28], _JUNGSEONG[index % 588 // 28]))
+            jong = _JONGSEONG[index % 28]
+            jamo.append(_COMPOUND_JAMO.get(jong, jong))
+        else:
+            jamo.append(_COMPOUND_JAMO.get(char, char))
+    return ''.join(jamo)
+
+
+def search_key(text):
+    """
+    검색 키 (NFC, 소문자, 공백/기호 제거 후 자모 분해)
+
+    NFKC는 호환 자모(ㄱ)를 조합용 자모로 바꾸므로 NFC를 씁니다.
+
+    Args:
+        text: 장소 이름 또는 입력한 검색어
+
+    Returns:
+        str: 검색 키
+    """
+    text = unicodedata.normalize('NFC', str(text)).lower()
+    return decompose_hangul(_KEY_CHARS.sub('', text))
+
+
+def address_places(address):
+    """
+    주소에서 장소 이름 추출
+
+        "서울특별시 종로구 종로5가 123"   → 서울 / 종로구 / 종로5가(동)
+        "경기도 수원시 팔달구 정조로 1"   → 경기 / 수원시 / 팔달구 / 정조로(도로)
+
+    Args:
+        address: 주소 문자열 (지번 또는 도로명)
+
+    Returns:
+        list: (종류, 이름, 상위 지역) 튜플
+    """
+    tokens = normalize_address(address).split()
+    if not tokens or tokens[0] not in PROVINCE_BOUNDS:
+        return []
+
+    province = tokens[0]
+    places = [('province', province, '')]
+
+    # 시/군/구 (일반구가 있는 시는 "수원시 팔달구"처럼 두 토큰, 각각 장소로 추가)
+    region = province
+    i = 1
+    while i < len(tokens) and i <= 2 and _DISTRICT_SUFFIX.search(tokens[i]):
+        places.append(('district', tokens[i], region))
+        region = f"{region} {tokens[i]}"
+        i += 1
+
+    # 첫 동/읍/면/리/가 또는 도로명 (숫자로 시작하는 번지 토큰 전까지)
+    for token in tokens[i:]:
+        if token[0].isdigit():
+            break
+        if _ROAD_SUFFIX.search(token):
+            places.append(('road', token, region))
+            break
+        if _DONG_SUFFIX.search(token):
+            places.append(('dong', token, region))
+            break
+
+    return places
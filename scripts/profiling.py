@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파이프라인 단계 프로파일링 (--profile)
+
+단계를 cProfile과 tracemalloc으로 감싸 실행하고 결과를 파일로 남깁니다.
+표준 라이브러리만 사용하며, 결과는 네트워크 없이 표준 도구로 볼 수 있습니다.
+
+    data/profile/<단계>.pstats      # cProfile 결과
+                                    #   python -m pstats data/profile/geocode.pstats
+                                    #   (snakeviz, gprof2dot 등에서도 열림)
+    data/profile/<단계>.tracemalloc # tracemalloc 스냅샷 (tracemalloc.Snapshot.load)
+    data/profile/<단계>.txt         # 시간 구분 + 상위 함수 + 상위 메모리 할당 위치
+
+시간은 벽시계 / CPU / 네트워크 응답 대기 / 호출 속도 조절 대기로 나눠 기록합니다.
+네트워크 시간은 API를 호출하는 쪽(rate_limiter.py 등)에서 record_time으로 알려줍니다.
+"""
+
+import os
+import io
+import sys
+import time
+import pstats
+import cProfile
+import argparse
+import logging
+import tracemalloc
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+# 구분별 누적 시간 (초): 'network' = 응답 대기, 'throttle' = 호출 속도 조절 대기
+TIMERS = defaultdict(float)
+
+TIMER_LABELS = {
+    'network': '네트워크 응답 대기',
+    'throttle': '호출 속도 조절 대기',
+}
+
+
+def record_time(category, seconds):
+    """
+    구분별 시간 누적 (프로파일링 중이 아니어도 호출 가능)
+
+    Args:
+        category: 구분 ('network', 'throttle')
+        seconds: 시간 (초)
+    """
+    TIMERS[category] += seconds
+
+
+class StageProfiler:
+    """단계 하나를 cProfile + tracemalloc으로 감싸는 컨텍스트 매니저"""
+
+    def __init__(self, name, output_dir='data/profile', top=25, frames=1):
+        """
+        Args:
+            name: 단계 이름 (출력 파일 이름)
+            output_dir: 출력 폴더
+            top: 보고서에 남길 상위 함수/할당 위치 수
+            frames: 할당 위치마다 저장할 호출 스택 깊이 (클수록 느림)
+        """
+        self.name = name
+        self.output_dir = output_dir
+        self.top = top
+        self.frames = frames
+        self.profiler = cProfile.Profile()
+
+    def __enter__(self):
+        TIMERS.clear()
+        tracemalloc.start(self.frames)
+        self.start_wall = time.perf_counter()
+        self.start_times = os.times()
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.disable()
+        wall = time.perf_counter() - self.start_wall
+        end_times = os.times()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        timings = {
+            'wall': wall,
+            'cpu': (end_times.user - self.start_times.user) + (end_times.system - self.start_times.system),
+            # 작업 프로세스(fetch의 파일 병렬 로드 등)의 CPU 시간. cProfile에는 포함되지 않음
+            'children_cpu': (end_times.children_user - self.start_times.children_user) +
+                            (end_times.children_system - self.start_times.children_system),
+        }
+
+        try:
+            self.save(snapshot, peak, timings)
+        except Exception as e:
+            logger.warning(f"[{self.name}] 프로파일 저장 실패: {e}")
+        return False
+
+    def save(self, snapshot, peak, timings):
+        """
+        결과 파일 저장
+
+        Args:
+            snapshot: tracemalloc.Snapshot
+            peak: 최대 추적 메모리 (바이트)
+            timings: 구분별 시간 (초)
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, self.name)
+
+        self.profiler.dump_stats(f"{base}.pstats")
+        snapshot.dump(f"{base}.tracemalloc")
+
+        # 시간 구분
+        waited = sum(TIMERS.values())
+        lines = [f"[{self.name}] 프로파일", "", "시간:"]
+        lines.append(f"  벽시계: {timings['wall']:.2f}초")
+        lines.append(f"  CPU: {timings['cpu']:.2f}초")
+        if timings['children_cpu']:
+            lines.append(f"  작업 프로세스 CPU: {timings['children_cpu']:.2f}초")
+        for category, seconds in sorted(TIMERS.items()):
+            lines.append(f"  {TIMER_LABELS.get(category, category)}: {seconds:.2f}초")
+        lines.append(f"  기타 대기: {max(timings['wall'] - timings['cpu'] - waited, 0):.2f}초")
+
+        # 상위 함수 (누적 시간)
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profiler, stream=stream)
+        stats.strip_dirs().sort_stats('cumulative').print_stats(self.top)
+        lines += ["", f"상위 함수 (누적 시간 {self.top}개):", stream.getvalue().strip()]
+
+        # 상위 메모리 할당 위치 (스냅샷 시점에 남아 있는 메모리)
+        lines += ["", f"최대 추적 메모리: {peak / 1024 / 1024:.1f}MB",
+                  f"상위 할당 위치 (남아 있는 메모리 {self.top}개):"]
+        for stat in snapshot.statistics('lineno')[:self.top]:
+            lines.append(f"  {stat}")
+
+        with open(f"{base}.txt", 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        waits = ', '.join(f"{TIMER_LABELS.get(category, category)} {seconds:.1f}초"
+                          for category, seconds in sorted(TIMERS.items()))
+        logger.info(
+            f"[{self.name}] 프로파일 저장: {base}.txt/.pstats/.tracemalloc "
+            f"(벽시계 {timings['wall']:.1f}초, CPU {timings['cpu']:.1f}초"
+            f"{', ' + waits if waits else ''}, 최대 메모리 {peak / 1024 / 1024:.1f}MB)"
+        )
+
+
+def add_profile_arguments(parser):
+    """
+    --profile 관련 인자 추가
+
+    Args:
+        parser: argparse.ArgumentParser
+    """
+    parser.add_argument('--profile', action='store_true',
+                        help='cProfile/tracemalloc 결과를 --profile-dir에 저장')
+    parser.add_argument('--profile-dir', default='data/profile', help='프로파일 결과 폴더')
+    parser.add_argument('--profile-top', type=int, default=25,
+                        help='보고서에 남길 상위 함수/할당 위치 수')
+
+
+def run_main(name, main, argv=None):
+    """
+    단계 스크립트 실행 (--profile이면 프로파일링)
+
+        if __name__ == '__main__':
+            run_main('fetch', main)
+
+    Args:
+        name: 단계 이름
+        main: 단계 메인 함수 (인자 없음)
+        argv: 명령행 인자 (None이면 sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description=f'{name} 단계 실행')
+    add_profile_arguments(parser)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if not args.profile:
+        main()
+        return
+
+    with StageProfiler(name, args.profile_dir, args.profile_top):
+        main()
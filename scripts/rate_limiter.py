@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+카카오 API 호출 속도 조절 (AIMD)
+
+정상 응답이 이어지면 초당 호출 수를 조금씩(가산) 올리고,
+429(호출 제한)/5xx 응답이나 응답 지연 증가가 보이면 절반으로(승산) 줄입니다.
+일일 호출 한도는 파일에 기록해 여러 번 실행해도 합산됩니다.
+
+주소 검색(geocode.py)과 키워드 검색(geocode_keyword.py)이 같은 API 키 한도를 쓰므로
+같은 한도 파일을 공유합니다.
+"""
+
+import os
+import json
+import time
+import logging
+from datetime import date
+
+import requests
+
+from profiling import record_time
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaExceededError(Exception):
+    """일일 호출 한도 초과"""
+
+
+class RateLimitedError(Exception):
+    """재시도 후에도 호출 제한(429)이 풀리지 않음"""
+
+
+class AdaptiveRateLimiter:
+    """AIMD 방식 호출 속도 조절 클래스"""
+
+    def __init__(self, rate=10.0, min_rate=1.0, max_rate=30.0, increase=1.0, decrease=0.5,
+                 daily_quota=100000, quota_file='data/raw/api_quota.json', max_retries=5):
+        """
+        Args:
+            rate: 시작 초당 호출 수
+            min_rate: 최소 초당 호출 수
+            max_rate: 최대 초당 호출 수
+            increase: 정상 응답마다 올릴 초당 호출 수 (가산 증가)
+            decrease: 제한/지연 시 곱할 비율 (승산 감소)
+            daily_quota: 일일 호출 한도 (카카오 로컬 API 기본 한도)
+            quota_file: 일일 호출 수 기록 파일
+            max_retries: 429/5xx 재시도 횟수
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.daily_quota = daily_quota
+        self.quota_file = quota_file
+        self.max_retries = max_retries
+
+        self.next_time = 0.0
+
+        # 응답 시간 (지수 이동 평균 / 관측된 최저값)
+        self.latency = None
+        self.base_latency = None
+
+        # 오늘 사용한 호출 수
+        self.quota = {'date': date.today().isoformat(), 'used': 0}
+        self.load_quota()
+
+        self.stats = {
+            'requests': 0,
+            'throttled': 0,
+            'retries': 0,
+            # 한도 초과 / 재시도 후에도 제한으로 포기한 요청 (남은 행은 다음 실행에서 다시 시도)
+            'quota_exceeded': 0,
+            'rate_limited': 0,
+            # 응답 대기 / 속도 조절 대기 시간 (초). 나머지는 응답 처리 등 CPU 시간
+            'network_time': 0.0,
+            'wait_time': 0.0
+        }
+
+    def load_quota(self):
+        """일일 호출 수 기록 로드 (날짜가 바뀌었으면 0부터)"""
+        if os.path.exists(self.quota_file):
+            try:
+                with open(self.quota_file, 'r', encoding='utf-8') as f:
+                    quota = json.load(f)
+                if quota.get('date') == self.quota['date']:
+                    self.quota = quota
+                    logger.info(f"오늘 API 호출 수: {quota['used']}/{self.daily_quota}")
+            except Exception as e:
+                logger.warning(f"호출 수 기록 로드 실패: {e}")
+
+    def save_quota(self):
+        """일일 호출 수 기록 저장"""
+        os.makedirs(os.path.dirname(self.quota_file), exist_ok=True)
+        with open(self.quota_file, 'w', encoding='utf-8') as f:
+            json.dump(self.quota, f)
+
+    @property
+    def remaining(self):
+        """오늘 남은 호출 수"""
+        return max(self.daily_quota - self.quota['used'], 0)
+
+    def acquire(self):
+        """
+        다음 호출 시각까지 대기
+
+        Raises:
+            QuotaExceededError: 일일 한도를 다 쓴 경우
+        """
+        if self.quota['used'] >= self.daily_quota:
+            self.stats['quota_exceeded'] += 1
+            raise QuotaExceededError(f"일일 호출 한도 초과 ({self.daily_quota})")
+
+        now = time.monotonic()
+        if self.next_time > now:
+            wait = self.next_time - now
+            time.sleep(wait)
+            self.stats['wait_time'] += wait
+            record_time('throttle', wait)
+            now = self.next_time
+        self.next_time = now + 1.0 / self.rate
+
+        self.quota['used'] += 1
+        if self.quota['used'] % 100 == 0:
+            self.save_quota()
+
+    def _slow_down(self, reason, wait=None):
+        """승산 감소 (wait초 동안 호출 중지)"""
+        self.rate = max(self.rate * self.decrease, self.min_rate)
+        if wait:
+            self.next_time = max(self.next_time, time.monotonic() + wait)
+        logger.debug(f"호출 속도 감소 ({reason}): {self.rate:.1f}건/초")
+
+    def record(self, response, latency):
+        """
+        응답 결과로 호출 속도 조정
+
+        Args:
+            response: requests.Response
+            latency: 응답 시간 (초)
+        """
+        status = response.status_code
+        if status == 429 or status >= 500:
+            self.stats['throttled'] += 1
+            retry_after = response.headers.get('Retry-After')
+            wait = float(retry_after) if retry_after and retry_after.isdigit() else None
+            self._slow_down(f"HTTP {status}", wait)
+            return
+
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        self.base_latency = self.latency if self.base_latency is None else min(self.base_latency, self.latency)
+
+        # 응답이 평소의 2배 이상 느려지면 서버 부하로 보고 감소
+        if self.latency > self.base_latency * 2 and self.latency - self.base_latency > 0.1:
+            self._slow_down(f"지연 {self.latency * 1000:.0f}ms")
+            self.base_latency = self.latency / 2
+            return
+
+        # 응답 헤더에 남은 호출 수가 있으면 한도에 맞춤
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.isdigit():
+            self.quota['used'] = max(self.quota['used'], self.daily_quota - int(remaining))
+
+        # 호출마다 increase / rate씩 올려 초당 약 increase만큼 증가
+        self.rate = min(self.rate + self.increase / self.rate, self.max_rate)
+
+    def get(self, url, **kwargs):
+        """
+        속도 조절 + 429/5xx 재시도가 적용된 GET 요청
+
+        Args:
+            url: 요청 URL
+            **kwargs: requests.get 인자
+
+        Returns:
+            requests.Response
+
+        Raises:
+            QuotaExceededError: 일일 한도를 다 쓴 경우
+            RateLimitedError: 재시도 후에도 429/5xx인 경우
+        """
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            self.stats['requests'] += 1
+
+            start = time.monotonic()
+            response = requests.get(url, **kwargs)
+            latency = time.monotonic() - start
+            self.stats['network_time'] += latency
+            record_time('network', latency)
+            self.record(response, latency)
+
+            if response.status_code != 429 and response.status_code < 500:
+                return response
+            if attempt < self.max_retries:
+                # 지수 백오프 (Retry-After가 더 길면 그쪽을 따름)
+                self.stats['retries'] += 1
+                self.next_time = max(self.next_time, time.monotonic() + min(2 ** attempt, 30))
+
+        self.stats['rate_limited'] += 1
+        raise RateLimitedError(f"HTTP {response.status_code} ({self.max_retries}회 재시도)")
+
+    @property
+    def interrupted(self):
+        """한도 초과나 호출 제한으로 포기한 요청이 있는지"""
+        return self.stats['quota_exceeded'] > 0 or self.stats['rate_limited'] > 0
+
+    def summary(self):
+        """호출 통계 문자열"""
+        return (
+            f"요청 {self.stats['requests']}건, 제한 {self.stats['throttled']}건, "
+            f"재시도 {self.stats['retries']}건, 최종 속도 {self.rate:.1f}건/초, "
+            f"응답 대기 {self.stats['network_time']:.1f}초, 속도 조절 대기 {self.stats['wait_time']:.1f}초, "
+            f"오늘 사용 {self.quota['used']}/{self.daily_quota}"
+        )
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시/도, 시/군/구 영역 인덱스
+
+주소 앞부분에서 시/도와 시/군/구를 읽고, 해당 지역의 경계 사각형(bounding box)으로
+좌표가 그 지역 안에 있는지 한 번에(벡터 연산) 검사합니다.
+
+- 시/도: 아래 PROVINCE_BOUNDS (섬 포함 대략적인 범위)
+- 시/군/구: 주소 Geocoding 결과에서 구한 좌표 분포 (data/raw/region_bounds.json)
+"""
+
+import os
+import json
+import unicodedata
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 시/도 이름 정규화 (공공데이터/카카오 응답의 긴 이름 → 짧은 이름)
+PROVINCE_ALIASES = {
+    '서울특별시': '서울',
+    '부산광역시': '부산',
+    '대구광역시': '대구',
+    '인천광역시': '인천',
+    '광주광역시': '광주',
+    '대전광역시': '대전',
+    '울산광역시': '울산',
+    '세종특별자치시': '세종',
+    '경기도': '경기',
+    '강원도': '강원',
+    '강원특별자치도': '강원',
+    '충청북도': '충북',
+    '충청남도': '충남',
+    '전라북도': '전북',
+    '전북특별자치도': '전북',
+    '전라남도': '전남',
+    '경상북도': '경북',
+    '경상남도': '경남',
+    '제주특별자치도': '제주',
+}
+
+# 시/도 경계 사각형 (min_lat, max_lat, min_lng, max_lng)
+PROVINCE_BOUNDS = {
+    '서울': (37.41, 37.72, 126.76, 127.19),
+    '부산': (34.87, 35.40, 128.76, 129.31),
+    '대구': (35.60, 36.35, 128.35, 128.85),
+    '인천': (37.00, 37.98, 124.60, 126.80),
+    '광주': (35.05, 35.26, 126.64, 127.02),
+    '대전': (36.18, 36.50, 127.24, 127.56),
+    '울산': (35.32, 35.72, 128.96, 129.47),
+    '세종': (36.42, 36.74, 127.15, 127.41),
+    '경기': (36.89, 38.30, 126.37, 127.86),
+    '강원': (37.02, 38.62, 127.09, 129.37),
+    '충북': (36.00, 37.27, 127.27, 128.66),
+    '충남': (35.97, 37.07, 125.50, 127.65),
+    '전북': (35.28, 36.16, 125.95, 127.92),
+    '전남': (33.80, 35.52, 125.00, 127.90),
+    '경북': (35.57, 37.56, 127.80, 131.90),
+    '경남': (34.45, 35.92, 127.55, 129.23),
+    '제주': (33.10, 34.00, 126.10, 127.00),
+}
+
+# 시/군/구 이름 끝 글자
+_DISTRICT_SUFFIXES = ('시', '군', '구')
+
+
+def parse_region(address):
+    """
+    주소에서 시/도, 시/군/구 추출
+
+    Args:
+        address: 주소 문자열 (예: "서울특별시 종로구 낙원동 252")
+
+    Returns:
+        tuple: (시/도, '시/도 시/군/구') - 없으면 빈 문자열
+    """
+    if address is None or (isinstance(address, float) and np.isnan(address)):
+        return '', ''
+    tokens = unicodedata.normalize('NFKC', str(address)).split()
+    if not tokens:
+        return '', ''
+
+    province = PROVINCE_ALIASES.get(tokens[0], tokens[0])
+    if province not in PROVINCE_BOUNDS:
+        return '', ''
+    if len(tokens) > 1 and tokens[1].endswith(_DISTRICT_SUFFIXES):
+        return province, f"{province} {tokens[1]}"
+    return province, ''
+
+
+class RegionIndex:
+    """지역 경계 사각형 인덱스"""
+
+    def __init__(self, district_bounds=None):
+        """
+        Args:
+            district_bounds: 시/군/구 → (min_lat, max_lat, min_lng, max_lng)
+        """
+        self.keys = list(PROVINCE_BOUNDS) + sorted(district_bounds or {})
+        bounds = [PROVINCE_BOUNDS[key] for key in PROVINCE_BOUNDS]
+        bounds += [district_bounds[key] for key in sorted(district_bounds or {})]
+
+        # 지역 번호 → 경계 (행 단위 배열, 벡터 검사용)
+        self.bounds = np.array(bounds, dtype=np.float64).reshape(-1, 4)
+        self.code = {key: i for i, key in enumerate(self.keys)}
+
+    @classmethod
+    def from_points(cls, addresses, lat, lng, min_points=5, quantile=0.01, padding=0.01):
+        """
+        Geocoding 결과 좌표 분포로 시/군/구 경계 생성
+
+        잘못 변환된 몇몇 좌표에 경계가 끌려가지 않도록 양 끝 분위수를 사용합니다.
+
+        Args:
+            addresses: 주소 목록
+            lat, lng: 위도/경도 목록
+            min_points: 경계를 만들 최소 좌표 수 (미만이면 시/도 경계 사용)
+            quantile: 양 끝에서 잘라낼 분위수
+            padding: 경계 여유 (도, 0.01 ≈ 1km)
+
+        Returns:
+            RegionIndex
+        """
+        df = pd.DataFrame({
+            'district': [parse_region(address)[1] for address in addresses],
+            'lat': pd.to_numeric(pd.Series(list(lat)), errors='coerce'),
+            'lng': pd.to_numeric(pd.Series(list(lng)), errors='coerce')
+        })
+        df = df[(df['district'] != '') & df['lat'].notna() & df['lng'].notna()]
+
+        groups = df.groupby('district')
+        counts = groups.size()
+        lower = groups[['lat', 'lng']].quantile(quantile)
+        upper = groups[['lat', 'lng']].quantile(1 - quantile)
+
+        district_bounds = {}
+        for district in counts[counts >= min_points].index:
+            district_bounds[district] = (
+                lower.at[district, 'lat'] - padding, upper.at[district, 'lat'] + padding,
+                lower.at[district, 'lng'] - padding, upper.at[district, 'lng'] + padding
+            )
+
+        logger.info(f"시/군/구 경계 생성: {len(district_bounds)}개")
+        return cls(district_bounds)
+
+    @classmethod
+    def load(cls, filepath='data/raw/region_bounds.json'):
+        """
+        저장된 시/군/구 경계 로드 (없으면 시/도 경계만 사용)
+
+        Args:
+            filepath: 파일 경로
+
+        Returns:
+            RegionIndex
+        """
+        district_bounds = {}
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    district_bounds = {key: tuple(value) for key, value in json.load(f).items()}
+                logger.info(f"시/군/구 경계 로드 완료: {len(district_bounds)}개")
+            except Exception as e:
+                logger.warning(f"시/군/구 경계 로드 실패: {e}")
+        return cls(district_bounds)
+
+    def save(self, filepath='data/raw/region_bounds.json'):
+        """
+        시/군/구 경계 저장
+
+        Args:
+            filepath: 파일 경로
+        """
+        district_bounds = {
+            key: [round(float(v), 5) for v in self.bounds[i]]
+            for i, key in enumerate(self.keys) if key not in PROVINCE_BOUNDS
+        }
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(district_bounds, f, ensure_ascii=False, indent=2, sort_keys=True)
+        logger.info(f"시/군/구 경계 저장: {filepath} ({len(district_bounds)}개)")
+
+    def region_codes(self, addresses):
+        """
+        주소별 지역 번호 (시/군/구 경계가 있으면 시/군/구, 없으면 시/도, 모르면 -1)
+
+        Args:
+            addresses: 주소 목록
+
+        Returns:
+            np.ndarray: 지역 번호
+        """
+        # 같은 주소 앞부분이 반복되므로 고유값만 파싱
+        values = pd.Series(list(addresses), dtype=object)
+        codes, uniques = pd.factorize(values)
+        lookup = np.full(len(uniques) + 1, -1, dtype=np.int64)
+        for i, address in enumerate(uniques):
+            province, district = parse_region(address)
+            lookup[i] = self.code.get(district, self.code.get(province, -1))
+        return lookup[codes]
+
+    def contains(self, lat, lng, addresses):
+        """
+        좌표가 주소의 지역 안에 있는지 일괄 검사
+
+        지역을 알 수 없거나 좌표가 없는 행은 True (검사 대상 아님)
+
+        Args:
+            lat, lng: 위도/경도 목록
+            addresses: 주소 목록 (소재지)
+
+        Returns:
+            np.ndarray: bool 배열
+        """
+        lat = pd.to_numeric(pd.Series(list(lat)), errors='coerce').to_numpy(dtype=np.float64)
+        lng = pd.to_numeric(pd.Series(list(lng)), errors='coerce').to_numpy(dtype=np.float64)
+        codes = self.region_codes(addresses)
+
+        known = (codes >= 0) & ~np.isnan(lat) & ~np.isnan(lng)
+        bounds = self.bounds[np.where(known, codes, 0)]
+        inside = ((lat >= bounds[:, 0]) & (lat <= bounds[:, 1]) &
+                  (lng >= bounds[:, 2]) & (lng <= bounds[:, 3]))
+        return inside | ~known
+
+    def rect(self, address):
+        """
+        주소 지역의 카카오 API rect 파라미터 ("min_x,min_y,max_x,max_y")
+
+        Args:
+            address: 주소 문자열
+
+        Returns:
+            str: rect 문자열 (지역을 모르면 None)
+        """
+        code = self.region_codes([address])[0]
+        if code < 0:
+            return None
+        min_lat, max_lat, min_lng, max_lng = self.bounds[code]
+        return f"{min_lng:.6f},{min_lat:.6f},{max_lng:.6f},{max_lat:.6f}"
@@ -10,7 +10,7 @@ echo ""
 
 # 1단계: 데이터 다운로드
 echo "[1/3] 데이터 다운로드 및 정제..."
-python scripts/fetch_data.py || {
+python scripts/onnuri.py fetch || {
     echo ""
     echo "⚠️  자동 다운로드 실패 또는 수동 다운로드 필요"
     echo "   data/raw/ 폴더에 Excel/CSV 파일이 있는지 확인하세요."
@@ -45,12 +45,12 @@ if [ -z "$KAKAO_REST_API_KEY" ]; then
     fi
 fi
 
-python scripts/geocode.py
+python scripts/onnuri.py geocode
 
 # 3단계: JSON 생성
 echo ""
 echo "[3/3] JSON 파일 생성..."
-python scripts/generate_json.py
+python scripts/onnuri.py generate
 
 # 완료
 echo ""
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원본 데이터 파일 목록 (fetch_data.py, onnuri.py에서 공유)
+
+data/raw에는 원본 Excel/CSV와 파이프라인이 만든 파일이 함께 있으므로
+파이프라인 출력은 제외하고 원본만 고릅니다.
+"""
+
+import os
+import glob
+
+# 파이프라인이 data/raw에 만드는 파일 (원본 데이터가 아님)
+RAW_OUTPUTS = {
+    'cleaned_stores.csv',
+    'geocoded_stores.csv',
+    'geocode_failed.csv',
+    'duplicates.csv',
+    'query_results.csv',
+    # 키워드 검색 샘플 테스트 (geocode_keyword.py)
+    'seoul_sample_100.csv',
+    'seoul_geocoded_100.csv',
+    'seoul_geocode_failed.csv',
+}
+
+
+def source_files(raw_dir='data/raw', pattern=None):
+    """
+    data/raw의 원본 데이터 파일 (Excel/CSV)
+
+    Args:
+        raw_dir: 원본 폴더
+        pattern: 파일 이름 패턴 (None이면 ONNURI_SOURCE_PATTERN 환경 변수, 없으면 전체)
+            예: "onnuri_stores_*.xlsx" (지역별로 나뉜 파일만)
+
+    Returns:
+        list: 파일 경로 (이름순)
+    """
+    pattern = pattern or os.getenv('ONNURI_SOURCE_PATTERN') or '*'
+    return sorted(
+        f for f in glob.glob(os.path.join(raw_dir, pattern))
+        if f.endswith(('.xlsx', '.xls', '.csv')) and os.path.basename(f) not in RAW_OUTPUTS
+    )
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파이프라인 단계 출력 캐시 (콘텐츠 주소 방식)
+
+단계 이름, 입력 파일 내용, 설정값을 해시한 키로 출력 파일을 보관합니다.
+같은 키가 이미 있으면 단계를 실행하지 않고 보관한 출력을 복원합니다.
+
+    data/cache/<단계>/<키>/manifest.json   # 출력 경로 → 보관 파일 이름
+    data/cache/<단계>/<키>/0, 1, ...       # 출력 파일 사본
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(filepath, chunk_size=1 << 20):
+    """
+    파일 내용 SHA-256
+
+    Args:
+        filepath: 파일 경로
+        chunk_size: 읽기 단위 (바이트)
+
+    Returns:
+        str: 16진수 해시
+    """
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StageCache:
+    """단계 출력 캐시"""
+
+    def __init__(self, cache_dir='data/cache', keep=3):
+        """
+        Args:
+            cache_dir: 캐시 폴더
+            keep: 단계별로 남길 최근 항목 수
+        """
+        self.cache_dir = cache_dir
+        self.keep = keep
+
+    def stage_key(self, name, inputs, config=None):
+        """
+        단계 입력의 콘텐츠 키 계산
+
+        입력 파일은 경로가 아니라 파일 이름과 내용으로 해시하므로
+        다른 폴더에서 실행하거나 mtime만 바뀌어도 키가 같습니다.
+
+        Args:
+            name: 단계 이름
+            inputs: 입력 파일 목록 (없는 파일은 '없음'으로 반영)
+            config: 출력에 영향을 주는 설정값 (JSON 직렬화 가능)
+
+        Returns:
+            str: 16진수 해시
+        """
+        digest = hashlib.sha256()
+        digest.update(name.encode('utf-8'))
+        for path in sorted(inputs):
+            content = file_digest(path) if os.path.exists(path) else 'missing'
+            digest.update(f"\n{os.path.basename(path)}:{content}".encode('utf-8'))
+        digest.update(json.dumps(config or {}, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_dir(self, name, key):
+        return os.path.join(self.cache_dir, name, key)
+
+    def restore(self, name, key, outputs):
+        """
+        보관한 출력 복원
+
+        Args:
+            name: 단계 이름
+            key: stage_key 결과
+            outputs: 출력 파일 목록
+
+        Returns:
+            bool: 복원 여부 (캐시가 없거나 출력 목록이 다르면 False)
+        """
+        entry_dir = self._entry_dir(name, key)
+        manifest_file = os.path.join(entry_dir, 'manifest.json')
+        if not os.path.exists(manifest_file):
+            return False
+
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except Exception as e:
+            logger.warning(f"[{name}] 캐시 목록 로드 실패: {e}")
+            return False
+
+        files = manifest.get('files', {})
+        if set(files) != set(outputs) or not all(
+                os.path.exists(os.path.join(entry_dir, stored)) for stored in files.values()):
+            return False
+
+        for output, stored in files.items():
+            if os.path.dirname(output):
+                os.makedirs(os.path.dirname(output), exist_ok=True)
+            shutil.copyfile(os.path.join(entry_dir, stored), output)
+
+        # 최근 사용 시각 갱신 (정리 순서)
+        os.utime(manifest_file)
+        return True
+
+    def store(self, name, key, outputs):
+        """
+        단계 출력 보관
+
+        Args:
+            name: 단계 이름
+            key: stage_key 결과
+            outputs: 출력 파일 목록 (하나라도 없으면 보관하지 않음)
+
+        Returns:
+            bool: 보관 여부
+        """
+        missing = [output for output in outputs if not os.path.exists(output)]
+        if missing:
+            logger.warning(f"[{name}] 출력 파일이 없어 캐시하지 않습니다: {', '.join(missing)}")
+            return False
+
+        entry_dir = self._entry_dir(name, key)
+        tmp_dir = f"{entry_dir}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        files = {}
+        for i, output in enumerate(outputs):
+            shutil.copyfile(output, os.path.join(tmp_dir, str(i)))
+            files[output] = str(i)
+
+        # manifest를 마지막에 써서 중간에 중단돼도 반쯤 쓴 항목을 쓰지 않게 함
+        with open(os.path.join(tmp_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump({'stage': name, 'created': datetime.now().isoformat(), 'files': files},
+                      f, ensure_ascii=False, indent=2)
+
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)
+        self.prune(name)
+        return True
+
+    def prune(self, name):
+        """단계별로 최근 사용한 keep개만 남기고 삭제"""
+        stage_dir = os.path.join(self.cache_dir, name)
+        entries = []
+        for key in os.listdir(stage_dir):
+            manifest_file = os.path.join(stage_dir, key, 'manifest.json')
+            if os.path.exists(manifest_file):
+                entries.append((os.path.getmtime(manifest_file), key))
+
+        for _, key in sorted(entries, reverse=True)[self.keep:]:
+            shutil.rmtree(os.path.join(stage_dir, key), ignore_errors=True)
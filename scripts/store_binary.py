@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가맹점 바이너리 포맷 (stores.bin)
+
+브라우저가 JSON 파싱 없이 ArrayBuffer 위의 TypedArray로 바로 읽을 수 있도록
+가맹점 데이터를 고정 폭 컬럼 + 공유 문자열 테이블로 저장합니다.
+Python에서는 StoreDataset으로 파일을 메모리 매핑해 같은 방식으로 읽습니다.
+
+레이아웃 (리틀 엔디언, 각 섹션은 8바이트 정렬):
+
+    헤더 (32 bytes)
+        0   char[4]   매직 'ONNB'
+        4   uint16    포맷 버전
+        6   uint16    문자열 필드 수 (F)
+        8   uint32    가맹점 수 (N)
+        12  uint32    카테고리 수 (C)
+        16  uint32    문자열 수 (S)
+        20  uint32    문자열 힙 크기 (bytes)
+        24  uint32    lastUpdated 문자열 인덱스
+        28  uint32    예약
+    int32[N]      id
+    int32[N]      위도 × 1e7
+    int32[N]      경도 × 1e7
+    uint16[N]     카테고리 코드 (0xFFFF = 없음)
+    uint8[N]      상품권 유형 비트마스크 (card=1, paper=2, mobile=4)
+    uint32[F×N]   문자열 필드 인덱스 (필드 순서대로, 0xFFFFFFFF = 없음)
+    uint32[S+1]   문자열 오프셋
+    uint8[...]    UTF-8 문자열 힙
+
+문자열 테이블의 앞쪽 C개는 카테고리 이름, 다음 F개는 필드 이름입니다.
+naverUrl은 이름 + 주소로 클라이언트에서 생성하므로 저장하지 않습니다.
+"""
+
+import struct
+
+import numpy as np
+
+MAGIC = b'ONNB'
+FORMAT_VERSION = 1
+HEADER_SIZE = 32
+ALIGNMENT = 8
+
+COORD_SCALE = 1e7
+NO_CATEGORY = 0xFFFF
+NO_STRING = 0xFFFFFFFF
+
+TYPE_BITS = {'card': 1, 'paper': 2, 'mobile': 4}
+
+# 컬럼으로 따로 저장하거나 저장하지 않는 필드
+_COLUMN_FIELDS = {'id', 'lat', 'lng', 'category', 'types', 'naverUrl', 'distance'}
+
+
+def types_to_mask(types):
+    """
+    상품권 유형 리스트를 비트마스크로 변환
+
+    Args:
+        types: 유형 리스트 (예: ['card', 'paper'])
+
+    Returns:
+        int: 비트마스크
+    """
+    mask = 0
+    for t in types or []:
+        mask |= TYPE_BITS.get(t, 0)
+    return mask
+
+
+def mask_to_types(mask):
+    """
+    비트마스크를 상품권 유형 리스트로 변환
+
+    Args:
+        mask: 비트마스크
+
+    Returns:
+        list: 유형 리스트
+    """
+    return [t for t, bit in TYPE_BITS.items() if mask & bit]
+
+
+class _StringTable:
+    """중복 제거된 문자열 테이블"""
+
+    def __init__(self):
+        self.index = {}
+        self.strings = []
+
+    def add(self, value):
+        if value not in self.index:
+            self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return self.index[value]
+
+
+def _pad(buf):
+    """섹션 정렬용 패딩 추가"""
+    remainder = len(buf) % ALIGNMENT
+    if remainder:
+        buf.extend(b'\x00' * (ALIGNMENT - remainder))
+
+
+def encode_stores(stores, last_updated=''):
+    """
+    가맹점 배열을 바이너리 포맷으로 인코딩
+
+    Args:
+        stores: 가맹점 배열 (stores.json의 stores)
+        last_updated: 데이터 업데이트 시각 (ISO 8601)
+
+    Returns:
+        bytes: stores.bin 내용
+    """
+    count = len(stores)
+
+    # 카테고리 → 필드 이름 순서로 문자열 테이블 앞부분 고정
+    categories = sorted({s['category'] for s in stores if s.get('category')})
+    fields = []
+    for store in stores:
+        for key in store:
+            if key not in _COLUMN_FIELDS and key not in fields:
+                fields.append(key)
+
+    table = _StringTable()
+    for name in categories:
+        table.add(name)
+    table.strings.extend(fields)
+    last_updated_ref = table.add(last_updated)
+
+    category_codes = {name: i for i, name in enumerate(categories)}
+
+    ids = np.empty(count, dtype='<i4')
+    lat = np.empty(count, dtype='<i4')
+    lng = np.empty(count, dtype='<i4')
+    category = np.full(count, NO_CATEGORY, dtype='<u2')
+    types = np.empty(count, dtype='u1')
+    refs = np.full((len(fields), count), NO_STRING, dtype='<u4')
+
+    for i, store in enumerate(stores):
+        ids[i] = store['id']
+        lat[i] = round(store['lat'] * COORD_SCALE)
+        lng[i] = round(store['lng'] * COORD_SCALE)
+        if store.get('category'):
+            category[i] = category_codes[store['category']]
+        types[i] = types_to_mask(store.get('types'))
+        for f, key in enumerate(fields):
+            value = store.get(key)
+            if value is not None and value != '':
+                refs[f, i] = table.add(str(value))
+
+    encoded = [s.encode('utf-8') for s in table.strings]
+    offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+    offsets[1:] = np.cumsum([len(b) for b in encoded], dtype=np.uint64)
+    heap = b''.join(encoded)
+
+    buf = bytearray(struct.pack(
+        '<4sHHIIIIII',
+        MAGIC, FORMAT_VERSION, len(fields), count,
+        len(categories), len(encoded), len(heap), last_updated_ref, 0
+    ))
+
+    for column in (ids, lat, lng, category, types, refs, offsets):
+        buf.extend(column.tobytes())
+        _pad(buf)
+    buf.extend(heap)
+
+    return bytes(buf)
+
+
+class StoreDataset:
+    """stores.bin 메모리 매핑 리더 (복사 없이 컬럼 접근)"""
+
+    def __init__(self, filepath='data/stores.bin'):
+        """
+        Args:
+            filepath: stores.bin 경로
+        """
+        self.filepath = filepath
+        self.buffer = np.memmap(filepath, dtype='u1', mode='r')
+
+        magic, version, field_count, count, category_count, string_count, heap_size, \
+            last_updated_ref, _ = struct.unpack_from('<4sHHIIIIII', self.buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"stores.bin 형식이 아닙니다: {filepath}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 stores.bin 버전입니다: {version}")
+
+        self.count = count
+        offset = HEADER_SIZE
+
+        def take(dtype, length):
+            nonlocal offset
+            dtype = np.dtype(dtype)
+            view = self.buffer[offset:offset + length * dtype.itemsize].view(dtype)
+            offset += length * dtype.itemsize
+            offset += -offset % ALIGNMENT
+            return view
+
+        # 고정 폭 컬럼 (파일 위의 뷰)
+        self.ids = take('<i4', count)
+        self.lat_e7 = take('<i4', count)
+        self.lng_e7 = take('<i4', count)
+        self.category_codes = take('<u2', count)
+        self.types = take('u1', count)
+        self.refs = take('<u4', field_count * count).reshape(field_count, count)
+        self.string_offsets = take('<u4', string_count + 1)
+        self.heap = self.buffer[offset:offset + heap_size]
+
+        self.categories = [self.get_string(i) for i in range(category_count)]
+        self.fields = [self.get_string(category_count + i) for i in range(field_count)]
+        self.last_updated = self.get_string(last_updated_ref)
+
+        # id 정렬 순서 (처음 조회할 때 생성)
+        self._id_order = None
+        self._sorted_ids = None
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, key):
+        """
+        행 번호 또는 슬라이스로 가맹점 객체 가져오기
+
+        Args:
+            key: 행 번호 또는 slice
+
+        Returns:
+            dict 또는 list
+        """
+        if isinstance(key, slice):
+            return [self.get_store(i) for i in range(*key.indices(self.count))]
+        if key < 0:
+            key += self.count
+        if not 0 <= key < self.count:
+            raise IndexError(key)
+        return self.get_store(key)
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.get_store(i)
+
+    def get_string(self, index):
+        """
+        문자열 테이블에서 문자열 읽기
+
+        Args:
+            index: 문자열 인덱스
+
+        Returns:
+            str
+        """
+        start, end = self.string_offsets[index], self.string_offsets[index + 1]
+        return self.heap[start:end].tobytes().decode('utf-8')
+
+    def lat(self, rows=slice(None)):
+        """
+        위도 (도)
+
+        Args:
+            rows: 행 번호, 배열 또는 slice
+
+        Returns:
+            np.ndarray 또는 float
+        """
+        return self.lat_e7[rows] / COORD_SCALE
+
+    def lng(self, rows=slice(None)):
+        """
+        경도 (도)
+
+        Args:
+            rows: 행 번호, 배열 또는 slice
+
+        Returns:
+            np.ndarray 또는 float
+        """
+        return self.lng_e7[rows] / COORD_SCALE
+
+    def category(self, row):
+        """
+        카테고리 이름
+
+        Args:
+            row: 행 번호
+
+        Returns:
+            str 또는 None
+        """
+        code = self.category_codes[row]
+        return None if code == NO_CATEGORY else self.categories[code]
+
+    def get_store(self, row):
+        """
+        행 번호로 가맹점 객체 생성 (stores.json 형식, naverUrl 제외)
+
+        Args:
+            row: 행 번호
+
+        Returns:
+            dict
+        """
+        store = {
+            'id': int(self.ids[row]),
+            'lat': float(self.lat_e7[row] / COORD_SCALE),
+            'lng': float(self.lng_e7[row] / COORD_SCALE),
+            'types': mask_to_types(int(self.types[row]))
+        }
+        category = self.category(row)
+        if category is not None:
+            store['category'] = category
+        for f, field in enumerate(self.fields):
+            ref = self.refs[f, row]
+            if ref != NO_STRING:
+                store[field] = self.get_string(ref)
+        return store
+
+    def row_of(self, store_id):
+        """
+        id로 행 번호 찾기
+
+        Args:
+            store_id: 가맹점 ID
+
+        Returns:
+            int: 행 번호 (없으면 -1)
+        """
+        if self._id_order is None:
+            self._id_order = np.argsort(self.ids, kind='stable')
+            self._sorted_ids = self.ids[self._id_order]
+        pos = int(np.searchsorted(self._sorted_ids, store_id))
+        if pos < self.count and self._sorted_ids[pos] == store_id:
+            return int(self._id_order[pos])
+        return -1
+
+    def get_by_id(self, store_id):
+        """
+        id로 가맹점 객체 가져오기
+
+        Args:
+            store_id: 가맹점 ID
+
+        Returns:
+            dict 또는 None
+        """
+        row = self.row_of(store_id)
+        return self.get_store(row) if row >= 0 else None
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가맹점 고정 ID 관리
+
+가맹점명 + 주소를 정규화한 지문(fingerprint)의 해시로 ID를 만들고,
+한 번 부여한 ID는 레지스트리 파일에 저장해 다음 실행에도 그대로 씁니다.
+행 순서가 바뀌거나 일부 행이 추가/삭제되어도 나머지 가맹점의 ID는 유지됩니다.
+"""
+
+import os
+import re
+import json
+import hashlib
+import unicodedata
+import logging
+
+logger = logging.getLogger(__name__)
+
+# stores.bin의 int32 컬럼에 들어가도록 31비트 양수 사용
+MAX_ID = 0x7FFFFFFF
+
+
+def normalize_text(value):
+    """
+    지문 비교용 문자열 정규화 (NFKC, 소문자, 공백 제거)
+
+    Args:
+        value: 문자열
+
+    Returns:
+        str: 정규화된 문자열
+    """
+    if value is None:
+        return ''
+    text = unicodedata.normalize('NFKC', str(value)).lower()
+    if text == 'nan':
+        return ''
+    return re.sub(r'\s+', '', text)
+
+
+def store_fingerprint(name, address):
+    """
+    가맹점 지문 생성
+
+    Args:
+        name: 가맹점명
+        address: 주소
+
+    Returns:
+        str: 정규화된 '가맹점명|주소'
+    """
+    return f"{normalize_text(name)}|{normalize_text(address)}"
+
+
+class StoreIdRegistry:
+    """가맹점 지문 → 고정 ID 레지스트리"""
+
+    def __init__(self, registry_file='data/store_ids.json'):
+        """
+        Args:
+            registry_file: 레지스트리 파일 경로
+        """
+        self.registry_file = registry_file
+
+        # 지문 → ID
+        self.ids = {}
+        self.load_registry()
+
+        # 사용 중인 ID (충돌 검사용)
+        self.used_ids = set(self.ids.values())
+
+        self.stats = {
+            'existing': 0,
+            'new': 0,
+            'collisions': 0
+        }
+
+    def load_registry(self):
+        """레지스트리 파일 로드"""
+        if os.path.exists(self.registry_file):
+            try:
+                with open(self.registry_file, 'r', encoding='utf-8') as f:
+                    self.ids = json.load(f)
+                logger.info(f"ID 레지스트리 로드 완료: {len(self.ids)}개")
+            except Exception as e:
+                logger.warning(f"ID 레지스트리 로드 실패: {e}")
+                self.ids = {}
+
+    def save_registry(self):
+        """레지스트리 파일 저장"""
+        os.makedirs(os.path.dirname(self.registry_file), exist_ok=True)
+        with open(self.registry_file, 'w', encoding='utf-8') as f:
+            json.dump(self.ids, f, ensure_ascii=False, indent=0, sort_keys=True)
+        logger.info(
+            f"ID 레지스트리 저장 완료: {len(self.ids)}개 "
+            f"(기존 {self.stats['existing']}, 신규 {self.stats['new']}, "
+            f"해시 충돌 {self.stats['collisions']})"
+        )
+
+    def _hash_id(self, fingerprint):
+        """지문 해시 → 후보 ID (1 ~ MAX_ID)"""
+        digest = hashlib.sha256(fingerprint.encode('utf-8')).digest()
+        return int.from_bytes(digest[:4], 'big') % MAX_ID + 1
+
+    def get_id(self, fingerprint):
+        """
+        지문에 해당하는 ID 반환 (없으면 새로 부여)
+
+        해시 ID가 다른 지문에 이미 쓰였으면 다음 번호를 차례로 시도합니다.
+
+        Args:
+            fingerprint: store_fingerprint 결과
+
+        Returns:
+            int: 가맹점 ID
+        """
+        if fingerprint in self.ids:
+            self.stats['existing'] += 1
+            return self.ids[fingerprint]
+
+        store_id = self._hash_id(fingerprint)
+        while store_id in self.used_ids:
+            self.stats['collisions'] += 1
+            store_id = store_id % MAX_ID + 1
+
+        self.ids[fingerprint] = store_id
+        self.used_ids.add(store_id)
+        self.stats['new'] += 1
+        return store_id
+
+    def assign(self, names, addresses):
+        """
+        가맹점 목록에 ID 부여
+
+        같은 지문이 한 번에 여러 번 나오면 순서대로 '#2', '#3'을 붙여 구분합니다.
+
+        Args:
+            names: 가맹점명 목록
+            addresses: 주소 목록
+
+        Returns:
+            list: ID 목록
+        """
+        seen = {}
+        ids = []
+        for name, address in zip(names, addresses):
+            fingerprint = store_fingerprint(name, address)
+            seen[fingerprint] = seen.get(fingerprint, 0) + 1
+            if seen[fingerprint] > 1:
+                fingerprint = f"{fingerprint}#{seen[fingerprint]}"
+            ids.append(self.get_id(fingerprint))
+        return ids
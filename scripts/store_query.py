@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가맹점 반경/최근접 검색 모듈
+
+생성된 가맹점 데이터를 NumPy 배열(라디안)로 올리고 균등 격자 인덱스로
+후보를 좁힌 뒤, 벡터화된 Haversine으로 반경 검색과 k-최근접 검색을 합니다.
+거리 공식은 프론트엔드 calculateDistance (docs/js/utils.js)와 같습니다.
+
+사용 예:
+    python scripts/store_query.py --points points.csv --radius 1000
+    python scripts/store_query.py --points points.csv --k 5
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+
+import numpy as np
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 지구 반지름 (미터, calculateDistance와 동일)
+EARTH_RADIUS = 6371e3
+
+
+def haversine(lat1, lng1, lat2, lng2):
+    """
+    Haversine 거리 (미터, 라디안 입력, 브로드캐스팅 지원)
+
+    Args:
+        lat1, lng1: 기준점 위도/경도 (라디안)
+        lat2, lng2: 대상 위도/경도 (라디안)
+
+    Returns:
+        np.ndarray: 거리 (미터)
+    """
+    dlat = lat2 - lat1
+    dlng = lng2 - lng1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2) ** 2
+    return EARTH_RADIUS * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+class StoreIndex:
+    """가맹점 격자 인덱스 (반경 / k-최근접 검색)"""
+
+    def __init__(self, lat, lng, ids=None, cell_size=0.01):
+        """
+        Args:
+            lat: 위도 배열 (도)
+            lng: 경도 배열 (도)
+            ids: 가맹점 ID 배열 (None이면 행 번호)
+            cell_size: 격자 셀 크기 (도, 0.01 ≈ 1.1km)
+        """
+        self.lat_deg = np.asarray(lat, dtype=np.float64)
+        self.lng_deg = np.asarray(lng, dtype=np.float64)
+        self.lat = np.radians(self.lat_deg)
+        self.lng = np.radians(self.lng_deg)
+        self.ids = np.asarray(ids) if ids is not None else np.arange(len(self.lat))
+        self.cell_size = cell_size
+
+        self._build_grid()
+
+    @classmethod
+    def from_stores(cls, stores, **kwargs):
+        """
+        가맹점 배열로 인덱스 생성
+
+        Args:
+            stores: 가맹점 배열 (stores.json의 stores)
+
+        Returns:
+            StoreIndex
+        """
+        return cls(
+            [store['lat'] for store in stores],
+            [store['lng'] for store in stores],
+            ids=[store['id'] for store in stores],
+            **kwargs
+        )
+
+    @classmethod
+    def from_json(cls, filepath='data/stores.json', **kwargs):
+        """
+        stores.json으로 인덱스 생성
+
+        Args:
+            filepath: 파일 경로
+
+        Returns:
+            StoreIndex
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            stores = json.load(f)['stores']
+        logger.info(f"가맹점 {len(stores)}개 로드: {filepath}")
+        return cls.from_stores(stores, **kwargs)
+
+    @classmethod
+    def from_dataset(cls, dataset, **kwargs):
+        """
+        StoreDataset (메모리 매핑된 stores.bin)으로 인덱스 생성
+
+        Args:
+            dataset: store_binary.StoreDataset
+
+        Returns:
+            StoreIndex
+        """
+        return cls(dataset.lat(), dataset.lng(), ids=dataset.ids, **kwargs)
+
+    def __len__(self):
+        return len(self.lat)
+
+    def _build_grid(self):
+        """셀 번호순으로 정렬한 CSR 형식 격자 생성"""
+        if len(self.lat) == 0:
+            self.row_min = self.col_min = 0
+            self.n_rows = self.n_cols = 1
+            self.order = np.zeros(0, dtype=np.int64)
+            self.cell_start = np.zeros(2, dtype=np.int64)
+            return
+
+        rows = np.floor(self.lat_deg / self.cell_size).astype(np.int64)
+        cols = np.floor(self.lng_deg / self.cell_size).astype(np.int64)
+        self.row_min, self.col_min = rows.min(), cols.min()
+        self.n_rows = int(rows.max() - self.row_min + 1)
+        self.n_cols = int(cols.max() - self.col_min + 1)
+
+        cell = (rows - self.row_min) * self.n_cols + (cols - self.col_min)
+        self.order = np.argsort(cell, kind='stable')
+        counts = np.bincount(cell, minlength=self.n_rows * self.n_cols)
+        self.cell_start = np.concatenate([[0], np.cumsum(counts)])
+
+    def _candidates(self, lat_deg, lng_deg, radius):
+        """
+        반경을 덮는 격자 셀의 가맹점 행 번호
+
+        Args:
+            lat_deg, lng_deg: 기준점 (도)
+            radius: 반경 (미터)
+
+        Returns:
+            np.ndarray: 후보 행 번호
+        """
+        dlat = np.degrees(radius / EARTH_RADIUS)
+        max_lat = min(abs(lat_deg) + dlat, 89.0)
+        dlng = np.degrees(radius / (EARTH_RADIUS * np.cos(np.radians(max_lat))))
+
+        r0 = max(int(np.floor((lat_deg - dlat) / self.cell_size)) - self.row_min, 0)
+        r1 = min(int(np.floor((lat_deg + dlat) / self.cell_size)) - self.row_min, self.n_rows - 1)
+        c0 = max(int(np.floor((lng_deg - dlng) / self.cell_size)) - self.col_min, 0)
+        c1 = min(int(np.floor((lng_deg + dlng) / self.cell_size)) - self.col_min, self.n_cols - 1)
+        if r0 > r1 or c0 > c1:
+            return np.zeros(0, dtype=np.int64)
+
+        # 한 행(row)의 셀들은 CSR에서 연속 구간
+        slices = []
+        for r in range(r0, r1 + 1):
+            start = self.cell_start[r * self.n_cols + c0]
+            end = self.cell_start[r * self.n_cols + c1 + 1]
+            if end > start:
+                slices.append(self.order[start:end])
+
+        if not slices:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(slices) if len(slices) > 1 else slices[0]
+
+    def query_radius(self, lat, lng, radius, sort=True):
+        """
+        반경 내 가맹점 검색 (여러 기준점 일괄 처리)
+
+        Args:
+            lat, lng: 기준점 위도/경도 (도, 스칼라 또는 배열)
+            radius: 반경 (미터)
+            sort: 거리순 정렬 여부
+
+        Returns:
+            list: 기준점별 (행 번호 배열, 거리 배열)
+        """
+        lats = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+        lngs = np.atleast_1d(np.asarray(lng, dtype=np.float64))
+
+        results = []
+        for q_lat, q_lng in zip(lats, lngs):
+            candidates = self._candidates(q_lat, q_lng, radius)
+            distances = haversine(
+                np.radians(q_lat), np.radians(q_lng),
+                self.lat[candidates], self.lng[candidates]
+            )
+            mask = distances <= radius
+            rows, distances = candidates[mask], distances[mask]
+            if sort:
+                order = np.argsort(distances, kind='stable')
+                rows, distances = rows[order], distances[order]
+            results.append((rows, distances))
+
+        return results
+
+    def query_knn(self, lat, lng, k, max_radius=None):
+        """
+        k-최근접 가맹점 검색 (여러 기준점 일괄 처리)
+
+        셀 크기 반경부터 시작해 후보가 k개 이상 될 때까지 반경을 두 배씩 넓힙니다.
+
+        Args:
+            lat, lng: 기준점 위도/경도 (도, 스칼라 또는 배열)
+            k: 찾을 개수
+            max_radius: 최대 반경 (미터, None이면 제한 없음)
+
+        Returns:
+            list: 기준점별 (행 번호 배열, 거리 배열), 거리순
+        """
+        lats = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+        lngs = np.atleast_1d(np.asarray(lng, dtype=np.float64))
+        start_radius = self.cell_size * np.pi / 180 * EARTH_RADIUS
+        limit = max_radius if max_radius is not None else np.pi * EARTH_RADIUS
+
+        results = []
+        for q_lat, q_lng in zip(lats, lngs):
+            radius = min(start_radius, limit)
+            while True:
+                rows, distances = self.query_radius(q_lat, q_lng, radius, sort=False)[0]
+                if len(rows) >= k or radius >= limit:
+                    break
+                radius = min(radius * 2, limit)
+
+            if len(rows) > k:
+                top = np.argpartition(distances, k - 1)[:k]
+                rows, distances = rows[top], distances[top]
+            order = np.argsort(distances, kind='stable')
+            results.append((rows[order], distances[order]))
+
+        return results
+
+    def knn_self(self, k, radius, block_size=128, max_strip=32):
+        """
+        색인의 모든 가맹점에 대해 반경 안 k-최근접 가맹점 (자기 자신 제외)
+
+        격자의 한 행에서 가맹점이 있는 셀을 이어 붙여 띠(strip)로 묶고,
+        띠 안 가맹점과 반경을 덮는 주변 셀 가맹점의 거리 행렬을 한 번에 계산합니다.
+        가맹점이 드문 지역도 셀마다 반복하지 않으므로 전국 데이터를 몇 초 안에 처리합니다.
+
+        Args:
+            k: 찾을 개수
+            radius: 반경 (미터, 셀 크기와 비슷하게 잡으면 가장 빠름)
+            block_size: 띠 하나에 넣을 최대 가맹점 수 (거리 행렬 메모리 조절)
+            max_strip: 띠 하나의 최대 셀 수
+
+        Returns:
+            tuple: (행 번호 배열 (n, k), 거리 배열 (n, k)), 거리순, 모자라면 -1 / inf
+        """
+        n = len(self.lat)
+        neighbors = np.full((n, k), -1, dtype=np.int64)
+        distances = np.full((n, k), np.inf)
+        if n == 0 or k <= 0:
+            return neighbors, distances
+
+        # 반경을 덮는 주변 셀 범위 (경도 방향은 가장 높은 위도 기준)
+        max_lat = min(float(np.abs(self.lat_deg).max()) + np.degrees(radius / EARTH_RADIUS), 89.0)
+        row_span = int(np.ceil(np.degrees(radius / EARTH_RADIUS) / self.cell_size))
+        col_span = int(np.ceil(
+            np.degrees(radius / (EARTH_RADIUS * np.cos(np.radians(max_lat)))) / self.cell_size
+        ))
+
+        # 거리 대신 Haversine의 a 값으로 비교 (거리와 순서가 같고 삼각함수가 적음)
+        cos_lat = np.cos(self.lat)
+        limit = np.sin(radius / EARTH_RADIUS / 2) ** 2
+
+        def search(c0, c1, r):
+            """행 r의 셀 [c0, c1] 가맹점들의 이웃 찾기"""
+            row_offset = r * self.n_cols
+            members = self.order[self.cell_start[row_offset + c0]:self.cell_start[row_offset + c1 + 1]]
+
+            # 주변 셀 후보 (한 행의 셀들은 CSR에서 연속 구간)
+            lo = max(c0 - col_span, 0)
+            hi = min(c1 + col_span, self.n_cols - 1)
+            slices = []
+            for rr in range(max(r - row_span, 0), min(r + row_span, self.n_rows - 1) + 1):
+                start = self.cell_start[rr * self.n_cols + lo]
+                end = self.cell_start[rr * self.n_cols + hi + 1]
+                if end > start:
+                    slices.append(self.order[start:end])
+            candidates = np.concatenate(slices)
+
+            for b in range(0, len(members), block_size):
+                block = members[b:b + block_size]
+                a = (np.sin((self.lat[candidates] - self.lat[block, None]) / 2) ** 2 +
+                     cos_lat[block, None] * cos_lat[candidates] *
+                     np.sin((self.lng[candidates] - self.lng[block, None]) / 2) ** 2)
+                a[(a > limit) | (block[:, None] == candidates)] = np.inf
+
+                # 가까운 k개만 골라 정렬
+                if a.shape[1] > k:
+                    top = np.argpartition(a, k - 1, axis=1)[:, :k]
+                    a = np.take_along_axis(a, top, axis=1)
+                else:
+                    top = np.broadcast_to(np.arange(a.shape[1]), a.shape)
+                order = np.argsort(a, axis=1, kind='stable')
+                top = np.take_along_axis(top, order, axis=1)
+                a = np.take_along_axis(a, order, axis=1)
+
+                neighbors[block, :a.shape[1]] = np.where(np.isfinite(a), candidates[top], -1)
+
+        counts = np.diff(self.cell_start)
+        for r in range(self.n_rows):
+            row_counts = counts[r * self.n_cols:(r + 1) * self.n_cols]
+            cols = np.flatnonzero(row_counts)
+            if len(cols) == 0:
+                continue
+
+            # 가맹점이 block_size를 넘거나 셀이 max_strip개가 되면 띠를 끊음
+            strip_start = cols[0]
+            strip_count = 0
+            for c, count in zip(cols.tolist(), row_counts[cols].tolist()):
+                if strip_count and (strip_count + count > block_size or c - strip_start >= max_strip):
+                    search(strip_start, prev, r)
+                    strip_start, strip_count = c, 0
+                strip_count += count
+                prev = c
+            search(strip_start, prev, r)
+
+        # 찾은 이웃만 실제 거리 계산 (calculateDistance와 같은 식)
+        rows, ranks = np.nonzero(neighbors >= 0)
+        cols = neighbors[rows, ranks]
+        distances[rows, ranks] = haversine(self.lat[rows], self.lng[rows], self.lat[cols], self.lng[cols])
+
+        return neighbors, distances
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='가맹점 반경/최근접 일괄 검색')
+    parser.add_argument('--stores', default='data/stores.json', help='가맹점 데이터 (stores.json)')
+    parser.add_argument('--points', required=True, help='기준점 CSV (lat, lng 컬럼)')
+    parser.add_argument('--radius', type=float, help='반경 (미터)')
+    parser.add_argument('--k', type=int, help='최근접 개수')
+    parser.add_argument('--output', default='data/raw/query_results.csv', help='결과 CSV')
+    args = parser.parse_args()
+
+    if args.radius is None and args.k is None:
+        parser.error('--radius 또는 --k를 지정해주세요.')
+
+    if not os.path.exists(args.stores):
+        logger.error(f"{args.stores}이 없습니다.")
+        logger.info("먼저 python scripts/generate_json.py를 실행해주세요.")
+        sys.exit(1)
+
+    import pandas as pd
+
+    index = StoreIndex.from_json(args.stores)
+    points = pd.read_csv(args.points, encoding='utf-8-sig')
+
+    if args.k is not None:
+        results = index.query_knn(points['lat'], points['lng'], args.k, max_radius=args.radius)
+    else:
+        results = index.query_radius(points['lat'], points['lng'], args.radius)
+
+    rows = []
+    for point_idx, (store_rows, distances) in enumerate(results):
+        for rank, (row, distance) in enumerate(zip(store_rows, distances), start=1):
+            rows.append({
+                'point': point_idx,
+                'rank': rank,
+                'storeId': index.ids[row],
+                'distance': round(float(distance), 1)
+            })
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    pd.DataFrame(rows, columns=['point', 'rank', 'storeId', 'distance']).to_csv(
+        args.output, index=False, encoding='utf-8-sig'
+    )
+
+    counts = [len(store_rows) for store_rows, _ in results]
+    logger.info(f"기준점 {len(results)}개, 평균 {np.mean(counts) if counts else 0:.1f}개 검색")
+    logger.info(f"결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가맹점 검색 API 서버
+
+stores.bin을 한 번 메모리 매핑해 격자 인덱스(StoreIndex)와 검색용 문자열을 만들어 두고
+반경/카테고리/상품권 유형/텍스트 검색을 페이지 단위로 응답합니다.
+필터 규칙은 프론트엔드 FilterManager.applyFilters / searchStores (docs/js/filter.js)와 같습니다.
+
+    GET /stores?lat=37.57&lng=126.98&radius=1000&category=음식점&types=card,paper&q=시장&page=1&size=50
+    GET /stores/<id>
+    GET /health
+
+사용 예:
+    python scripts/store_server.py --port 8000
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import threading
+import logging
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+
+from store_binary import StoreDataset, TYPE_BITS, NO_STRING, types_to_mask
+from store_query import StoreIndex
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 텍스트 검색 대상 필드 (searchStores와 동일)
+SEARCH_FIELDS = ('name', 'address', 'market')
+
+
+class StoreSearch:
+    """가맹점 검색 (공간 인덱스 + 텍스트 인덱스)"""
+
+    DEFAULT_RADIUS = 1000
+    MAX_RADIUS = 20000
+    MAX_PAGE_SIZE = 200
+
+    def __init__(self, dataset, cell_size=0.01):
+        """
+        Args:
+            dataset: store_binary.StoreDataset
+            cell_size: 격자 셀 크기 (도)
+        """
+        self.dataset = dataset
+        self.index = StoreIndex.from_dataset(dataset, cell_size=cell_size)
+        self.category_code = {name: i for i, name in enumerate(dataset.categories)}
+
+        # 검색용 소문자 문자열 (필드 사이는 줄바꿈으로 구분해 필드를 넘는 일치 방지)
+        heap = dataset.heap.tobytes()
+        offsets = dataset.string_offsets.tolist()
+        strings = [heap[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+        strings.append('')
+
+        # NO_STRING(0xFFFFFFFF) → 마지막 빈 문자열
+        refs = [np.where(dataset.refs[dataset.fields.index(field)] == NO_STRING, len(strings) - 1,
+                         dataset.refs[dataset.fields.index(field)]).tolist()
+                for field in SEARCH_FIELDS if field in dataset.fields]
+        self.texts = np.array(
+            ['\n'.join(strings[ref[row]] for ref in refs).lower() for row in range(len(dataset))],
+            dtype=object
+        )
+
+    @classmethod
+    def load(cls, filepath='data/stores.bin', **kwargs):
+        """
+        stores.bin으로 검색 인덱스 생성
+
+        Args:
+            filepath: stores.bin 경로
+
+        Returns:
+            StoreSearch
+        """
+        start = time.perf_counter()
+        search = cls(StoreDataset(filepath), **kwargs)
+        logger.info(
+            f"가맹점 {len(search.dataset)}개 인덱스 생성 완료 "
+            f"({(time.perf_counter() - start) * 1000:.0f}ms)"
+        )
+        return search
+
+    def _filter_rows(self, rows, category=None, types=None, query=None):
+        """
+        행 번호 배열에 카테고리/유형/텍스트 필터 적용
+
+        Args:
+            rows: 행 번호 배열
+            category: 카테고리 이름 (None 또는 'all'이면 전체)
+            types: 상품권 유형 목록 (비어 있으면 전체)
+            query: 검색어
+
+        Returns:
+            np.ndarray: bool 마스크
+        """
+        mask = np.ones(len(rows), dtype=bool)
+
+        # 1. 카테고리 필터 (없는 카테고리는 결과 없음)
+        if category and category != 'all':
+            code = self.category_code.get(category, -1)
+            mask &= self.dataset.category_codes[rows] == code
+
+        # 2. 상품권 유형 필터 (하나라도 겹치면 통과)
+        type_mask = types_to_mask(types)
+        if type_mask:
+            mask &= (self.dataset.types[rows] & type_mask) != 0
+
+        # 3. 텍스트 검색 (대소문자 무시 부분 일치)
+        if query and query.strip():
+            term = query.lower()
+            candidates = np.flatnonzero(mask)
+            texts = self.texts[rows[candidates]]
+            matched = np.fromiter((term in text for text in texts), dtype=bool, count=len(texts))
+            mask[candidates[~matched]] = False
+
+        return mask
+
+    def search(self, lat=None, lng=None, radius=DEFAULT_RADIUS, category=None, types=None,
+               query=None, page=1, size=50):
+        """
+        가맹점 검색
+
+        위치가 있으면 반경 내 가맹점을 거리순으로, 없으면 텍스트 검색 결과를 행 순서로 돌려줍니다.
+
+        Args:
+            lat, lng: 기준 위치 (도)
+            radius: 반경 (미터)
+            category: 카테고리 이름
+            types: 상품권 유형 목록
+            query: 검색어
+            page: 페이지 번호 (1부터)
+            size: 페이지 크기
+
+        Returns:
+            dict: {'total', 'page', 'size', 'stores'}
+        """
+        if lat is not None and lng is not None:
+            rows, distances = self.index.query_radius(lat, lng, min(radius, self.MAX_RADIUS))[0]
+        else:
+            rows, distances = np.arange(len(self.dataset)), None
+
+        mask = self._filter_rows(rows, category, types, query)
+        rows = rows[mask]
+        if distances is not None:
+            distances = distances[mask]
+
+        size = max(1, min(size, self.MAX_PAGE_SIZE))
+        page = max(1, page)
+        start = (page - 1) * size
+
+        stores = []
+        for i in range(start, min(start + size, len(rows))):
+            store = self.dataset.get_store(rows[i])
+            if distances is not None:
+                store['distance'] = round(float(distances[i]), 1)
+            stores.append(store)
+
+        return {'total': int(len(rows)), 'page': page, 'size': size, 'stores': stores}
+
+
+class ResponseCache:
+    """LRU 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, max_size=1024):
+        """
+        Args:
+            max_size: 최대 항목 수
+        """
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, key):
+        with self.lock:
+            if key in self.items:
+                self.items.move_to_end(key)
+                self.stats['hits'] += 1
+                return self.items[key]
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+
+
+def parse_query(params):
+    """
+    쿼리 문자열 → 검색 조건 (위치는 캐시 키와 같도록 소수점 4자리 ≈ 11m로 반올림)
+
+    Args:
+        params: parse_qs 결과
+
+    Returns:
+        dict: StoreSearch.search 인자
+
+    Raises:
+        ValueError: 잘못된 파라미터
+    """
+    def first(name, default=None):
+        values = params.get(name)
+        return values[0] if values else default
+
+    def coordinate(name, limit):
+        value = first(name)
+        if value is None:
+            return None
+        value = float(value)
+        # inf/nan은 float()를 통과하지만 격자 인덱스 계산에서 OverflowError가 남
+        if not math.isfinite(value) or abs(value) > limit:
+            raise ValueError(f"{name}는 -{limit}~{limit} 사이여야 합니다.")
+        return round(value, 4)
+
+    lat, lng = coordinate('lat', 90), coordinate('lng', 180)
+    if (lat is None) != (lng is None):
+        raise ValueError('lat, lng는 함께 지정해야 합니다.')
+
+    types = [t for t in first('types', '').split(',') if t]
+    unknown = [t for t in types if t not in TYPE_BITS]
+    if unknown:
+        raise ValueError(f"알 수 없는 상품권 유형: {', '.join(unknown)}")
+
+    return {
+        'lat': lat,
+        'lng': lng,
+        'radius': int(first('radius', StoreSearch.DEFAULT_RADIUS)),
+        'category': first('category'),
+        'types': tuple(sorted(types)),
+        'query': first('q'),
+        'page': int(first('page', 1)),
+        'size': int(first('size', 50))
+    }
+
+
+class StoreRequestHandler(BaseHTTPRequestHandler):
+    """검색 API 요청 처리"""
+
+    search = None
+    cache = None
+
+    def _send(self, status, body, cache_status=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if cache_status:
+            self.send_header('X-Cache', cache_status)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, data):
+        self._send(status, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    def do_GET(self):
+        # 처리 중 예외가 나도 연결을 끊지 않고 500 응답
+        try:
+            self._handle_get()
+        except Exception:
+            logger.exception(f"요청 처리 실패: {self.path}")
+            self._send_json(500, {'error': '서버 오류가 발생했습니다.'})
+
+    def _handle_get(self):
+        url = urlparse(self.path)
+
+        if url.path == '/health':
+            self._send_json(200, {'status': 'ok', 'stores': len(self.search.dataset),
+                                  'lastUpdated': self.search.dataset.last_updated,
+                                  'cache': self.cache.stats})
+            return
+
+        if url.path.startswith('/stores/'):
+            try:
+                store = self.search.dataset.get_by_id(int(url.path[len('/stores/'):]))
+            except ValueError:
+                store = None
+            if store is None:
+                self._send_json(404, {'error': '가맹점을 찾을 수 없습니다.'})
+            else:
+                self._send_json(200, store)
+            return
+
+        if url.path != '/stores':
+            self._send_json(404, {'error': '없는 경로입니다.'})
+            return
+
+        try:
+            query = parse_query(parse_qs(url.query))
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        key = tuple(sorted(query.items()))
+        body = self.cache.get(key)
+        if body is not None:
+            self._send(200, body, 'HIT')
+            return
+
+        body = json.dumps(self.search.search(**query), ensure_ascii=False).encode('utf-8')
+        self.cache.put(key, body)
+        self._send(200, body, 'MISS')
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def create_server(search, host='127.0.0.1', port=8000, cache_size=1024):
+    """
+    검색 API 서버 생성
+
+    Args:
+        search: StoreSearch
+        host: 바인딩 주소
+        port: 포트 (0이면 임의 포트)
+        cache_size: 응답 캐시 크기
+
+    Returns:
+        ThreadingHTTPServer
+    """
+    handler = type('Handler', (StoreRequestHandler,), {
+        'search': search,
+        'cache': ResponseCache(cache_size)
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='가맹점 검색 API 서버')
+    parser.add_argument('--stores', default='data/stores.bin', help='가맹점 데이터 (stores.bin)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--cache-size', type=int, default=1024, help='응답 캐시 크기')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.stores):
+        logger.error(f"{args.stores}이 없습니다.")
+        logger.info("먼저 python scripts/generate_json.py를 실행해주세요.")
+        sys.exit(1)
+
+    server = create_server(StoreSearch.load(args.stores), args.host, args.port, args.cache_size)
+    logger.info(f"검색 API 서버 시작: http://{args.host}:{server.server_port}/stores")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("서버 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()